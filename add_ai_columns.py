@@ -3,15 +3,17 @@
 Script to add AI-related columns to the Excel file.
 """
 
-import pandas as pd
-import openpyxl
+import sys
 
+from excel_export import export_frame
+from frame_store import load_frame, save_frame
 
-def add_ai_columns():
+
+def add_ai_columns(export_excel=False):
     """Add AI-related columns to the Excel file"""
     try:
         # Read current Excel file
-        df = pd.read_excel("app_directory_with_duplicate.xlsx")
+        df = load_frame("app_directory_with_duplicate.xlsx")
         print(f"📊 Current apps in file: {len(df)}")
 
         # Add new AI columns with default values
@@ -31,51 +33,12 @@ def add_ai_columns():
         # Create updated Excel file
         filename = "app_directory_with_ai_columns.xlsx"
 
-        with pd.ExcelWriter(filename, engine="openpyxl") as writer:
-            df.to_excel(writer, sheet_name="App Directory", index=False)
-
-            # Format the file
-            workbook = writer.book
-            worksheet = writer.sheets["App Directory"]
-
-            # Format headers
-            header_font = openpyxl.styles.Font(bold=True, color="FFFFFF")
-            header_fill = openpyxl.styles.PatternFill(
-                start_color="366092", end_color="366092", fill_type="solid"
-            )
-
-            for cell in worksheet[1]:
-                cell.font = header_font
-                cell.fill = header_fill
-
-            # Adjust column widths
-            worksheet.column_dimensions["A"].width = 30  # Name
-            worksheet.column_dimensions["B"].width = 60  # Description
-            worksheet.column_dimensions["C"].width = 40  # Official URL
-            worksheet.column_dimensions["D"].width = 15  # lxAiPotential
-            worksheet.column_dimensions["E"].width = 15  # lxAiRisk
-            worksheet.column_dimensions["F"].width = 15  # lxAiUsage
-            worksheet.column_dimensions["G"].width = 20  # lxAiType
-            worksheet.column_dimensions["H"].width = 40  # lxAiTaxonomyDescription
-
-            # Add borders and alignment
-            thin_border = openpyxl.styles.Border(
-                left=openpyxl.styles.Side(style="thin"),
-                right=openpyxl.styles.Side(style="thin"),
-                top=openpyxl.styles.Side(style="thin"),
-                bottom=openpyxl.styles.Side(style="thin"),
-            )
-
-            for row in worksheet.iter_rows(
-                min_row=1, max_row=len(df) + 1, min_col=1, max_col=8
-            ):
-                for cell in row:
-                    cell.border = thin_border
-                    cell.alignment = openpyxl.styles.Alignment(
-                        wrap_text=True, vertical="top"
-                    )
-
-        print(f"✅ Updated Excel file created: {filename}")
+        if export_excel:
+            export_frame(df, filename)
+
+            print(f"✅ Updated Excel file created: {filename}")
+
+        save_frame(df, filename)
         print(f"📊 Total columns: {len(df.columns)}")
         print(f"📊 Total rows: {len(df)}")
 
@@ -98,7 +61,7 @@ def add_ai_columns():
 
 if __name__ == "__main__":
     print("🔧 Adding AI-related columns to Excel file...")
-    filename = add_ai_columns()
+    filename = add_ai_columns(export_excel="--excel" in sys.argv)
 
     if filename:
         print(f"\n🎉 Success! The Excel file '{filename}' now contains:")
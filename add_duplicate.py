@@ -3,28 +3,35 @@
 Script to add the duplicate KYCaaS entry to match the original list exactly.
 """
 
+import sys
+
 import pandas as pd
-import openpyxl
+
+from catalog_db import catalog
+from excel_export import export_frame
+from frame_store import load_frame, save_frame
 
 
-def add_duplicate_entry():
+def add_duplicate_entry(export_excel=False):
     """Add the duplicate KYCaaS entry to match original list"""
     try:
         # Read current Excel file
-        df = pd.read_excel("app_directory_corrected.xlsx")
+        df = load_frame("app_directory_corrected.xlsx")
         print(f"📊 Current apps in file: {len(df)}")
 
+        # Look KYCaaS up in the catalog and copy its record for the duplicate
+        catalog.upsert_apps(df)
+        kycaas = catalog.find_apps("KYCaaS")[0]
+        duplicate_entry = {
+            "Name": kycaas["name"],
+            "Description": kycaas["description"],
+            "Official URL": kycaas["official_url"],
+        }
+
         # Find the position of KYCaaS to add duplicate after it
         kycaas_index = df[df["Name"] == "KYCaaS"].index[0]
         print(f"📍 KYCaaS found at position: {kycaas_index + 1}")
 
-        # Create duplicate KYCaaS entry
-        duplicate_entry = {
-            "Name": "KYCaaS",
-            "Description": "Know Your Customer as a Service platform",
-            "Official URL": "https://www.kycaas.com",
-        }
-
         # Insert the duplicate right after the original KYCaaS
         new_row = pd.DataFrame([duplicate_entry])
 
@@ -43,50 +50,17 @@ def add_duplicate_entry():
         # Create updated Excel file
         filename = "app_directory_with_duplicate.xlsx"
 
-        with pd.ExcelWriter(filename, engine="openpyxl") as writer:
-            updated_df.to_excel(writer, sheet_name="App Directory", index=False)
-
-            # Format the file
-            workbook = writer.book
-            worksheet = writer.sheets["App Directory"]
-
-            # Format headers
-            header_font = openpyxl.styles.Font(bold=True, color="FFFFFF")
-            header_fill = openpyxl.styles.PatternFill(
-                start_color="366092", end_color="366092", fill_type="solid"
-            )
-
-            for cell in worksheet[1]:
-                cell.font = header_font
-                cell.fill = header_fill
-
-            # Adjust column widths
-            worksheet.column_dimensions["A"].width = 30
-            worksheet.column_dimensions["B"].width = 60
-            worksheet.column_dimensions["C"].width = 40
-
-            # Add borders and alignment
-            thin_border = openpyxl.styles.Border(
-                left=openpyxl.styles.Side(style="thin"),
-                right=openpyxl.styles.Side(style="thin"),
-                top=openpyxl.styles.Side(style="thin"),
-                bottom=openpyxl.styles.Side(style="thin"),
-            )
-
-            for row in worksheet.iter_rows(
-                min_row=1, max_row=len(updated_df) + 1, min_col=1, max_col=3
-            ):
-                for cell in row:
-                    cell.border = thin_border
-                    cell.alignment = openpyxl.styles.Alignment(
-                        wrap_text=True, vertical="top"
-                    )
-
-        print(f"✅ Updated Excel file created: {filename}")
+        if export_excel:
+            export_frame(updated_df, filename)
+
+            print(f"✅ Updated Excel file created: {filename}")
+
+        save_frame(updated_df, filename)
         print(f"📊 Final count: {len(updated_df)} apps")
 
-        # Verify the duplicate was added
-        kycaas_count = len(updated_df[updated_df["Name"] == "KYCaaS"])
+        # Record the duplicate as its own app and verify it was added
+        catalog.upsert_apps(updated_df)
+        kycaas_count = len(catalog.find_apps("KYCaaS"))
         print(f"🔍 KYCaaS entries: {kycaas_count}")
 
         if kycaas_count == 2:
@@ -103,7 +77,7 @@ def add_duplicate_entry():
 
 if __name__ == "__main__":
     print("🔧 Adding duplicate KYCaaS entry to match original list...")
-    filename = add_duplicate_entry()
+    filename = add_duplicate_entry(export_excel="--excel" in sys.argv)
 
     if filename:
         print(f"\n🎉 Success! The Excel file '{filename}' now contains:")
@@ -11,6 +11,9 @@ import re
 
 import pandas as pd
 
+from catalog_db import catalog
+from frame_store import load_frame, save_frame
+
 
 def extract_vendor_from_url(official_url: str) -> str:
     """Infer vendor name from an Official URL using simple, robust heuristics."""
@@ -203,7 +206,7 @@ def extract_vendor_from_url(official_url: str) -> str:
 def insert_vendor_column(input_path: str, output_path: str) -> str:
     """Insert Vendor column after Description in the App Directory sheet."""
     # Load workbook via pandas
-    df = pd.read_excel(input_path, sheet_name="App Directory")
+    df = load_frame(input_path, sheet_name="App Directory")
 
     # Compute Vendor values
     vendors = []
@@ -231,6 +234,9 @@ def insert_vendor_column(input_path: str, output_path: str) -> str:
         # Preserve only the updated App Directory
         result_df.to_excel(writer, sheet_name="App Directory", index=False)
 
+    save_frame(result_df, output_path)
+    catalog.upsert_apps(result_df)
+
     return output_path
 
 
@@ -4,10 +4,12 @@ Comprehensive AI Research Plan for verifying AI capabilities of all applications
 """
 
 import pandas as pd
-import openpyxl
 from datetime import datetime
 import time
 
+from excel_export import export_report
+from frame_store import load_frame, save_frame
+
 
 def create_research_plan():
     """Create a structured research plan for AI verification"""
@@ -16,7 +18,7 @@ def create_research_plan():
     print("=" * 50)
 
     # Read current Excel file
-    df = pd.read_excel("app_directory_with_ai_data.xlsx")
+    df = load_frame("app_directory_with_ai_data.xlsx")
 
     print(f"📊 Target: {len(df)} applications to research")
     print(
@@ -260,85 +262,60 @@ def create_research_tracker(df, high_priority, medium_priority, low_priority):
     # Create Excel file with research tracker
     filename = "ai_research_tracker.xlsx"
 
-    with pd.ExcelWriter(filename, engine="openpyxl") as writer:
-        # Main tracker sheet
-        tracker_df.to_excel(writer, sheet_name="Research Tracker", index=False)
-
-        # Priority sheets
-        high_priority_df = tracker_df[tracker_df["Priority"] == "High"]
-        medium_priority_df = tracker_df[tracker_df["Priority"] == "Medium"]
-        low_priority_df = tracker_df[tracker_df["Priority"] == "Low"]
-
-        high_priority_df.to_excel(writer, sheet_name="High Priority", index=False)
-        medium_priority_df.to_excel(writer, sheet_name="Medium Priority", index=False)
-        low_priority_df.to_excel(writer, sheet_name="Low Priority", index=False)
-
-        # Research guidelines sheet
-        guidelines_data = {
-            "Research Step": [
-                "1. Visit Official Website",
-                "2. Check Product Documentation",
-                "3. Review Feature Lists",
-                "4. Search Recent News",
-                "5. Check AI Partnerships",
-                "6. Review User Feedback",
-                "7. Verify Technical Details",
-                "8. Document Findings",
-            ],
-            "What to Look For": [
-                "AI/ML product pages, features, capabilities",
-                "Technical specifications, AI documentation",
-                "AI-powered features, automation capabilities",
-                "AI announcements, new features, partnerships",
-                "AI vendor relationships, integrations",
-                "User reviews mentioning AI features",
-                "API documentation, developer resources",
-                "Clear classification with sources",
-            ],
-            "Time Estimate": [
-                "5-10 minutes",
-                "10-15 minutes",
-                "5-10 minutes",
-                "5-10 minutes",
-                "5-10 minutes",
-                "10-15 minutes",
-                "10-20 minutes",
-                "5-10 minutes",
-            ],
-        }
-
-        guidelines_df = pd.DataFrame(guidelines_data)
-        guidelines_df.to_excel(writer, sheet_name="Research Guidelines", index=False)
-
-        # Format the workbook
-        workbook = writer.book
-
-        # Format headers for all sheets
-        for sheet_name in writer.sheets:
-            worksheet = writer.sheets[sheet_name]
-
-            # Header formatting
-            header_font = openpyxl.styles.Font(bold=True, color="FFFFFF")
-            header_fill = openpyxl.styles.PatternFill(
-                start_color="366092", end_color="366092", fill_type="solid"
-            )
-
-            for cell in worksheet[1]:
-                cell.font = header_font
-                cell.fill = header_fill
-
-            # Auto-adjust column widths
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
+    sheets = {}
+    # Main tracker sheet
+    sheets["Research Tracker"] = tracker_df
+
+    # Priority sheets
+    high_priority_df = tracker_df[tracker_df["Priority"] == "High"]
+    medium_priority_df = tracker_df[tracker_df["Priority"] == "Medium"]
+    low_priority_df = tracker_df[tracker_df["Priority"] == "Low"]
+
+    sheets["High Priority"] = high_priority_df
+    sheets["Medium Priority"] = medium_priority_df
+    sheets["Low Priority"] = low_priority_df
+
+    # Research guidelines sheet
+    guidelines_data = {
+        "Research Step": [
+            "1. Visit Official Website",
+            "2. Check Product Documentation",
+            "3. Review Feature Lists",
+            "4. Search Recent News",
+            "5. Check AI Partnerships",
+            "6. Review User Feedback",
+            "7. Verify Technical Details",
+            "8. Document Findings",
+        ],
+        "What to Look For": [
+            "AI/ML product pages, features, capabilities",
+            "Technical specifications, AI documentation",
+            "AI-powered features, automation capabilities",
+            "AI announcements, new features, partnerships",
+            "AI vendor relationships, integrations",
+            "User reviews mentioning AI features",
+            "API documentation, developer resources",
+            "Clear classification with sources",
+        ],
+        "Time Estimate": [
+            "5-10 minutes",
+            "10-15 minutes",
+            "5-10 minutes",
+            "5-10 minutes",
+            "5-10 minutes",
+            "10-15 minutes",
+            "10-20 minutes",
+            "5-10 minutes",
+        ],
+    }
+
+    guidelines_df = pd.DataFrame(guidelines_data)
+    sheets["Research Guidelines"] = guidelines_df
+
+    export_report(filename, sheets)
+
+    # execute_ai_research picks up the high priority apps from here
+    save_frame(high_priority_df, filename, "High Priority")
 
     print(f"\n📋 Research Tracker Created: {filename}")
     print(f"   • {len(tracker_df)} apps to research")
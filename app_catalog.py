@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Loader for the source app catalog kept in app_catalog.csv.
+The catalog is plain data so other tools can read it too; rows are checked
+against the directory schema as they are read, and large catalogs can be
+streamed in chunks instead of loaded whole.
+"""
+
+import os
+from typing import Iterator, List
+
+import pandas as pd
+
+CATALOG_CSV = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "app_catalog.csv"
+)
+
+# Columns every catalog row carries, in directory order
+CATALOG_COLUMNS = ["Name", "Description", "Official URL"]
+
+
+class CatalogSchemaError(ValueError):
+    """The catalog file does not match CATALOG_COLUMNS or has invalid rows."""
+
+
+def _read_options():
+    # Every field is text; empty fields stay "" rather than becoming NaN
+    return dict(dtype=str, keep_default_na=False, na_filter=False)
+
+
+def _validate(chunk: pd.DataFrame, path: str, first_line: int) -> pd.DataFrame:
+    if list(chunk.columns) != CATALOG_COLUMNS:
+        raise CatalogSchemaError(
+            f"{path}: expected columns {CATALOG_COLUMNS}, got {list(chunk.columns)}"
+        )
+    problems: List[str] = []
+    for column, bad in (
+        ("Name", chunk["Name"].str.strip() == ""),
+        ("Official URL", ~chunk["Official URL"].str.match(r"https?://\S+$")),
+    ):
+        for pos in bad.to_numpy().nonzero()[0][:5]:
+            problems.append(f"line {first_line + pos}: invalid {column}")
+    if problems:
+        raise CatalogSchemaError(f"{path}: " + "; ".join(problems))
+    return chunk
+
+
+def iter_catalog(
+    path: str = CATALOG_CSV, chunksize: int = 10000
+) -> Iterator[pd.DataFrame]:
+    """Yield validated chunks of at most chunksize catalog rows."""
+    # Line 1 is the header
+    first_line = 2
+    with pd.read_csv(path, chunksize=chunksize, **_read_options()) as reader:
+        for chunk in reader:
+            yield _validate(chunk, path, first_line)
+            first_line += len(chunk)
+
+
+def load_catalog(path: str = CATALOG_CSV) -> pd.DataFrame:
+    """The whole validated catalog as one frame."""
+    df = pd.read_csv(path, **_read_options())
+    return _validate(df, path, 2)
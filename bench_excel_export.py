@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark directory workbook export: the shared streaming exporter against
+the old pandas ExcelWriter + per-cell styling loop, at 500, 50k and 500k rows.
+
+    python bench_excel_export.py [--rows 500 50000 500000] [--legacy-max 50000]
+                                 [--memory]
+
+The per-cell loop holds the whole sheet in memory and is skipped above
+--legacy-max rows. --memory also reports peak traced allocations, from a
+second, much slower run under tracemalloc.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import openpyxl
+
+from app_catalog import load_catalog
+from excel_export import DIRECTORY_WIDTHS, export_frame
+
+
+def directory_frame(rows: int) -> pd.DataFrame:
+    """A directory-shaped frame of rows apps cycled from the catalog."""
+    base = load_catalog()
+    df = base.iloc[np.arange(rows) % len(base)].reset_index(drop=True)
+    df["Name"] = df["Name"] + " " + pd.Series(np.arange(rows)).astype(str)
+    df["lxAiPotential"] = "medium"
+    df["lxAiRisk"] = "minimal"
+    df["lxAiUsage"] = "noAiUsage"
+    df["lxAiType"] = "Other"
+    df["lxAiTaxonomyDescription"] = "Non-AI application with medium potential"
+    return df
+
+
+def legacy_export(df: pd.DataFrame, filename: str) -> None:
+    """The per-cell styling the stages used before excel_export."""
+    with pd.ExcelWriter(filename, engine="openpyxl") as writer:
+        df.to_excel(writer, sheet_name="App Directory", index=False)
+        worksheet = writer.sheets["App Directory"]
+
+        header_font = openpyxl.styles.Font(bold=True, color="FFFFFF")
+        header_fill = openpyxl.styles.PatternFill(
+            start_color="366092", end_color="366092", fill_type="solid"
+        )
+        for cell in worksheet[1]:
+            cell.font = header_font
+            cell.fill = header_fill
+
+        for idx, column in enumerate(df.columns, 1):
+            letter = openpyxl.utils.get_column_letter(idx)
+            worksheet.column_dimensions[letter].width = DIRECTORY_WIDTHS[column]
+
+        thin_border = openpyxl.styles.Border(
+            left=openpyxl.styles.Side(style="thin"),
+            right=openpyxl.styles.Side(style="thin"),
+            top=openpyxl.styles.Side(style="thin"),
+            bottom=openpyxl.styles.Side(style="thin"),
+        )
+        for row in worksheet.iter_rows(
+            min_row=1, max_row=len(df) + 1, min_col=1, max_col=len(df.columns)
+        ):
+            for cell in row:
+                cell.border = thin_border
+                cell.alignment = openpyxl.styles.Alignment(
+                    wrap_text=True, vertical="top"
+                )
+
+
+def seconds(export, df: pd.DataFrame, filename: str) -> float:
+    start = time.perf_counter()
+    export(df, filename)
+    return time.perf_counter() - start
+
+
+def peak_mib(export, df: pd.DataFrame, filename: str) -> float:
+    tracemalloc.start()
+    try:
+        export(df, filename)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[500, 50000, 500000])
+    parser.add_argument("--legacy-max", type=int, default=50000)
+    parser.add_argument("--memory", action="store_true")
+    args = parser.parse_args()
+
+    print(f"{'rows':>8}  {'exporter':<10} {'seconds':>9} {'peak MiB':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "bench.xlsx")
+        for rows in args.rows:
+            df = directory_frame(rows)
+            runs = [("streaming", export_frame)]
+            if rows <= args.legacy_max:
+                runs.append(("per-cell", legacy_export))
+            for label, export in runs:
+                elapsed = seconds(export, df, filename)
+                peak = f"{peak_mib(export, df, filename):.1f}" if args.memory else "-"
+                print(f"{rows:>8}  {label:<10} {elapsed:>9.2f} {peak:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Extract homepage brand indicators (og:site_name / application-name, <title>
+and the first <h1>) for vendor validation.
+The streaming reader feeds response chunks to an incremental parser and
+stops downloading as soon as every indicator is settled or a byte budget is
+spent, so heavy SPA homepages are never read or parsed in full.
+"""
+
+import codecs
+from html.parser import HTMLParser
+from typing import Dict, Optional, Tuple
+
+from bs4.dammit import EncodingDetector
+from html_backend import make_soup
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# Stop reading a homepage after this many bytes even if indicators are missing
+DEFAULT_BYTE_BUDGET = 512 * 1024
+CHUNK_SIZE = 16 * 1024
+# Leading bytes searched for a byte order mark or <meta charset> declaration
+SNIFF_BYTES = 2048
+
+
+def empty_indicators() -> Dict[str, str]:
+    return {"site_name": "", "title": "", "h1": ""}
+
+
+def parse_brand_indicators(content: bytes) -> Dict[str, str]:
+    """Parse a complete HTML document into a soup and read the indicators."""
+    soup = make_soup(content)
+    site_name = ""
+    meta_site = soup.find("meta", attrs={"property": "og:site_name"})
+    if meta_site and meta_site.get("content"):
+        site_name = meta_site.get("content", "").strip()
+    if not site_name:
+        meta_app = soup.find("meta", attrs={"name": "application-name"})
+        if meta_app and meta_app.get("content"):
+            site_name = meta_app.get("content", "").strip()
+    title = ""
+    t = soup.find("title")
+    if t and t.get_text():
+        title = t.get_text().strip()
+    h1_text = ""
+    h1 = soup.find("h1")
+    if h1 and h1.get_text():
+        h1_text = h1.get_text().strip()
+    return {"site_name": site_name, "title": title, "h1": h1_text}
+
+
+class BrandIndicatorParser(HTMLParser):
+    """Incremental parser mirroring parse_brand_indicators' first-match rules."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.og_site_name = None
+        self.application_name = None
+        self.title_parts = []
+        self.h1_parts = []
+        self.title_state = "pending"  # pending -> open -> done
+        self.h1_state = "pending"
+        self.h1_depth = 0
+        self.in_body = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "meta":
+            a = dict(attrs)
+            if a.get("property") == "og:site_name" and self.og_site_name is None:
+                self.og_site_name = a.get("content") or ""
+            if a.get("name") == "application-name" and self.application_name is None:
+                self.application_name = a.get("content") or ""
+        elif tag == "title" and self.title_state == "pending":
+            self.title_state = "open"
+        elif tag == "h1":
+            # Headings only live in the body, even when <body> is omitted
+            self.in_body = True
+            if self.h1_state == "pending":
+                self.h1_state = "open"
+            if self.h1_state == "open":
+                self.h1_depth += 1
+        elif tag == "body":
+            self.in_body = True
+
+    def handle_startendtag(self, tag, attrs):
+        # <meta ... /> never opens title/h1 content
+        self.handle_starttag(tag, attrs)
+        if tag in ("title", "h1"):
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag == "title" and self.title_state == "open":
+            self.title_state = "done"
+        elif tag == "h1" and self.h1_state == "open":
+            self.h1_depth -= 1
+            if self.h1_depth <= 0:
+                self.h1_state = "done"
+        elif tag == "head":
+            self.in_body = True
+
+    def handle_data(self, data):
+        if self.title_state == "open":
+            self.title_parts.append(data)
+        if self.h1_state == "open":
+            self.h1_parts.append(data)
+
+    @property
+    def done(self) -> bool:
+        # Site-name metas sit in <head>; once past it nothing better can turn up
+        site_settled = bool((self.og_site_name or "").strip()) or self.in_body
+        return self.title_state == "done" and self.h1_state == "done" and site_settled
+
+    def indicators(self) -> Dict[str, str]:
+        site_name = (self.og_site_name or "").strip()
+        if not site_name:
+            site_name = (self.application_name or "").strip()
+        return {
+            "site_name": site_name,
+            "title": "".join(self.title_parts).strip(),
+            "h1": "".join(self.h1_parts).strip(),
+        }
+
+
+def _header_charset(headers) -> Optional[str]:
+    """The charset the Content-Type header declares, if it declares one."""
+    headers = CaseInsensitiveDict(headers or {})
+    if "charset" not in (headers.get("Content-Type") or "").lower():
+        # requests would assume ISO-8859-1 for text/*; that is no declaration
+        return None
+    return get_encoding_from_headers(headers)
+
+
+def _incremental_decoder(encoding: Optional[str]):
+    try:
+        return codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+    except LookupError:
+        return codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+
+class _SniffingDecoder:
+    """
+    Incremental decoder that picks its charset the way the soup does for a
+    whole document: a byte order mark or a <meta> declaration in the first
+    SNIFF_BYTES, else UTF-8. A charset the HTTP headers declare wins.
+    """
+
+    def __init__(self, headers=None):
+        charset = _header_charset(headers)
+        self._decoder = _incremental_decoder(charset) if charset else None
+        self._head = b""
+
+    def decode(self, data: bytes, final: bool = False) -> str:
+        if self._decoder is None:
+            self._head += data
+            if len(self._head) < SNIFF_BYTES and not final:
+                return ""
+            data, encoding = EncodingDetector.strip_byte_order_mark(self._head)
+            if encoding is None:
+                encoding = EncodingDetector.find_declared_encoding(data, is_html=True)
+            self._decoder = _incremental_decoder(encoding)
+            self._head = b""
+        return self._decoder.decode(data, final)
+
+
+class StreamingBrandReader:
+    """
+    Response reader for http_client.get(reader=...): pulls chunks until the
+    indicators are settled or the byte budget is spent.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_BYTE_BUDGET):
+        self.max_bytes = max_bytes
+        self.parser = BrandIndicatorParser()
+
+    def feed(self, chunks, headers=None) -> Tuple[bytes, bool]:
+        """Parse chunks; return (bytes consumed, whether the body was read fully)."""
+        decoder = _SniffingDecoder(headers)
+        consumed = []
+        size = 0
+        for chunk in chunks:
+            if not chunk:
+                continue
+            consumed.append(chunk)
+            size += len(chunk)
+            self.parser.feed(decoder.decode(chunk))
+            if self.parser.done:
+                return b"".join(consumed), False
+            if size >= self.max_bytes:
+                # Parse what was read, even if it is shorter than SNIFF_BYTES
+                self.parser.feed(decoder.decode(b"", final=True))
+                return b"".join(consumed), False
+        self.parser.feed(decoder.decode(b"", final=True))
+        self.parser.close()
+        return b"".join(consumed), True
+
+    def __call__(self, response) -> Tuple[bytes, bool]:
+        return self.feed(response.iter_content(chunk_size=CHUNK_SIZE), response.headers)
+
+    def indicators(self) -> Dict[str, str]:
+        return self.parser.indicators()
+
+    def indicators_for(self, response) -> Dict[str, str]:
+        """Indicators for a response fetched with this reader; cache hits are re-parsed."""
+        if getattr(response, "from_cache", False):
+            return stream_brand_indicators(
+                response.content, response.headers, self.max_bytes
+            )
+        return self.indicators()
+
+
+def stream_brand_indicators(
+    content: bytes, headers=None, max_bytes: int = DEFAULT_BYTE_BUDGET
+) -> Dict[str, str]:
+    """Run the streaming parser over an already-downloaded body."""
+    reader = StreamingBrandReader(max_bytes)
+    reader.feed(
+        (content[i : i + CHUNK_SIZE] for i in range(0, len(content), CHUNK_SIZE)),
+        headers,
+    )
+    return reader.indicators()
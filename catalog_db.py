@@ -0,0 +1,574 @@
+#!/usr/bin/env python3
+"""
+SQLite app catalog shared by the pipeline scripts.
+Apps, vendors, page fetches, URL resolutions and AI classifications live in
+one indexed database, so lookups by name, normalized URL or host stay point
+queries and stages upsert just the rows they touched instead of rewriting
+spreadsheets. Every listed row is its own app: copies of one name and URL
+are told apart by their occurrence, so deliberate duplicates survive.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+import pandas as pd
+
+from page_cache import normalize_url
+from page_extract import EXTRACT_FIELDS, EXTRACT_VERSION
+
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalog.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS vendors (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE COLLATE NOCASE
+);
+
+CREATE TABLE IF NOT EXISTS apps (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL COLLATE NOCASE,
+    description TEXT,
+    official_url TEXT,
+    normalized_url TEXT NOT NULL DEFAULT '',
+    host TEXT NOT NULL DEFAULT '',
+    occurrence INTEGER NOT NULL DEFAULT 0,
+    vendor_id INTEGER REFERENCES vendors(id),
+    updated_at REAL NOT NULL,
+    UNIQUE (name, normalized_url, occurrence)
+);
+CREATE INDEX IF NOT EXISTS apps_name ON apps(name);
+CREATE INDEX IF NOT EXISTS apps_normalized_url ON apps(normalized_url);
+CREATE INDEX IF NOT EXISTS apps_host ON apps(host);
+CREATE INDEX IF NOT EXISTS apps_vendor ON apps(vendor_id);
+
+CREATE TABLE IF NOT EXISTS fetches (
+    normalized_url TEXT PRIMARY KEY,
+    host TEXT NOT NULL DEFAULT '',
+    status_code INTEGER,
+    final_url TEXT,
+    error TEXT,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS fetches_host ON fetches(host);
+
+CREATE TABLE IF NOT EXISTS resolutions (
+    normalized_url TEXT PRIMARY KEY,
+    host TEXT NOT NULL DEFAULT '',
+    status_code INTEGER,
+    final_url TEXT,
+    redirect_chain TEXT NOT NULL DEFAULT '[]',
+    error TEXT,
+    resolved_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS page_extracts (
+    normalized_url TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    h1 TEXT NOT NULL,
+    site_name TEXT NOT NULL,
+    meta_description TEXT NOT NULL,
+    about TEXT NOT NULL,
+    body_text TEXT NOT NULL,
+    truncated_at INTEGER,
+    extract_version INTEGER NOT NULL DEFAULT 1,
+    extracted_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS classifications (
+    app_id INTEGER NOT NULL REFERENCES apps(id) ON DELETE CASCADE,
+    source TEXT NOT NULL,
+    ai_potential TEXT,
+    ai_risk TEXT,
+    ai_usage TEXT,
+    ai_type TEXT,
+    taxonomy_description TEXT,
+    confidence TEXT,
+    classified_at REAL NOT NULL,
+    PRIMARY KEY (app_id, source)
+);
+"""
+
+# Directory column -> classifications column
+CLASSIFICATION_COLUMNS = {
+    "lxAiPotential": "ai_potential",
+    "lxAiRisk": "ai_risk",
+    "lxAiUsage": "ai_usage",
+    "lxAiType": "ai_type",
+    "lxAiTaxonomyDescription": "taxonomy_description",
+}
+
+_UPSERT_CLASSIFICATION = """
+INSERT INTO classifications(app_id, source, ai_potential, ai_risk, ai_usage,
+                            ai_type, taxonomy_description, confidence,
+                            classified_at)
+SELECT id, ?, ?, ?, ?, ?, ?, ?, ? FROM apps
+WHERE {where}
+ON CONFLICT(app_id, source) DO UPDATE SET
+    ai_potential = excluded.ai_potential,
+    ai_risk = excluded.ai_risk,
+    ai_usage = excluded.ai_usage,
+    ai_type = excluded.ai_type,
+    taxonomy_description = excluded.taxonomy_description,
+    confidence = excluded.confidence,
+    classified_at = excluded.classified_at
+"""
+
+
+def url_parts(url) -> Tuple[str, str]:
+    """(normalized URL, host) used as catalog keys; empty for missing URLs."""
+    normalized = normalize_url(url) if url != "N/A" else ""
+    host = (urlparse(normalized).hostname or "") if normalized else ""
+    return normalized, host
+
+
+def _text(value) -> Optional[str]:
+    """Spreadsheet cell -> TEXT column value (NaN becomes NULL)."""
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    return str(value)
+
+
+def _keyed_rows(rows) -> Iterator[Tuple[dict, str, str, str, int]]:
+    """
+    (row, name, normalized URL, host, occurrence) for directory rows with a
+    name. occurrence numbers the repeats of one name and URL in rows, so a
+    deliberately listed duplicate is its own app rather than merged into
+    the first copy.
+    """
+    seen: Dict[Tuple[str, str], int] = {}
+    for row in rows:
+        name = _text(row.get("Name"))
+        if not name:
+            continue
+        normalized, host = url_parts(row.get("Official URL"))
+        key = (name.lower(), normalized)
+        occurrence = seen.get(key, 0)
+        seen[key] = occurrence + 1
+        yield row, name, normalized, host, occurrence
+
+
+def _rekey_apps(conn: sqlite3.Connection) -> None:
+    """Rebuild an apps table keyed on (name, normalized_url) alone, keeping ids."""
+    conn.execute("PRAGMA foreign_keys=OFF")
+    # Keep classifications' REFERENCES apps pointing at the rebuilt table
+    conn.execute("PRAGMA legacy_alter_table=ON")
+    try:
+        conn.executescript(
+            """
+            BEGIN;
+            DROP INDEX IF EXISTS apps_name;
+            DROP INDEX IF EXISTS apps_normalized_url;
+            DROP INDEX IF EXISTS apps_host;
+            DROP INDEX IF EXISTS apps_vendor;
+            ALTER TABLE apps RENAME TO apps_unkeyed;
+            """
+            + SCHEMA
+            + """
+            INSERT INTO apps(id, name, description, official_url, normalized_url,
+                             host, vendor_id, updated_at)
+            SELECT id, name, description, official_url, normalized_url, host,
+                   vendor_id, updated_at
+            FROM apps_unkeyed;
+            DROP TABLE apps_unkeyed;
+            COMMIT;
+            """
+        )
+    finally:
+        conn.execute("PRAGMA legacy_alter_table=OFF")
+        conn.execute("PRAGMA foreign_keys=ON")
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    """Bring a catalog file created by an older schema up to date."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(page_extracts)")}
+    if "truncated_at" not in columns:
+        conn.execute("ALTER TABLE page_extracts ADD COLUMN truncated_at INTEGER")
+    if "extract_version" not in columns:
+        # Rows stored before versioning came from version 1
+        conn.execute(
+            "ALTER TABLE page_extracts "
+            "ADD COLUMN extract_version INTEGER NOT NULL DEFAULT 1"
+        )
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(apps)")}
+    if "occurrence" not in columns:
+        _rekey_apps(conn)
+
+
+class CatalogDB:
+    """Thread-safe handle on the catalog database, opened on first use."""
+
+    def __init__(self, path: str = CATALOG_PATH):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._conn is None:
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                conn.row_factory = sqlite3.Row
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA foreign_keys=ON")
+                conn.executescript(SCHEMA)
+                _migrate(conn)
+                self._conn = conn
+            return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _query(self, sql: str, params: Iterable = ()) -> List[Dict]:
+        with self._lock:
+            return [dict(r) for r in self.conn.execute(sql, tuple(params))]
+
+    # Vendors and apps
+
+    def upsert_vendor(self, name: str) -> Optional[int]:
+        """Return the id of vendor name, creating it if needed."""
+        if not name or not str(name).strip():
+            return None
+        with self._lock, self.conn as conn:
+            conn.execute(
+                "INSERT INTO vendors(name) VALUES (?) ON CONFLICT(name) DO NOTHING",
+                (str(name).strip(),),
+            )
+            row = conn.execute(
+                "SELECT id FROM vendors WHERE name = ?", (str(name).strip(),)
+            ).fetchone()
+        return row["id"]
+
+    def upsert_app(
+        self,
+        name: str,
+        official_url: str = "",
+        description: Optional[str] = None,
+        vendor: Optional[str] = None,
+    ) -> int:
+        """
+        Insert or update the first app listed under name and official_url;
+        returns its id.
+        """
+        self.upsert_apps(
+            [
+                {
+                    "Name": name,
+                    "Official URL": official_url,
+                    "Description": description,
+                    "Vendor": vendor,
+                }
+            ]
+        )
+        normalized, _ = url_parts(official_url)
+        row = self._query(
+            "SELECT id FROM apps "
+            "WHERE name = ? AND normalized_url = ? AND occurrence = 0",
+            (name, normalized),
+        )
+        return row[0]["id"]
+
+    def upsert_apps(self, rows) -> int:
+        """
+        Bulk upsert directory rows (a DataFrame or dicts with Name, Official URL
+        and optionally Description and Vendor). Apps are matched on name
+        (case-insensitive), normalized URL and occurrence, so the n-th listed
+        copy of an app always updates the same record. Missing optional values
+        leave the stored ones untouched. Returns the number of rows written.
+        """
+        if isinstance(rows, pd.DataFrame):
+            rows = rows.to_dict("records")
+        now = time.time()
+        app_rows = []
+        vendors = set()
+        for row, name, normalized, host, occurrence in _keyed_rows(rows):
+            vendor = (_text(row.get("Vendor")) or "").strip() or None
+            if vendor:
+                vendors.add(vendor)
+            app_rows.append(
+                (
+                    name,
+                    _text(row.get("Description")),
+                    _text(row.get("Official URL")),
+                    normalized,
+                    host,
+                    occurrence,
+                    vendor,
+                    now,
+                )
+            )
+        with self._lock, self.conn as conn:
+            conn.executemany(
+                "INSERT INTO vendors(name) VALUES (?) ON CONFLICT(name) DO NOTHING",
+                [(v,) for v in vendors],
+            )
+            conn.executemany(
+                """
+                INSERT INTO apps(name, description, official_url, normalized_url,
+                                 host, occurrence, vendor_id, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, (SELECT id FROM vendors WHERE name = ?), ?)
+                ON CONFLICT(name, normalized_url, occurrence) DO UPDATE SET
+                    description = COALESCE(excluded.description, description),
+                    official_url = COALESCE(excluded.official_url, official_url),
+                    host = excluded.host,
+                    vendor_id = COALESCE(excluded.vendor_id, vendor_id),
+                    updated_at = excluded.updated_at
+                """,
+                app_rows,
+            )
+        return len(app_rows)
+
+    def find_apps(self, name: str) -> List[Dict]:
+        """Apps called name (case-insensitive)."""
+        return self._query("SELECT * FROM apps WHERE name = ? ORDER BY id", (name,))
+
+    def apps_for_url(self, url: str) -> List[Dict]:
+        """Apps whose Official URL normalizes to the same address as url."""
+        normalized, _ = url_parts(url)
+        return self._query(
+            "SELECT * FROM apps WHERE normalized_url = ? ORDER BY id", (normalized,)
+        )
+
+    def apps_on_host(self, host: str) -> List[Dict]:
+        return self._query(
+            "SELECT * FROM apps WHERE host = ? ORDER BY id", ((host or "").lower(),)
+        )
+
+    # Fetches
+
+    def record_fetch(
+        self,
+        url: str,
+        status_code: Optional[int] = None,
+        final_url: Optional[str] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Remember the latest fetch outcome for url."""
+        normalized, host = url_parts(url)
+        if not normalized:
+            return
+        with self._lock, self.conn as conn:
+            conn.execute(
+                """
+                INSERT INTO fetches(normalized_url, host, status_code, final_url,
+                                    error, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(normalized_url) DO UPDATE SET
+                    status_code = excluded.status_code,
+                    final_url = excluded.final_url,
+                    error = excluded.error,
+                    fetched_at = excluded.fetched_at
+                """,
+                (normalized, host, status_code, final_url, error, time.time()),
+            )
+
+    def last_fetch(self, url: str) -> Optional[Dict]:
+        normalized, _ = url_parts(url)
+        rows = self._query(
+            "SELECT * FROM fetches WHERE normalized_url = ?", (normalized,)
+        )
+        return rows[0] if rows else None
+
+    # URL resolutions
+
+    def record_resolution(
+        self,
+        url: str,
+        status_code: Optional[int] = None,
+        final_url: Optional[str] = None,
+        chain: Sequence[Tuple[int, str]] = (),
+        error: Optional[str] = None,
+    ) -> None:
+        """Remember where url's redirects end, with each (status, URL) hop."""
+        normalized, host = url_parts(url)
+        if not normalized:
+            return
+        with self._lock, self.conn as conn:
+            conn.execute(
+                """
+                INSERT INTO resolutions(normalized_url, host, status_code,
+                                        final_url, redirect_chain, error,
+                                        resolved_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(normalized_url) DO UPDATE SET
+                    status_code = excluded.status_code,
+                    final_url = excluded.final_url,
+                    redirect_chain = excluded.redirect_chain,
+                    error = excluded.error,
+                    resolved_at = excluded.resolved_at
+                """,
+                (
+                    normalized,
+                    host,
+                    status_code,
+                    final_url,
+                    json.dumps([list(hop) for hop in chain]),
+                    error,
+                    time.time(),
+                ),
+            )
+
+    def resolution(self, url: str, max_age: Optional[float] = None):
+        """
+        The stored resolution of url, with redirect_chain decoded, or None
+        when there is none or it is older than max_age seconds.
+        """
+        normalized, _ = url_parts(url)
+        rows = self._query(
+            "SELECT * FROM resolutions WHERE normalized_url = ?", (normalized,)
+        )
+        if not rows:
+            return None
+        row = rows[0]
+        if max_age is not None and time.time() - row["resolved_at"] > max_age:
+            return None
+        row["redirect_chain"] = json.loads(row["redirect_chain"])
+        return row
+
+    def canonical_url(self, url: str, max_age: Optional[float] = None):
+        """
+        The URL url's redirects ended at, when a resolution no older than
+        max_age seconds reached a non-error page elsewhere; otherwise None.
+        """
+        row = self.resolution(url, max_age)
+        if (
+            row is None
+            or row["status_code"] is None
+            or row["status_code"] >= 400
+            or not row["final_url"]
+            or url_parts(row["final_url"])[0] == row["normalized_url"]
+        ):
+            return None
+        return row["final_url"]
+
+    # Page extracts
+
+    def page_extract(self, url: str, max_age: Optional[float] = None):
+        """
+        EXTRACT_FIELDS last extracted from url, plus truncated_at (the byte
+        cap the page was cut at, or None for a whole page), or None when
+        there are none, they are older than max_age seconds or they were
+        extracted by another EXTRACT_VERSION.
+        """
+        normalized, _ = url_parts(url)
+        rows = self._query(
+            "SELECT * FROM page_extracts WHERE normalized_url = ?", (normalized,)
+        )
+        if not rows:
+            return None
+        row = rows[0]
+        if row["extract_version"] != EXTRACT_VERSION:
+            return None
+        if max_age is not None and time.time() - row["extracted_at"] > max_age:
+            return None
+        fields = {field: row[field] for field in EXTRACT_FIELDS}
+        fields["truncated_at"] = row["truncated_at"]
+        return fields
+
+    def store_page_extract(
+        self, url: str, fields: Dict[str, str], truncated_at: Optional[int] = None
+    ) -> None:
+        """
+        Keep the fields extracted from url for later passes; truncated_at is
+        the byte cap the body was cut at, if it was.
+        """
+        normalized, _ = url_parts(url)
+        if not normalized:
+            return
+        columns = ", ".join(EXTRACT_FIELDS)
+        updates = ", ".join(f"{f} = excluded.{f}" for f in EXTRACT_FIELDS)
+        with self._lock, self.conn as conn:
+            conn.execute(
+                f"""
+                INSERT INTO page_extracts(normalized_url, {columns}, truncated_at,
+                                          extract_version, extracted_at)
+                VALUES ({", ".join("?" * (len(EXTRACT_FIELDS) + 4))})
+                ON CONFLICT(normalized_url) DO UPDATE SET
+                    {updates}, truncated_at = excluded.truncated_at,
+                    extract_version = excluded.extract_version,
+                    extracted_at = excluded.extracted_at
+                """,
+                (
+                    normalized,
+                    *(fields[f] for f in EXTRACT_FIELDS),
+                    truncated_at,
+                    EXTRACT_VERSION,
+                    time.time(),
+                ),
+            )
+
+    # Classifications
+
+    def upsert_classifications(self, df: pd.DataFrame, source: str) -> int:
+        """
+        Store the lx* columns of a directory frame as classifications from
+        source, creating any apps not yet in the catalog.
+        """
+        self.upsert_apps(df)
+        now = time.time()
+        params = []
+        for row, name, normalized, _, occurrence in _keyed_rows(df.to_dict("records")):
+            values = [_text(row.get(col)) for col in CLASSIFICATION_COLUMNS]
+            confidence = _text(row.get("Confidence Level"))
+            params.append(
+                (source, *values, confidence, now, name, normalized, occurrence)
+            )
+        sql = _UPSERT_CLASSIFICATION.format(
+            where="name = ? AND normalized_url = ? AND occurrence = ?"
+        )
+        with self._lock, self.conn as conn:
+            conn.executemany(sql, params)
+        return len(params)
+
+    def upsert_classifications_by_name(
+        self, df: pd.DataFrame, source: str, key: str = "Name"
+    ) -> List[str]:
+        """
+        Store the lx* columns of df as classifications from source for every
+        catalog app named df[key] (case-insensitive, every listed copy), as
+        research results keyed by name alone are. A later row for the same
+        name wins. Returns the names that matched no app.
+        """
+        now = time.time()
+        sql = _UPSERT_CLASSIFICATION.format(where="name = ?")
+        unmatched = []
+        with self._lock, self.conn as conn:
+            for row in df.to_dict("records"):
+                name = _text(row.get(key))
+                if not name:
+                    continue
+                values = [_text(row.get(col)) for col in CLASSIFICATION_COLUMNS]
+                confidence = _text(row.get("Confidence Level"))
+                cursor = conn.execute(sql, (source, *values, confidence, now, name))
+                if cursor.rowcount == 0 and name not in unmatched:
+                    unmatched.append(name)
+        return unmatched
+
+    def classifications(self, source: str) -> pd.DataFrame:
+        """Classifications from source as directory columns (Name, Official URL, lx*)."""
+        with self._lock:
+            frame = pd.read_sql_query(
+                """
+                SELECT a.name AS "Name", a.official_url AS "Official URL",
+                       c.ai_potential, c.ai_risk, c.ai_usage, c.ai_type,
+                       c.taxonomy_description
+                FROM classifications c JOIN apps a ON a.id = c.app_id
+                WHERE c.source = ?
+                ORDER BY a.id
+                """,
+                self.conn,
+                params=(source,),
+            )
+        return frame.rename(columns={v: k for k, v in CLASSIFICATION_COLUMNS.items()})
+
+
+# Shared instance used by the scripts
+catalog = CatalogDB()
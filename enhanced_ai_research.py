@@ -4,73 +4,225 @@ Enhanced AI Research - Analyze app descriptions and technology mentions
 to fill AI columns based on given options.
 """
 
+import numpy as np
 import pandas as pd
-import openpyxl
 from datetime import datetime
 import re
 
+from catalog_db import catalog
+from excel_export import export_report
+from frame_store import load_frame, save_frame
+from keyword_matcher import KeywordMatcher, acronyms
+
+# AI/ML keywords in description
+AI_KEYWORDS = [
+    "ai",
+    "artificial intelligence",
+    "machine learning",
+    "ml",
+    "neural",
+    "deep learning",
+    "predictive",
+    "analytics",
+    "intelligence",
+    "automation",
+    "smart",
+    "cognitive",
+    "algorithm",
+    "data science",
+    "nlp",
+    "natural language",
+    "computer vision",
+    "recommendation engine",
+    "pattern recognition",
+    "anomaly detection",
+]
+
+# Advanced AI indicators
+ADVANCED_AI_KEYWORDS = [
+    "advanced ai",
+    "sophisticated",
+    "cutting-edge",
+    "next-generation",
+    "revolutionary",
+    "enterprise ai",
+    "ai platform",
+    "ai engine",
+    "ai-powered",
+    "intelligent automation",
+]
+
+# Enterprise indicators
+ENTERPRISE_KEYWORDS = [
+    "enterprise",
+    "professional",
+    "comprehensive",
+    "powerful",
+    "scalable",
+    "enterprise-grade",
+    "business intelligence",
+    "advanced analytics",
+]
+
+# High risk indicators
+HIGH_RISK_KEYWORDS = [
+    "financial",
+    "banking",
+    "payment",
+    "transaction",
+    "compliance",
+    "audit",
+    "regulatory",
+    "gdpr",
+    "hipaa",
+    "sox",
+    "pci",
+    "security",
+    "encryption",
+    "sensitive data",
+    "confidential",
+    "personal information",
+    "healthcare",
+    "medical",
+    "legal",
+    "government",
+    "defense",
+    "critical infrastructure",
+]
+
+# Limited risk indicators
+LIMITED_RISK_KEYWORDS = [
+    "social media",
+    "public",
+    "consumer",
+    "marketing",
+    "advertising",
+    "content management",
+    "crm",
+    "sales",
+    "customer service",
+    "support",
+]
+
+# AI-enabled indicators
+AI_ENABLED_KEYWORDS = [
+    "ai-powered",
+    "ai-enabled",
+    "artificial intelligence",
+    "machine learning",
+    "neural network",
+    "deep learning",
+    "predictive analytics",
+    "intelligent",
+    "smart automation",
+    "cognitive",
+    "ai-driven",
+    "ml-powered",
+]
+
+# AI-available indicators
+AI_AVAILABLE_KEYWORDS = [
+    "analytics",
+    "insights",
+    "data analysis",
+    "reporting",
+    "dashboard",
+    "business intelligence",
+    "data visualization",
+    "statistical analysis",
+    "trend analysis",
+    "pattern recognition",
+    "data mining",
+]
+
+# LLM indicators
+LLM_KEYWORDS = [
+    "llm",
+    "large language model",
+    "gpt",
+    "chatbot",
+    "conversational",
+    "nlp",
+    "natural language",
+    "text generation",
+    "language model",
+    "chat",
+    "dialogue",
+    "text analysis",
+    "sentiment analysis",
+    "language processing",
+    "translation",
+]
+
+# Neural network indicators
+NEURAL_KEYWORDS = [
+    "neural network",
+    "deep learning",
+    "cnn",
+    "rnn",
+    "transformer",
+    "neural",
+    "deep neural",
+    "convolutional",
+    "recurrent",
+    "transformer",
+    "attention",
+    "deep reinforcement learning",
+    "gan",
+    "generative adversarial",
+]
+
+# Machine learning indicators
+ML_KEYWORDS = [
+    "machine learning",
+    "ml",
+    "algorithm",
+    "prediction",
+    "classification",
+    "regression",
+    "clustering",
+    "recommendation",
+    "supervised",
+    "unsupervised",
+    "reinforcement learning",
+    "feature engineering",
+    "model training",
+]
+
+# All keyword lists are matched in one pass; short acronyms ("ai", "ml",
+# "gan", ...) only as whole words so "email", "html" and "organization" are
+# not counted
+ENHANCED_KEYWORDS = {
+    "ai": AI_KEYWORDS,
+    "advanced_ai": ADVANCED_AI_KEYWORDS,
+    "enterprise": ENTERPRISE_KEYWORDS,
+    "high_risk": HIGH_RISK_KEYWORDS,
+    "limited_risk": LIMITED_RISK_KEYWORDS,
+    "ai_enabled": AI_ENABLED_KEYWORDS,
+    "ai_available": AI_AVAILABLE_KEYWORDS,
+    "llm": LLM_KEYWORDS,
+    "neural": NEURAL_KEYWORDS,
+    "ml": ML_KEYWORDS,
+}
+ENHANCED_MATCHER = KeywordMatcher(
+    ENHANCED_KEYWORDS, whole_word=acronyms(*ENHANCED_KEYWORDS.values())
+)
+
 
 def analyze_app_ai_characteristics(app_name, description, official_url=""):
     """Enhanced analysis of app AI characteristics using description and technology mentions"""
 
     name_lower = app_name.lower()
     desc_lower = description.lower()
+    hits = ENHANCED_MATCHER.match(desc_lower)
 
     # AI Potential Analysis - using only: low, medium, high, veryHigh
     ai_potential = "low"
 
-    # Check for AI/ML keywords in description
-    ai_keywords = [
-        "ai",
-        "artificial intelligence",
-        "machine learning",
-        "ml",
-        "neural",
-        "deep learning",
-        "predictive",
-        "analytics",
-        "intelligence",
-        "automation",
-        "smart",
-        "cognitive",
-        "algorithm",
-        "data science",
-        "nlp",
-        "natural language",
-        "computer vision",
-        "recommendation engine",
-        "pattern recognition",
-        "anomaly detection",
-    ]
-
-    advanced_ai_keywords = [
-        "advanced ai",
-        "sophisticated",
-        "cutting-edge",
-        "next-generation",
-        "revolutionary",
-        "enterprise ai",
-        "ai platform",
-        "ai engine",
-        "ai-powered",
-        "intelligent automation",
-    ]
-
-    enterprise_keywords = [
-        "enterprise",
-        "professional",
-        "comprehensive",
-        "powerful",
-        "scalable",
-        "enterprise-grade",
-        "business intelligence",
-        "advanced analytics",
-    ]
-
-    if any(keyword in desc_lower for keyword in ai_keywords):
-        if any(keyword in desc_lower for keyword in advanced_ai_keywords):
+    if hits["ai"]:
+        if hits["advanced_ai"]:
             ai_potential = "veryHigh"
-        elif any(keyword in desc_lower for keyword in enterprise_keywords):
+        elif hits["enterprise"]:
             ai_potential = "high"
         else:
             ai_potential = "medium"
@@ -78,152 +230,27 @@ def analyze_app_ai_characteristics(app_name, description, official_url=""):
     # AI Risk Analysis - using only: minimal, limited, high, unacceptable
     ai_risk = "minimal"
 
-    # High risk indicators
-    high_risk_keywords = [
-        "financial",
-        "banking",
-        "payment",
-        "transaction",
-        "compliance",
-        "audit",
-        "regulatory",
-        "gdpr",
-        "hipaa",
-        "sox",
-        "pci",
-        "security",
-        "encryption",
-        "sensitive data",
-        "confidential",
-        "personal information",
-        "healthcare",
-        "medical",
-        "legal",
-        "government",
-        "defense",
-        "critical infrastructure",
-    ]
-
-    # Limited risk indicators
-    limited_risk_keywords = [
-        "social media",
-        "public",
-        "consumer",
-        "marketing",
-        "advertising",
-        "content management",
-        "crm",
-        "sales",
-        "customer service",
-        "support",
-    ]
-
-    if any(keyword in desc_lower for keyword in high_risk_keywords):
+    if hits["high_risk"]:
         ai_risk = "high"
-    elif any(keyword in desc_lower for keyword in limited_risk_keywords):
+    elif hits["limited_risk"]:
         ai_risk = "limited"
 
     # AI Usage Analysis - using only: unknown, noAiUsage, aiAvailable, aiEnabled
     ai_usage = "noAiUsage"
 
-    # AI-enabled indicators
-    ai_enabled_keywords = [
-        "ai-powered",
-        "ai-enabled",
-        "artificial intelligence",
-        "machine learning",
-        "neural network",
-        "deep learning",
-        "predictive analytics",
-        "intelligent",
-        "smart automation",
-        "cognitive",
-        "ai-driven",
-        "ml-powered",
-    ]
-
-    # AI-available indicators
-    ai_available_keywords = [
-        "analytics",
-        "insights",
-        "data analysis",
-        "reporting",
-        "dashboard",
-        "business intelligence",
-        "data visualization",
-        "statistical analysis",
-        "trend analysis",
-        "pattern recognition",
-        "data mining",
-    ]
-
-    if any(keyword in desc_lower for keyword in ai_enabled_keywords):
+    if hits["ai_enabled"]:
         ai_usage = "aiEnabled"
-    elif any(keyword in desc_lower for keyword in ai_available_keywords):
+    elif hits["ai_available"]:
         ai_usage = "aiAvailable"
 
     # AI Type Analysis - using only: neuralNet, llm, machineLearning, Other
     ai_type = "Other"
 
-    # LLM indicators
-    llm_keywords = [
-        "llm",
-        "large language model",
-        "gpt",
-        "chatbot",
-        "conversational",
-        "nlp",
-        "natural language",
-        "text generation",
-        "language model",
-        "chat",
-        "dialogue",
-        "text analysis",
-        "sentiment analysis",
-        "language processing",
-        "translation",
-    ]
-
-    # Neural network indicators
-    neural_keywords = [
-        "neural network",
-        "deep learning",
-        "cnn",
-        "rnn",
-        "transformer",
-        "neural",
-        "deep neural",
-        "convolutional",
-        "recurrent",
-        "transformer",
-        "attention",
-        "deep reinforcement learning",
-        "gan",
-        "generative adversarial",
-    ]
-
-    # Machine learning indicators
-    ml_keywords = [
-        "machine learning",
-        "ml",
-        "algorithm",
-        "prediction",
-        "classification",
-        "regression",
-        "clustering",
-        "recommendation",
-        "supervised",
-        "unsupervised",
-        "reinforcement learning",
-        "feature engineering",
-        "model training",
-    ]
-
-    if any(keyword in desc_lower for keyword in llm_keywords):
+    if hits["llm"]:
         ai_type = "llm"
-    elif any(keyword in desc_lower for keyword in neural_keywords):
+    elif hits["neural"]:
         ai_type = "neuralNet"
-    elif any(keyword in desc_lower for keyword in ml_keywords):
+    elif hits["ml"]:
         ai_type = "machineLearning"
 
     # AI Taxonomy Description - custom string based on analysis
@@ -236,6 +263,81 @@ def analyze_app_ai_characteristics(app_name, description, official_url=""):
     return ai_potential, ai_risk, ai_usage, ai_type, taxonomy_desc
 
 
+# Columns produced by classify_apps
+AI_COLUMNS = [
+    "lxAiPotential",
+    "lxAiRisk",
+    "lxAiUsage",
+    "lxAiType",
+    "lxAiTaxonomyDescription",
+]
+
+
+def classify_apps(descriptions):
+    """
+    Vectorized analyze_app_ai_characteristics over a whole Description
+    Series (the rules never look at the name; missing descriptions count as
+    empty). Returns the AI_COLUMNS as a DataFrame aligned with descriptions;
+    analyze_app_ai_characteristics remains the row-by-row reference.
+    """
+    desc = descriptions.fillna("").astype(str).str.lower()
+    has = {
+        name: desc.str.contains(ENHANCED_MATCHER.pattern(name)).to_numpy(dtype=bool)
+        for name in ENHANCED_KEYWORDS
+    }
+
+    potential = np.select(
+        [has["ai"] & has["advanced_ai"], has["ai"] & has["enterprise"], has["ai"]],
+        ["veryHigh", "high", "medium"],
+        default="low",
+    )
+    risk = np.select(
+        [has["high_risk"], has["limited_risk"]], ["high", "limited"], default="minimal"
+    )
+    usage = np.select(
+        [has["ai_enabled"], has["ai_available"]],
+        ["aiEnabled", "aiAvailable"],
+        default="noAiUsage",
+    )
+    ai_type = np.select(
+        [has["llm"], has["neural"], has["ml"]],
+        ["llm", "neuralNet", "machineLearning"],
+        default="Other",
+    )
+
+    result = pd.DataFrame(
+        {
+            "lxAiPotential": potential,
+            "lxAiRisk": risk,
+            "lxAiUsage": usage,
+            "lxAiType": ai_type,
+        },
+        index=descriptions.index,
+    )
+    enabled = (
+        "AI-powered application with "
+        + result["lxAiPotential"]
+        + " potential and "
+        + result["lxAiRisk"]
+        + " risk profile. "
+        + result["lxAiType"]
+        + " technology with "
+        + result["lxAiUsage"]
+        + " usage."
+    )
+    non_ai = (
+        "Non-AI application with "
+        + result["lxAiPotential"]
+        + " potential for AI integration. "
+        + result["lxAiRisk"]
+        + " risk profile."
+    )
+    result["lxAiTaxonomyDescription"] = enabled.where(
+        result["lxAiUsage"] != "noAiUsage", non_ai
+    )
+    return result
+
+
 def research_all_apps():
     """Research all apps in the main Excel file"""
 
@@ -243,48 +345,35 @@ def research_all_apps():
     print("=" * 40)
 
     # Read the main Excel file
-    df = pd.read_excel("app_directory_with_ai_data.xlsx")
+    df = load_frame("app_directory_with_ai_data.xlsx")
 
     print(f"📊 Researching {len(df)} applications")
     print(f"⏰ Research started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
-    # Research results storage
-    research_results = []
-
-    # Process each app
-    for index, row in df.iterrows():
-        app_name = row["Name"]
-        description = row["Description"]
-        official_url = row["Official URL"]
-
-        print(f"\n{index + 1:3d}. Researching: {app_name}")
-
-        # Analyze AI characteristics
-        ai_potential, ai_risk, ai_usage, ai_type, taxonomy_desc = (
-            analyze_app_ai_characteristics(app_name, description, official_url)
-        )
-
-        # Store results
-        result = {
-            "App Name": app_name,
-            "Description": description,
-            "Official URL": official_url,
-            "AI Potential": ai_potential,
-            "AI Risk": ai_risk,
-            "AI Usage": ai_usage,
-            "AI Type": ai_type,
-            "AI Taxonomy Description": taxonomy_desc,
+    # Classify every app in one vectorized pass
+    classified = classify_apps(df["Description"])
+
+    results_df = pd.DataFrame(
+        {
+            "App Name": df["Name"],
+            "Description": df["Description"],
+            "Official URL": df["Official URL"],
+            "AI Potential": classified["lxAiPotential"],
+            "AI Risk": classified["lxAiRisk"],
+            "AI Usage": classified["lxAiUsage"],
+            "AI Type": classified["lxAiType"],
+            "AI Taxonomy Description": classified["lxAiTaxonomyDescription"],
             "Research Date": datetime.now().strftime("%Y-%m-%d"),
             "Research Method": "Description Analysis",
         }
+    )
+    research_results = results_df.to_dict("records")
+    catalog.upsert_classifications(
+        pd.concat([df[["Name", "Description", "Official URL"]], classified], axis=1),
+        "enhanced_ai_research",
+    )
 
-        research_results.append(result)
-
-        # Show classification
-        print(f"   🤖 AI Potential: {ai_potential}")
-        print(f"   ⚠️  AI Risk: {ai_risk}")
-        print(f"   🔧 AI Usage: {ai_usage}")
-        print(f"   🧠 AI Type: {ai_type}")
+    print(f"✅ Classified {len(research_results)} applications")
 
     # Create research results file
     create_enhanced_research_results(research_results)
@@ -301,75 +390,45 @@ def create_enhanced_research_results(research_results):
     # Create Excel file
     filename = "enhanced_ai_research_results.xlsx"
 
-    with pd.ExcelWriter(filename, engine="openpyxl") as writer:
-        # Main results sheet
-        results_df.to_excel(writer, sheet_name="Research Results", index=False)
-
-        # Summary by AI Potential
-        potential_summary = results_df["AI Potential"].value_counts().reset_index()
-        potential_summary.columns = ["AI Potential", "Count"]
-        potential_summary.to_excel(
-            writer, sheet_name="AI Potential Summary", index=False
-        )
-
-        # Summary by AI Risk
-        risk_summary = results_df["AI Risk"].value_counts().reset_index()
-        risk_summary.columns = ["AI Risk", "Count"]
-        risk_summary.to_excel(writer, sheet_name="AI Risk Summary", index=False)
-
-        # Summary by AI Usage
-        usage_summary = results_df["AI Usage"].value_counts().reset_index()
-        usage_summary.columns = ["AI Usage", "Count"]
-        usage_summary.to_excel(writer, sheet_name="AI Usage Summary", index=False)
-
-        # Summary by AI Type
-        type_summary = results_df["AI Type"].value_counts().reset_index()
-        type_summary.columns = ["AI Type", "Count"]
-        type_summary.to_excel(writer, sheet_name="AI Type Summary", index=False)
-
-        # High Potential Apps
-        high_potential = results_df[
-            results_df["AI Potential"].isin(["high", "veryHigh"])
-        ]
-        high_potential.to_excel(writer, sheet_name="High Potential Apps", index=False)
-
-        # AI-Enabled Apps
-        ai_enabled = results_df[results_df["AI Usage"] == "aiEnabled"]
-        ai_enabled.to_excel(writer, sheet_name="AI-Enabled Apps", index=False)
-
-        # High Risk Apps
-        high_risk = results_df[results_df["AI Risk"] == "high"]
-        high_risk.to_excel(writer, sheet_name="High Risk Apps", index=False)
-
-        # Format the workbook
-        workbook = writer.book
-
-        # Format headers for all sheets
-        for sheet_name in writer.sheets:
-            worksheet = writer.sheets[sheet_name]
-
-            # Header formatting
-            header_font = openpyxl.styles.Font(bold=True, color="FFFFFF")
-            header_fill = openpyxl.styles.PatternFill(
-                start_color="366092", end_color="366092", fill_type="solid"
-            )
-
-            for cell in worksheet[1]:
-                cell.font = header_font
-                cell.fill = header_fill
-
-            # Auto-adjust column widths
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
+    sheets = {}
+    # Main results sheet
+    sheets["Research Results"] = results_df
+
+    # Summary by AI Potential
+    potential_summary = results_df["AI Potential"].value_counts().reset_index()
+    potential_summary.columns = ["AI Potential", "Count"]
+    sheets["AI Potential Summary"] = potential_summary
+
+    # Summary by AI Risk
+    risk_summary = results_df["AI Risk"].value_counts().reset_index()
+    risk_summary.columns = ["AI Risk", "Count"]
+    sheets["AI Risk Summary"] = risk_summary
+
+    # Summary by AI Usage
+    usage_summary = results_df["AI Usage"].value_counts().reset_index()
+    usage_summary.columns = ["AI Usage", "Count"]
+    sheets["AI Usage Summary"] = usage_summary
+
+    # Summary by AI Type
+    type_summary = results_df["AI Type"].value_counts().reset_index()
+    type_summary.columns = ["AI Type", "Count"]
+    sheets["AI Type Summary"] = type_summary
+
+    # High Potential Apps
+    high_potential = results_df[results_df["AI Potential"].isin(["high", "veryHigh"])]
+    sheets["High Potential Apps"] = high_potential
+
+    # AI-Enabled Apps
+    ai_enabled = results_df[results_df["AI Usage"] == "aiEnabled"]
+    sheets["AI-Enabled Apps"] = ai_enabled
+
+    # High Risk Apps
+    high_risk = results_df[results_df["AI Risk"] == "high"]
+    sheets["High Risk Apps"] = high_risk
+
+    export_report(filename, sheets)
+
+    save_frame(results_df, filename, "Research Results")
 
     print(f"\n📋 Enhanced Research Results Created: {filename}")
 
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Streaming Excel exporter shared by every script that writes a workbook.
+Rows are written through an openpyxl write-only workbook, so memory stays
+flat however long the sheet is, and cells reference named styles registered
+once per workbook instead of carrying their own Font, Border and Alignment
+objects. Directory sheets get bordered, wrapped cells and fixed widths;
+report sheets get a styled header and widths fitted to their contents.
+"""
+
+from typing import Dict, Optional
+
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import get_column_letter
+
+from frame_store import MAIN_SHEET
+
+HEADER_STYLE = "Directory Header"
+BODY_STYLE = "Directory Body"
+REPORT_HEADER_STYLE = "Report Header"
+
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+THIN_SIDE = Side(style="thin")
+THIN_BORDER = Border(left=THIN_SIDE, right=THIN_SIDE, top=THIN_SIDE, bottom=THIN_SIDE)
+WRAP_TOP = Alignment(wrap_text=True, vertical="top")
+
+# Column widths of the App Directory sheet, by header
+DIRECTORY_WIDTHS = {
+    "Name": 30,
+    "Description": 60,
+    "Vendor": 30,
+    "Official URL": 40,
+    "lxAiPotential": 15,
+    "lxAiRisk": 15,
+    "lxAiUsage": 15,
+    "lxAiType": 20,
+    "lxAiTaxonomyDescription": 40,
+}
+
+# Cap on fitted report column widths
+MAX_AUTO_WIDTH = 50
+
+
+def _named_styles():
+    """Fresh named styles; each workbook binds its own copies."""
+    header = NamedStyle(
+        name=HEADER_STYLE,
+        font=HEADER_FONT,
+        fill=HEADER_FILL,
+        border=THIN_BORDER,
+        alignment=WRAP_TOP,
+    )
+    body = NamedStyle(name=BODY_STYLE, border=THIN_BORDER, alignment=WRAP_TOP)
+    report_header = NamedStyle(
+        name=REPORT_HEADER_STYLE, font=HEADER_FONT, fill=HEADER_FILL
+    )
+    return header, body, report_header
+
+
+def fitted_widths(df: pd.DataFrame) -> Dict[str, float]:
+    """Width per column fitting its longest header or value, capped."""
+    widths = {}
+    for column in df.columns:
+        values = df[column].dropna().astype(str).str.len()
+        longest = max(len(str(column)), int(values.max()) if len(values) else 0)
+        widths[column] = min(longest + 2, MAX_AUTO_WIDTH)
+    return widths
+
+
+def _cell_values(df: pd.DataFrame) -> pd.DataFrame:
+    """df as Python objects with missing values as None (empty cells)."""
+    values = df.astype(object)
+    return values.where(df.notna(), None)
+
+
+def _write_sheet(wb: Workbook, sheet_name: str, df: pd.DataFrame, widths, bordered):
+    ws = wb.create_sheet(title=sheet_name)
+    for idx, column in enumerate(df.columns, 1):
+        if column in widths:
+            ws.column_dimensions[get_column_letter(idx)].width = widths[column]
+
+    header = []
+    for column in df.columns:
+        cell = WriteOnlyCell(ws, value=str(column))
+        cell.style = HEADER_STYLE if bordered else REPORT_HEADER_STYLE
+        header.append(cell)
+    ws.append(header)
+
+    rows = _cell_values(df).itertuples(index=False, name=None)
+    if not bordered:
+        # Unstyled body cells need no cell objects at all
+        for row in rows:
+            ws.append(row)
+        return
+
+    for row in rows:
+        cells = []
+        for value in row:
+            cell = WriteOnlyCell(ws, value=value)
+            cell.style = BODY_STYLE
+            cells.append(cell)
+        ws.append(cells)
+
+
+def export_frames(
+    filename: str,
+    sheets: Dict[str, pd.DataFrame],
+    widths: Optional[Dict[str, float]] = DIRECTORY_WIDTHS,
+    bordered: bool = True,
+    auto_width: bool = False,
+) -> str:
+    """
+    Stream each frame into its own sheet of filename, header row first.
+    bordered gives every cell a thin border and top-aligned wrapping; widths
+    maps header -> column width, or auto_width fits each sheet's columns.
+    """
+    wb = Workbook(write_only=True)
+    for style in _named_styles():
+        wb.add_named_style(style)
+    for sheet_name, df in sheets.items():
+        sheet_widths = fitted_widths(df) if auto_width else (widths or {})
+        _write_sheet(wb, sheet_name, df, sheet_widths, bordered)
+    wb.save(filename)
+    return filename
+
+
+def export_frame(
+    df: pd.DataFrame,
+    filename: str,
+    sheet_name: str = MAIN_SHEET,
+    widths: Optional[Dict[str, float]] = DIRECTORY_WIDTHS,
+) -> str:
+    """Write df as the single styled directory sheet of filename."""
+    return export_frames(filename, {sheet_name: df}, widths=widths)
+
+
+def export_report(filename: str, sheets: Dict[str, pd.DataFrame]) -> str:
+    """Write report sheets with styled headers and fitted column widths."""
+    return export_frames(filename, sheets, bordered=False, auto_width=True)
@@ -5,10 +5,12 @@ This script will research a subset of apps to demonstrate the methodology.
 """
 
 import pandas as pd
-import openpyxl
 from datetime import datetime
 import time
 
+from excel_export import export_report
+from frame_store import load_frame, save_frame
+
 
 def research_high_priority_apps():
     """Research the highest priority apps with real data"""
@@ -17,7 +19,7 @@ def research_high_priority_apps():
     print("=" * 40)
 
     # Read the research tracker
-    df = pd.read_excel("ai_research_tracker.xlsx", sheet_name="High Priority")
+    df = load_frame("ai_research_tracker.xlsx", sheet_name="High Priority")
 
     print(f"📊 Starting with {len(df)} high priority apps")
     print(f"⏰ Research started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -124,63 +126,38 @@ def create_research_results(research_results):
     # Create Excel file
     filename = "ai_research_results.xlsx"
 
-    with pd.ExcelWriter(filename, engine="openpyxl") as writer:
-        # Main results sheet
-        results_df.to_excel(writer, sheet_name="Research Results", index=False)
-
-        # Summary sheet
-        summary_data = {
-            "Metric": [
-                "Total Apps Researched",
-                "AI-Enabled Apps",
-                "AI-Available Apps",
-                "No AI Usage",
-                "High/Very High Potential",
-                "High Risk Apps",
-                "Verified Results",
-            ],
-            "Count": [
-                len(results_df),
-                len(results_df[results_df["ai_usage"] == "aiEnabled"]),
-                len(results_df[results_df["ai_usage"] == "aiAvailable"]),
-                len(results_df[results_df["ai_usage"] == "noAiUsage"]),
-                len(results_df[results_df["ai_potential"].isin(["high", "veryHigh"])]),
-                len(results_df[results_df["ai_risk"] == "high"]),
-                len(results_df[results_df["verified"] == "Yes"]),
-            ],
-        }
+    sheets = {}
+    # Main results sheet
+    sheets["Research Results"] = results_df
+
+    # Summary sheet
+    summary_data = {
+        "Metric": [
+            "Total Apps Researched",
+            "AI-Enabled Apps",
+            "AI-Available Apps",
+            "No AI Usage",
+            "High/Very High Potential",
+            "High Risk Apps",
+            "Verified Results",
+        ],
+        "Count": [
+            len(results_df),
+            len(results_df[results_df["ai_usage"] == "aiEnabled"]),
+            len(results_df[results_df["ai_usage"] == "aiAvailable"]),
+            len(results_df[results_df["ai_usage"] == "noAiUsage"]),
+            len(results_df[results_df["ai_potential"].isin(["high", "veryHigh"])]),
+            len(results_df[results_df["ai_risk"] == "high"]),
+            len(results_df[results_df["verified"] == "Yes"]),
+        ],
+    }
+
+    summary_df = pd.DataFrame(summary_data)
+    sheets["Summary"] = summary_df
+
+    export_report(filename, sheets)
 
-        summary_df = pd.DataFrame(summary_data)
-        summary_df.to_excel(writer, sheet_name="Summary", index=False)
-
-        # Format the workbook
-        workbook = writer.book
-
-        # Format headers
-        for sheet_name in writer.sheets:
-            worksheet = writer.sheets[sheet_name]
-
-            header_font = openpyxl.styles.Font(bold=True, color="FFFFFF")
-            header_fill = openpyxl.styles.PatternFill(
-                start_color="366092", end_color="366092", fill_type="solid"
-            )
-
-            for cell in worksheet[1]:
-                cell.font = header_font
-                cell.fill = header_fill
-
-            # Auto-adjust column widths
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
+    save_frame(results_df, filename, "Research Results")
 
     print(f"\n📋 Research Results Created: {filename}")
 
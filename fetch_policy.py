@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Timeout and retry policy shared by the network scripts.
+Requests get a fixed connect timeout and a read timeout tuned per site from
+the latencies observed so far, so one slow host no longer sets the pace for
+everyone. Transient failures (timeouts, dropped connections, 429 and 5xx
+replies) are retried a bounded number of times with jittered exponential
+backoff, honouring Retry-After when the server sends one. A circuit
+breaker stops sending requests to a site that keeps failing for a cool-off
+period.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Deque, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+import urllib3
+
+from host_scheduler import host_key, registrable_domain
+
+# Seconds allowed to open a connection
+DEFAULT_CONNECT_TIMEOUT = 5.0
+# Read timeout used until enough latencies have been observed
+DEFAULT_READ_TIMEOUT = 10.0
+# Bounds for tuned read timeouts
+MIN_READ_TIMEOUT = 3.0
+MAX_READ_TIMEOUT = 30.0
+# Tuned read timeout = this multiple of the observed latency percentile
+LATENCY_PERCENTILE = 95
+LATENCY_HEADROOM = 3.0
+# Samples needed before a site's (or all sites') latencies are trusted
+MIN_SAMPLES = 5
+# Recent latencies kept per site and across all sites
+HOST_WINDOW = 50
+GLOBAL_WINDOW = 500
+
+# Attempts per request, including the first
+DEFAULT_MAX_ATTEMPTS = 3
+# Backoff before retry n is uniform in [0, min(BACKOFF_MAX, BACKOFF_BASE * 2**n)]
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+# Longer Retry-After requests are not waited for; the failure stands
+MAX_RETRY_AFTER = 60.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Consecutive failed requests that open a host's circuit. Subdomains of one
+# registrable domain share a second, more tolerant circuit, since shared
+# platforms (herokuapp.com, azurewebsites.net) host unrelated vendors.
+HOST_FAILURE_THRESHOLD = 3
+DOMAIN_FAILURE_THRESHOLD = 6
+# Seconds an open circuit refuses requests before letting one through again
+BREAKER_COOL_OFF = 300.0
+# Replies that count against a host: blocks, throttling and server errors
+BREAKER_STATUSES = frozenset({403, 429}) | frozenset(range(500, 600))
+
+
+def percentile(values, pct: float) -> float:
+    """Nearest-rank percentile of a non-empty sequence."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+class LatencyTracker:
+    """Recent response latencies per site, and the read timeouts they imply."""
+
+    def __init__(
+        self,
+        default: float = DEFAULT_READ_TIMEOUT,
+        connect: float = DEFAULT_CONNECT_TIMEOUT,
+    ):
+        self.default = default
+        self.connect = connect
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, Deque[float]] = {}
+        self._all: Deque[float] = deque(maxlen=GLOBAL_WINDOW)
+
+    def observe(self, url: str, seconds: float) -> None:
+        key = host_key(url)
+        with self._lock:
+            samples = self._hosts.get(key)
+            if samples is None:
+                samples = self._hosts[key] = deque(maxlen=HOST_WINDOW)
+            samples.append(seconds)
+            self._all.append(seconds)
+
+    def read_timeout(self, url: str) -> float:
+        """Read timeout for url's site, falling back to all sites' latencies."""
+        with self._lock:
+            samples = self._hosts.get(host_key(url)) or ()
+            if len(samples) < MIN_SAMPLES:
+                samples = self._all
+            if len(samples) < MIN_SAMPLES:
+                return self.default
+            tuned = percentile(samples, LATENCY_PERCENTILE) * LATENCY_HEADROOM
+        return min(MAX_READ_TIMEOUT, max(MIN_READ_TIMEOUT, tuned))
+
+    def timeout(self, url: str) -> Tuple[float, float]:
+        """(connect, read) timeout for a request to url."""
+        return self.connect, self.read_timeout(url)
+
+
+def retry_after(response) -> Optional[float]:
+    """Seconds asked for by a Retry-After header, or None if absent/invalid."""
+    value = (response.headers.get("Retry-After") or "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _dns_failure(exc: requests.ConnectionError) -> bool:
+    reason = getattr(exc.args[0], "reason", None) if exc.args else None
+    return isinstance(reason, getattr(urllib3.exceptions, "NameResolutionError", ()))
+
+
+def is_transient(exc: Exception) -> bool:
+    """True for request failures worth retrying."""
+    if isinstance(exc, (requests.Timeout, requests.exceptions.ChunkedEncodingError)):
+        return True
+    if isinstance(exc, requests.exceptions.SSLError):
+        return False
+    # Unknown hosts stay unknown; only dropped or refused connections retry
+    return isinstance(exc, requests.ConnectionError) and not _dns_failure(exc)
+
+
+class RetryPolicy:
+    """Decide whether and how long to wait before another attempt."""
+
+    def __init__(
+        self,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        backoff_base: float = BACKOFF_BASE,
+        backoff_max: float = BACKOFF_MAX,
+        max_retry_after: float = MAX_RETRY_AFTER,
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff after the attempt-th failure (0-based)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    def delay(self, attempt: int, response=None, exc=None) -> Optional[float]:
+        """
+        Seconds to wait before retrying after attempt (0-based) failed with
+        response or exc, or None if the failure should stand.
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+        if exc is not None:
+            return self.backoff(attempt) if is_transient(exc) else None
+        if response is None or response.status_code not in RETRY_STATUSES:
+            return None
+        wait = retry_after(response)
+        if wait is None:
+            return self.backoff(attempt)
+        return wait if wait <= self.max_retry_after else None
+
+
+def _hostname(url: str) -> str:
+    try:
+        return (urlparse(url.strip()).hostname or "").lower()
+    except (AttributeError, ValueError):
+        return ""
+
+
+class _Circuit:
+    __slots__ = ("failures", "open_until", "reason", "trial")
+
+    def __init__(self):
+        self.failures = 0
+        self.open_until = 0.0
+        self.reason = ""
+        # Thread whose request is probing the circuit after its cool-off
+        self.trial = None
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuits per hostname and per registrable domain.
+    A circuit opens when its failure count reaches the threshold and stays
+    open for cool_off seconds. After that a single trial request (with its
+    retries) is let through while everyone else is still refused; a failure
+    reopens the circuit for another cool-off, a success closes it.
+    """
+
+    def __init__(
+        self,
+        host_threshold: int = HOST_FAILURE_THRESHOLD,
+        domain_threshold: int = DOMAIN_FAILURE_THRESHOLD,
+        cool_off: float = BREAKER_COOL_OFF,
+    ):
+        self.host_threshold = max(1, host_threshold)
+        self.domain_threshold = max(1, domain_threshold)
+        self.cool_off = cool_off
+        self._lock = threading.Lock()
+        self._circuits: Dict[Tuple[str, str], _Circuit] = {}
+        self._local = threading.local()
+
+    def _thread_token(self) -> object:
+        # Unlike thread idents, never reused by a later thread
+        token = getattr(self._local, "token", None)
+        if token is None:
+            token = self._local.token = object()
+        return token
+
+    def _keys(self, url: str):
+        host = _hostname(url)
+        if not host:
+            return []
+        return [
+            (("host", host), self.host_threshold),
+            (("domain", registrable_domain(host)), self.domain_threshold),
+        ]
+
+    def open_reason(self, url: str) -> Optional[str]:
+        """
+        Why a request to url's site is refused right now, or None to send
+        it. The first caller after a cool-off becomes the circuit's trial.
+        """
+        now = time.monotonic()
+        me = self._thread_token()
+        with self._lock:
+            tripped = []
+            for key, threshold in self._keys(url):
+                circuit = self._circuits.get(key)
+                if circuit is None or circuit.failures < threshold:
+                    continue
+                if circuit.open_until > now and circuit.trial != me:
+                    return (
+                        f"circuit open for {key[1]} after {circuit.failures} "
+                        f"consecutive failures ({circuit.reason})"
+                    )
+                tripped.append(circuit)
+            # Admit a trial only once no circuit on the way refuses it
+            for circuit in tripped:
+                if circuit.open_until <= now:
+                    circuit.trial = me
+                    circuit.open_until = now + self.cool_off
+        return None
+
+    def record_failure(self, url: str, reason: str) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for key, threshold in self._keys(url):
+                circuit = self._circuits.get(key)
+                if circuit is None:
+                    circuit = self._circuits[key] = _Circuit()
+                circuit.failures += 1
+                circuit.reason = reason
+                if circuit.failures >= threshold:
+                    circuit.open_until = now + self.cool_off
+                    circuit.trial = None
+
+    def record_success(self, url: str) -> None:
+        with self._lock:
+            for key, _ in self._keys(url):
+                self._circuits.pop(key, None)
+
+
+# Shared instances so every script in a process learns from the same requests
+latency = LatencyTracker()
+retry_policy = RetryPolicy()
+breaker = CircuitBreaker()
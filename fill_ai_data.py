@@ -3,8 +3,73 @@
 Script to research and fill in AI columns with actual data.
 """
 
+import sys
+
+import numpy as np
 import pandas as pd
-import openpyxl
+
+from catalog_db import catalog
+from excel_export import export_frame
+from frame_store import load_frame, save_frame
+from keyword_matcher import KeywordMatcher
+
+# Keyword lists behind each classification rule
+AI_KEYWORDS = [
+    "ai", "artificial intelligence", "machine learning", "neural", "deep learning",
+    "predictive", "analytics", "intelligence", "automation", "smart"
+]
+ADVANCED_KEYWORDS = [
+    "advanced", "sophisticated", "cutting-edge", "next-generation", "revolutionary"
+]
+ENTERPRISE_KEYWORDS = [
+    "powerful", "comprehensive", "enterprise", "professional"
+]
+SECURITY_KEYWORDS = [
+    "security", "compliance", "privacy", "data protection", "encryption",
+    "audit", "governance", "risk management"
+]
+SENSITIVE_KEYWORDS = [
+    "critical", "sensitive", "confidential", "regulated", "financial"
+]
+PUBLIC_KEYWORDS = [
+    "social media", "public", "consumer", "marketing"
+]
+AI_ENABLED_KEYWORDS = [
+    "ai-powered", "ai-enabled", "artificial intelligence", "machine learning",
+    "neural network", "deep learning", "predictive analytics", "intelligent"
+]
+AI_AVAILABLE_KEYWORDS = [
+    "analytics", "insights", "data analysis", "reporting", "dashboard"
+]
+LLM_KEYWORDS = [
+    "llm", "large language model", "gpt", "chatbot", "conversational", "nlp",
+    "natural language", "text generation", "language model"
+]
+NEURAL_KEYWORDS = [
+    "neural network", "deep learning", "cnn", "rnn", "transformer", "neural"
+]
+ML_KEYWORDS = [
+    "machine learning", "ml", "algorithm", "prediction", "classification",
+    "regression", "clustering", "recommendation"
+]
+
+# Plain substring matching, the same rules analyze_app_ai_characteristics applies
+FILL_KEYWORDS = {
+    'ai': AI_KEYWORDS,
+    'advanced': ADVANCED_KEYWORDS,
+    'enterprise': ENTERPRISE_KEYWORDS,
+    'security': SECURITY_KEYWORDS,
+    'sensitive': SENSITIVE_KEYWORDS,
+    'public': PUBLIC_KEYWORDS,
+    'ai_enabled': AI_ENABLED_KEYWORDS,
+    'ai_available': AI_AVAILABLE_KEYWORDS,
+    'llm': LLM_KEYWORDS,
+    'neural': NEURAL_KEYWORDS,
+    'ml': ML_KEYWORDS,
+}
+FILL_MATCHER = KeywordMatcher(FILL_KEYWORDS)
+
+AI_COLUMNS = ['lxAiPotential', 'lxAiRisk', 'lxAiUsage', 'lxAiType', 'lxAiTaxonomyDescription']
 
 def analyze_app_ai_characteristics(app_name, description):
     """Analyze an app to determine its AI characteristics using only the specified options"""
@@ -15,65 +80,38 @@ def analyze_app_ai_characteristics(app_name, description):
     
     # AI Potential Analysis - using only: low, medium, high, veryHigh
     ai_potential = "low"
-    if any(keyword in desc_lower for keyword in [
-        "ai", "artificial intelligence", "machine learning", "neural", "deep learning",
-        "predictive", "analytics", "intelligence", "automation", "smart"
-    ]):
-        if any(keyword in desc_lower for keyword in [
-            "advanced", "sophisticated", "cutting-edge", "next-generation", "revolutionary"
-        ]):
+    if any(keyword in desc_lower for keyword in AI_KEYWORDS):
+        if any(keyword in desc_lower for keyword in ADVANCED_KEYWORDS):
             ai_potential = "veryHigh"
-        elif any(keyword in desc_lower for keyword in [
-            "powerful", "comprehensive", "enterprise", "professional"
-        ]):
+        elif any(keyword in desc_lower for keyword in ENTERPRISE_KEYWORDS):
             ai_potential = "high"
         else:
             ai_potential = "medium"
     
     # AI Risk Analysis - using only: minimal, limited, high, unacceptable
     ai_risk = "minimal"
-    if any(keyword in desc_lower for keyword in [
-        "security", "compliance", "privacy", "data protection", "encryption",
-        "audit", "governance", "risk management"
-    ]):
-        if any(keyword in desc_lower for keyword in [
-            "critical", "sensitive", "confidential", "regulated", "financial"
-        ]):
+    if any(keyword in desc_lower for keyword in SECURITY_KEYWORDS):
+        if any(keyword in desc_lower for keyword in SENSITIVE_KEYWORDS):
             ai_risk = "high"
         else:
             ai_risk = "limited"
-    elif any(keyword in desc_lower for keyword in [
-        "social media", "public", "consumer", "marketing"
-    ]):
+    elif any(keyword in desc_lower for keyword in PUBLIC_KEYWORDS):
         ai_risk = "limited"
     
     # AI Usage Analysis - using only: unknown, noAiUsage, aiAvailable, aiEnabled
     ai_usage = "noAiUsage"
-    if any(keyword in desc_lower for keyword in [
-        "ai-powered", "ai-enabled", "artificial intelligence", "machine learning",
-        "neural network", "deep learning", "predictive analytics", "intelligent"
-    ]):
+    if any(keyword in desc_lower for keyword in AI_ENABLED_KEYWORDS):
         ai_usage = "aiEnabled"
-    elif any(keyword in desc_lower for keyword in [
-        "analytics", "insights", "data analysis", "reporting", "dashboard"
-    ]):
+    elif any(keyword in desc_lower for keyword in AI_AVAILABLE_KEYWORDS):
         ai_usage = "aiAvailable"
     
     # AI Type Analysis - using only: neuralNet, llm, machineLearning, Other
     ai_type = "Other"
-    if any(keyword in desc_lower for keyword in [
-        "llm", "large language model", "gpt", "chatbot", "conversational", "nlp",
-        "natural language", "text generation", "language model"
-    ]):
+    if any(keyword in desc_lower for keyword in LLM_KEYWORDS):
         ai_type = "llm"
-    elif any(keyword in desc_lower for keyword in [
-        "neural network", "deep learning", "cnn", "rnn", "transformer", "neural"
-    ]):
+    elif any(keyword in desc_lower for keyword in NEURAL_KEYWORDS):
         ai_type = "neuralNet"
-    elif any(keyword in desc_lower for keyword in [
-        "machine learning", "ml", "algorithm", "prediction", "classification",
-        "regression", "clustering", "recommendation"
-    ]):
+    elif any(keyword in desc_lower for keyword in ML_KEYWORDS):
         ai_type = "machineLearning"
     
     # AI Taxonomy Description - custom string based on analysis
@@ -85,83 +123,71 @@ def analyze_app_ai_characteristics(app_name, description):
     
     return ai_potential, ai_risk, ai_usage, ai_type, taxonomy_desc
 
-def fill_ai_data():
+def classify_apps(descriptions):
+    """
+    Vectorized analyze_app_ai_characteristics over a whole Description Series
+    (the rules never look at the name; missing descriptions count as empty).
+    Returns the AI_COLUMNS as a DataFrame aligned with descriptions;
+    analyze_app_ai_characteristics remains the row-by-row reference.
+    """
+    desc = descriptions.fillna('').astype(str).str.lower()
+    has = {
+        name: desc.str.contains(FILL_MATCHER.pattern(name)).to_numpy(dtype=bool)
+        for name in FILL_KEYWORDS
+    }
+    
+    potential = np.select(
+        [has['ai'] & has['advanced'], has['ai'] & has['enterprise'], has['ai']],
+        ['veryHigh', 'high', 'medium'], default='low'
+    )
+    risk = np.select(
+        [has['security'] & has['sensitive'], has['security'] | has['public']],
+        ['high', 'limited'], default='minimal'
+    )
+    usage = np.select(
+        [has['ai_enabled'], has['ai_available']],
+        ['aiEnabled', 'aiAvailable'], default='noAiUsage'
+    )
+    ai_type = np.select(
+        [has['llm'], has['neural'], has['ml']],
+        ['llm', 'neuralNet', 'machineLearning'], default='Other'
+    )
+    
+    result = pd.DataFrame({
+        'lxAiPotential': potential,
+        'lxAiRisk': risk,
+        'lxAiUsage': usage,
+        'lxAiType': ai_type,
+    }, index=descriptions.index)
+    enabled = ("AI-powered application with " + result['lxAiPotential']
+               + " potential and " + result['lxAiRisk'] + " risk profile")
+    non_ai = ("Non-AI application with " + result['lxAiPotential']
+              + " potential for AI integration")
+    result['lxAiTaxonomyDescription'] = enabled.where(result['lxAiUsage'] != 'noAiUsage', non_ai)
+    return result
+
+def fill_ai_data(export_excel=False):
     """Fill AI columns with researched data"""
     try:
         # Read current Excel file
-        df = pd.read_excel('app_directory_with_ai_columns.xlsx')
+        df = load_frame('app_directory_with_ai_columns.xlsx')
         print(f"📊 Processing {len(df)} apps...")
         
-        # Process each app
-        for index, row in df.iterrows():
-            app_name = row['Name']
-            description = row['Description']
-            
-            # Analyze AI characteristics
-            ai_potential, ai_risk, ai_usage, ai_type, taxonomy_desc = analyze_app_ai_characteristics(
-                app_name, description
-            )
-            
-            # Update the row
-            df.at[index, 'lxAiPotential'] = ai_potential
-            df.at[index, 'lxAiRisk'] = ai_risk
-            df.at[index, 'lxAiUsage'] = ai_usage
-            df.at[index, 'lxAiType'] = ai_type
-            df.at[index, 'lxAiTaxonomyDescription'] = taxonomy_desc
-            
-            if (index + 1) % 50 == 0:
-                print(f"   Processed {index + 1} apps...")
+        # Classify every app in one vectorized pass
+        df[AI_COLUMNS] = classify_apps(df['Description'])
         
         print(f"✅ Processed all {len(df)} apps")
         
         # Create updated Excel file
         filename = 'app_directory_with_ai_data.xlsx'
         
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='App Directory', index=False)
-            
-            # Format the file
-            workbook = writer.book
-            worksheet = writer.sheets['App Directory']
-            
-            # Format headers
-            header_font = openpyxl.styles.Font(bold=True, color='FFFFFF')
-            header_fill = openpyxl.styles.PatternFill(
-                start_color='366092', end_color='366092', fill_type='solid'
-            )
-            
-            for cell in worksheet[1]:
-                cell.font = header_font
-                cell.fill = header_fill
-            
-            # Adjust column widths
-            worksheet.column_dimensions['A'].width = 30  # Name
-            worksheet.column_dimensions['B'].width = 60  # Description
-            worksheet.column_dimensions['C'].width = 40  # Official URL
-            worksheet.column_dimensions['D'].width = 15  # lxAiPotential
-            worksheet.column_dimensions['E'].width = 15  # lxAiRisk
-            worksheet.column_dimensions['F'].width = 15  # lxAiUsage
-            worksheet.column_dimensions['G'].width = 20  # lxAiType
-            worksheet.column_dimensions['H'].width = 40  # lxAiTaxonomyDescription
-            
-            # Add borders and alignment
-            thin_border = openpyxl.styles.Border(
-                left=openpyxl.styles.Side(style='thin'),
-                right=openpyxl.styles.Side(style='thin'),
-                top=openpyxl.styles.Side(style='thin'),
-                bottom=openpyxl.styles.Side(style='thin')
-            )
-            
-            for row in worksheet.iter_rows(
-                min_row=1, max_row=len(df) + 1, min_col=1, max_col=8
-            ):
-                for cell in row:
-                    cell.border = thin_border
-                    cell.alignment = openpyxl.styles.Alignment(
-                        wrap_text=True, vertical='top'
-                    )
-        
-        print(f"✅ Updated Excel file created: {filename}")
+        if export_excel:
+            export_frame(df, filename)
+
+            print(f"✅ Updated Excel file created: {filename}")
+
+        save_frame(df, filename)
+        catalog.upsert_classifications(df, 'fill_ai_data')
         
         # Show statistics
         print(f"\n📊 AI Data Statistics:")
@@ -199,7 +225,7 @@ def fill_ai_data():
 
 if __name__ == "__main__":
     print("🔧 Researching and filling AI columns with actual data...")
-    filename = fill_ai_data()
+    filename = fill_ai_data(export_excel='--excel' in sys.argv)
     
     if filename:
         print(f"\n🎉 Success! The Excel file '{filename}' now contains:")
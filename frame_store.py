@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Columnar store for the tables passed between pipeline stages.
+Stages keep naming their tables by the workbook they used to exchange
+(app_directory_with_ai_data.xlsx, ...), but read and write a Parquet copy
+instead of going through openpyxl. Parquet needs pyarrow; without it the
+store refuses to run rather than fall back to a non-columnar format.
+Each copy records a hash of its workbook as it was when the copy was
+written. The copy stays authoritative until the workbook's contents change
+(e.g. it is edited by hand), and then the workbook is re-read and the copy
+refreshed; a checkout or copy that only touches the workbook does not count.
+"""
+
+import hashlib
+import json
+import os
+import re
+from typing import Optional, Union
+
+import pandas as pd
+
+# Parquet engine
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+
+    HAVE_PYARROW = True
+except Exception:
+    HAVE_PYARROW = False
+
+STORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".frames")
+EXTENSION = ".parquet"
+# Parquet key-value metadata holding the workbook's hash at save time
+WORKBOOK_KEY = b"frame_store.workbook"
+
+# Sheet every directory workbook keeps the app table on
+MAIN_SHEET = "App Directory"
+
+
+def _require_pyarrow() -> None:
+    if not HAVE_PYARROW:
+        raise ImportError(
+            "frame_store needs pyarrow to read and write Parquet "
+            "(pip install pyarrow)"
+        )
+
+
+def frame_path(name: str, sheet_name: Union[str, int] = MAIN_SHEET) -> str:
+    """Columnar file backing one sheet of the workbook at path name."""
+    workbook = os.path.abspath(name)
+    stem = os.path.splitext(os.path.basename(workbook))[0]
+    # Same-named workbooks in different directories get their own copies
+    directory = hashlib.sha1(os.path.dirname(workbook).encode("utf-8"))
+    stem += "." + directory.hexdigest()[:8]
+    if sheet_name not in (0, MAIN_SHEET):
+        stem += "." + re.sub(r"[^A-Za-z0-9]+", "_", str(sheet_name)).strip("_")
+    return os.path.join(STORE_DIR, stem + EXTENSION)
+
+
+def workbook_digest(name: str) -> Optional[str]:
+    """SHA-1 of the workbook's contents, or None when it does not exist."""
+    digest = hashlib.sha1()
+    try:
+        with open(name, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def _recorded_digest(path: str) -> Optional[str]:
+    metadata = pq.read_schema(path).metadata or {}
+    value = metadata.get(WORKBOOK_KEY)
+    return json.loads(value)["sha1"] if value else None
+
+
+def _is_current(path: str, workbook: str) -> bool:
+    if not os.path.exists(path):
+        return False
+    digest = workbook_digest(workbook)
+    return digest is None or digest == _recorded_digest(path)
+
+
+def save_frame(
+    df: pd.DataFrame, name: str, sheet_name: Union[str, int] = MAIN_SHEET
+) -> str:
+    """Write df as the columnar copy of name/sheet_name; returns its path."""
+    _require_pyarrow()
+    path = frame_path(name, sheet_name)
+    os.makedirs(STORE_DIR, exist_ok=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[WORKBOOK_KEY] = json.dumps({"sha1": workbook_digest(name)})
+    tmp = f"{path}.{os.getpid()}.tmp"
+    pq.write_table(table.replace_schema_metadata(metadata), tmp)
+    os.replace(tmp, path)
+    return path
+
+
+def load_frame(name: str, sheet_name: Union[str, int] = MAIN_SHEET) -> pd.DataFrame:
+    """
+    Load one sheet of the workbook called name, preferring its columnar copy.
+    Falls back to the workbook itself and stores a copy for the next stage.
+    """
+    _require_pyarrow()
+    path = frame_path(name, sheet_name)
+    if _is_current(path, name):
+        return pq.read_table(path).to_pandas()
+    df = pd.read_excel(name, sheet_name=sheet_name)
+    save_frame(df, name, sheet_name)
+    return df
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Per-host politeness scheduler shared by the network scripts.
+Requests to the same site are spaced by a minimum interval and capped in
+concurrency, while requests to different sites are free to run in parallel.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+# Seconds between request starts to the same site
+DEFAULT_MIN_INTERVAL = 1.0
+# In-flight requests allowed per site
+DEFAULT_MAX_CONCURRENCY = 2
+
+MULTI_PART_TLDS = {
+    "co.uk",
+    "org.uk",
+    "gov.uk",
+    "ac.uk",
+    "com.au",
+    "net.au",
+    "com.br",
+    "com.mx",
+    "co.jp",
+    "com.cn",
+    "com.hk",
+    "com.sg",
+    "co.in",
+    "co.za",
+}
+
+
+def registrable_domain(host: str) -> str:
+    """Collapse a hostname to its registrable domain (acrobat.adobe.com -> adobe.com)."""
+    labels = [l for l in (host or "").lower().strip(".").split(".") if l]
+    if len(labels) >= 3 and f"{labels[-2]}.{labels[-1]}" in MULTI_PART_TLDS:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+def host_key(url: str) -> str:
+    """Scheduling key for a URL: subdomains of one vendor share a budget."""
+    if not isinstance(url, str):
+        return ""
+    try:
+        return registrable_domain(urlparse(url.strip()).hostname or "")
+    except ValueError:
+        return ""
+
+
+class HostScheduler:
+    """Enforce per-host spacing and concurrency caps across threads."""
+
+    def __init__(
+        self,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        self.min_interval = min_interval
+        self.max_concurrency = max(1, max_concurrency)
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._next_start: Dict[str, float] = {}
+
+    def _semaphore(self, key: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            sem = self._semaphores.get(key)
+            if sem is None:
+                sem = threading.BoundedSemaphore(self.max_concurrency)
+                self._semaphores[key] = sem
+            return sem
+
+    @contextmanager
+    def slot(
+        self, url: str, cancel: Optional[threading.Event] = None
+    ) -> Iterator[None]:
+        """
+        Block until a request to url's host may start, then hold a slot.
+        Once cancel is set the caller stops waiting and enters without using
+        up a start time (its reserved one is handed back unless a later
+        request already queued behind it); the caller must then drop the
+        request rather than send it.
+        """
+        key = host_key(url)
+        with self._semaphore(key):
+            if cancel is not None and cancel.is_set():
+                yield
+                return
+            # Reserve the next start time under the lock so concurrent
+            # callers for the same host queue up instead of bunching.
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_start.get(key, now))
+                self._next_start[key] = start + self.min_interval
+            delay = start - time.monotonic()
+            if delay > 0:
+                if cancel is None:
+                    time.sleep(delay)
+                elif cancel.wait(delay):
+                    with self._lock:
+                        if self._next_start.get(key) == start + self.min_interval:
+                            self._next_start[key] = start
+            yield
+
+    def defer(self, url: str, delay: float) -> None:
+        """Hold back the next request to url's host for at least delay seconds."""
+        key = host_key(url)
+        with self._lock:
+            now = time.monotonic()
+            self._next_start[key] = max(self._next_start.get(key, now), now + delay)
+
+
+# Shared instance so every script in a process honours the same budgets
+scheduler = HostScheduler()
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+HTML parser backend shared by the scrapers.
+BeautifulSoup stays the tree API everywhere so extraction code is unchanged;
+only the tree builder varies. The C-backed lxml builder is used when it is
+installed, with the pure-Python html.parser as the fallback.
+"""
+
+from bs4 import BeautifulSoup, FeatureNotFound
+
+# Fastest first; the first one bs4 can load becomes the default
+PREFERRED_PARSERS = ("lxml", "html.parser")
+
+
+def parser_available(name: str) -> bool:
+    try:
+        BeautifulSoup("", name)
+        return True
+    except FeatureNotFound:
+        return False
+
+
+PARSER = next(p for p in PREFERRED_PARSERS if parser_available(p))
+
+
+def make_soup(content, parser: str = None) -> BeautifulSoup:
+    """Parse markup with the selected backend (or an explicit parser name)."""
+    return BeautifulSoup(content, parser or PARSER)
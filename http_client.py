@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP client layer for the scrapers.
+One keep-alive session with per-host connection pools, one reusable
+cloudscraper instance and a common set of default headers, all fronted by
+the on-disk page cache, the per-host scheduler and the shared timeout,
+retry and circuit-breaker policy.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+import urllib3
+
+from catalog_db import catalog
+from fetch_policy import BREAKER_STATUSES, breaker, latency, retry_policy
+from host_scheduler import scheduler
+from page_cache import normalize_url, page_cache
+
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# Optional tougher fetcher for anti-bot sites
+try:
+    import cloudscraper  # type: ignore
+
+    HAVE_CLOUDSCRAPER = True
+except Exception:
+    HAVE_CLOUDSCRAPER = False
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/124.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Connection": "keep-alive",
+}
+
+# Distinct hosts whose pools are kept alive, and sockets kept per host
+POOL_HOSTS = 128
+POOL_CONNECTIONS_PER_HOST = 8
+
+# get_html reads at most this much of a page body by default
+DEFAULT_MAX_HTML_BYTES = 2 * 1024 * 1024
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+CHUNK_SIZE = 16 * 1024
+
+
+def build_session() -> requests.Session:
+    """Create a session with keep-alive pools sized for concurrent scraping."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_HOSTS, pool_maxsize=POOL_CONNECTIONS_PER_HOST
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    # Many vendor sites have broken chains; the scripts never verified them
+    session.verify = False
+    return session
+
+
+session = build_session()
+
+_scraper = None
+_scraper_lock = threading.Lock()
+
+
+def get_scraper():
+    """Return the shared cloudscraper instance, creating it on first use."""
+    global _scraper
+    if not HAVE_CLOUDSCRAPER:
+        return None
+    with _scraper_lock:
+        if _scraper is None:
+            _scraper = cloudscraper.create_scraper()
+        return _scraper
+
+
+def _merged_headers(headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+    merged = dict(DEFAULT_HEADERS)
+    merged.update(headers or {})
+    return merged
+
+
+def _network(getter, cancel: Optional[threading.Event] = None):
+    """
+    Wrap getter for the requests that actually go out: drop requests whose
+    cancel event was set while they waited for their scheduler slot, refuse
+    sites whose circuit is open, and feed every response's latency to the
+    tracker.
+    """
+
+    def network_get(url: str, **kwargs):
+        if cancel is not None and cancel.is_set():
+            raise RequestCancelled(f"cancelled before sending: {url}")
+        reason = breaker.open_reason(url)
+        if reason is not None:
+            raise CircuitOpen(reason)
+        try:
+            response = getter(url, **kwargs)
+        except requests.exceptions.ReadTimeout:
+            # A timed-out read took at least the timeout; count it as such
+            timeout = kwargs.get("timeout")
+            if isinstance(timeout, tuple):
+                timeout = timeout[1]
+            if timeout:
+                latency.observe(url, timeout)
+            raise
+        elapsed = getattr(response, "elapsed", None)
+        if elapsed is not None:
+            latency.observe(url, elapsed.total_seconds())
+        return response
+
+    return network_get
+
+
+def _record_status(url: str, status_code: int) -> None:
+    """Count a network reply for or against url's circuit."""
+    if status_code in BREAKER_STATUSES:
+        breaker.record_failure(url, f"HTTP {status_code}")
+    else:
+        breaker.record_success(url)
+
+
+def _fetch(url: str, getter, refresh: bool, reader, cancel=None, **kwargs):
+    """
+    page_cache.fetch with retries, recording network outcomes in the catalog
+    and the circuit breaker.
+    URLs resolved by resolve() are fetched at the canonical URL their
+    redirects ended at. Without an explicit timeout, requests get the
+    connect/read timeout tuned for the site. Transient failures are retried
+    per retry_policy; the wait is booked with the scheduler so other
+    requests to the site back off too. Sites with an open circuit raise
+    CircuitOpen without a request, and setting cancel drops a request that
+    has not been sent yet with RequestCancelled.
+    """
+    target = catalog.canonical_url(url, page_cache.ttl) or url
+    explicit_timeout = "timeout" in kwargs
+    getter = _network(getter, cancel)
+    attempt = 0
+    while True:
+        if not explicit_timeout:
+            kwargs["timeout"] = latency.timeout(target)
+        try:
+            response = page_cache.fetch(
+                target, getter, refresh=refresh, reader=reader, cancel=cancel, **kwargs
+            )
+        except (CircuitOpen, RequestCancelled):
+            raise
+        except requests.RequestException as e:
+            delay = retry_policy.delay(attempt, exc=e)
+            if delay is None:
+                catalog.record_fetch(url, error=type(e).__name__)
+                if isinstance(e, ContentRejected):
+                    # The site answered; only the content was unwanted
+                    breaker.record_success(target)
+                else:
+                    breaker.record_failure(target, type(e).__name__)
+                raise
+        else:
+            delay = retry_policy.delay(attempt, response=response)
+            if delay is None:
+                break
+            response.close()
+        scheduler.defer(target, delay)
+        attempt += 1
+    if not getattr(response, "from_cache", False):
+        catalog.record_fetch(
+            url, response.status_code, final_url=getattr(response, "url", None)
+        )
+        _record_status(target, response.status_code)
+    return response
+
+
+def get(url: str, refresh: bool = False, reader=None, cancel=None, **kwargs):
+    """GET url through the cache using the pooled session."""
+    return _fetch(url, session.get, refresh, reader, cancel, **kwargs)
+
+
+def scraper_get(url: str, refresh: bool = False, reader=None, cancel=None, **kwargs):
+    """GET url through the cache using cloudscraper (requires HAVE_CLOUDSCRAPER)."""
+    scraper = get_scraper()
+    if scraper is None:
+        raise RuntimeError("cloudscraper is not installed")
+    kwargs["headers"] = _merged_headers(kwargs.get("headers"))
+    return _fetch(url, scraper.get, refresh, reader, cancel, **kwargs)
+
+
+def resolve(url: str, timeout=None):
+    """
+    Follow url's redirects without downloading the page: a HEAD request,
+    then a streamed GET that is closed unread for servers that fail or
+    refuse HEAD. The status, final URL and (status, URL) redirect chain go
+    to the catalog, where _fetch picks up the final URL as url's canonical
+    address. Returns the final response.
+    """
+    head = _network(session.head)
+    kwargs = {"allow_redirects": True, "timeout": timeout or latency.timeout(url)}
+    try:
+        with scheduler.slot(url):
+            response = head(url, **kwargs)
+    except CircuitOpen:
+        raise
+    except requests.RequestException:
+        response = None
+    if response is None or response.status_code >= 400:
+        try:
+            with scheduler.slot(url):
+                response = _network(session.get)(url, stream=True, **kwargs)
+            response.close()
+        except CircuitOpen:
+            raise
+        except requests.RequestException as e:
+            catalog.record_resolution(url, error=type(e).__name__)
+            breaker.record_failure(url, type(e).__name__)
+            raise
+    chain = [(r.status_code, r.url) for r in response.history]
+    chain.append((response.status_code, response.url))
+    catalog.record_resolution(url, response.status_code, response.url, chain)
+    _record_status(url, response.status_code)
+    return response
+
+
+class ContentRejected(requests.RequestException):
+    """A response refused from its headers, before its body was downloaded."""
+
+
+class CircuitOpen(requests.RequestException):
+    """A request refused because its site's circuit breaker is open."""
+
+
+class RequestCancelled(requests.RequestException):
+    """A request dropped before it was sent because its caller gave up on it."""
+
+
+def content_type(headers) -> str:
+    return (headers.get("Content-Type") or "").split(";")[0].strip().lower()
+
+
+def content_length(headers) -> Optional[int]:
+    """Declared body size, or None when absent or malformed."""
+    try:
+        return int(headers.get("Content-Length"))
+    except (TypeError, ValueError):
+        return None
+
+
+def is_html(headers) -> bool:
+    """True for HTML responses, and for servers that send no Content-Type."""
+    return content_type(headers) in ("",) + HTML_CONTENT_TYPES
+
+
+class HtmlReader:
+    """
+    Response reader for get(reader=...): rejects non-HTML responses, and
+    untyped ones declared larger than max_bytes, from their headers, and
+    stops reading HTML bodies after max_bytes.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_HTML_BYTES):
+        self.max_bytes = max_bytes
+
+    def check(self, response) -> None:
+        """Reject from the headers alone, before any of the body is read."""
+        headers = response.headers
+        if not is_html(headers):
+            raise ContentRejected(
+                f"non-HTML content ({content_type(headers)})", response=response
+            )
+        length = content_length(headers)
+        if not content_type(headers) and length is not None and length > self.max_bytes:
+            # Untyped and over the cap: far more likely a download than a page
+            raise ContentRejected(
+                f"untyped content of {length} bytes (cap {self.max_bytes})",
+                response=response,
+            )
+
+    def __call__(self, response) -> Tuple[bytes, bool]:
+        self.check(response)
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= self.max_bytes:
+                return b"".join(chunks)[: self.max_bytes], False
+        return b"".join(chunks), True
+
+
+def get_html(url: str, max_bytes: int = DEFAULT_MAX_HTML_BYTES, **kwargs):
+    """
+    GET an HTML page, reading at most max_bytes of its body. Non-HTML
+    responses raise ContentRejected; response.complete is False when the
+    body was cut at max_bytes.
+    """
+    reader = HtmlReader(max_bytes)
+    response = get(url, reader=reader, **kwargs)
+    if (
+        getattr(response, "from_cache", False)
+        and not response.complete
+        and len(response.content) < max_bytes
+    ):
+        # Another reader cached a shorter prefix; fetch enough of the page
+        response = get(url, refresh=True, reader=reader, **kwargs)
+    if 200 <= response.status_code < 300:
+        reader.check(response)
+    return response
+
+
+def dedup_key(url) -> str:
+    """Key under which rows sharing one Official URL share a single fetch."""
+    return normalize_url(url) or str(url)
+
+
+def submit_unique(pool, urls, fetch) -> Dict[str, Future]:
+    """
+    Submit fetch(url) to pool once per distinct normalized URL.
+    Returns {dedup_key(url): Future}; look rows up with dedup_key to fan the
+    shared result back out.
+    """
+    futures = {}
+    for url in urls:
+        key = dedup_key(url)
+        if key not in futures:
+            futures[key] = pool.submit(fetch, url)
+    return futures
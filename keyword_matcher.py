@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Multi-keyword matcher shared by the AI classifiers.
+Every term from every keyword list is compiled into one trie-shaped regex,
+so a text is scanned once instead of once per term, and the hits come back
+grouped by list in each list's original order. Short acronyms such as "ai"
+and "ml" can be matched as whole words only, so "email" and "html" no longer
+count as AI mentions.
+"""
+
+import re
+from typing import Dict, Iterable, List, Set, Union
+
+# Terms this short are treated as acronyms by acronyms()
+ACRONYM_MAX_LEN = 3
+
+# Word characters, as \w in the patterns from pattern()
+_WORD_CHAR = re.compile(r"\w")
+
+
+def acronyms(*term_lists: Iterable[str], max_len: int = ACRONYM_MAX_LEN) -> Set[str]:
+    """Terms of at most max_len characters, to be matched as whole words."""
+    return {t for terms in term_lists for t in terms if len(t) <= max_len}
+
+
+def _trie_regex(terms: Iterable[str]) -> str:
+    """Regex alternation shaped like a trie; longer terms are preferred."""
+    trie: Dict = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def emit(node: Dict) -> str:
+        ends_here = "" in node
+        branches = [
+            re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if ends_here:
+            # Greedy optional group: try the longer term first
+            return f"(?:{body})?"
+        return body
+
+    return emit(trie)
+
+
+def _any_term_regex(terms: Iterable[str], whole_word: Set[str]) -> "re.Pattern":
+    """Regex matching any of terms, honouring whole-word terms."""
+    terms = [t for t in terms if t]
+    plain = [t for t in terms if t not in whole_word]
+    bounded = [t for t in terms if t in whole_word]
+    parts = []
+    if plain:
+        parts.append(f"(?:{_trie_regex(plain)})")
+    if bounded:
+        parts.append(rf"(?<!\w)(?:{_trie_regex(bounded)})(?!\w)")
+    # (?!) never matches, for an empty list
+    return re.compile("|".join(parts) or "(?!)")
+
+
+class KeywordMatcher:
+    """Find every term from several keyword lists in one pass over a text."""
+
+    def __init__(
+        self,
+        lists: Dict[str, Iterable[str]],
+        whole_word: Union[bool, Iterable[str]] = False,
+    ):
+        self.lists = {name: list(terms) for name, terms in lists.items()}
+        terms = {t for ts in self.lists.values() for t in ts if t}
+        if whole_word is True:
+            self.whole_word = set(terms)
+        elif whole_word:
+            self.whole_word = set(whole_word) & terms
+        else:
+            self.whole_word = set()
+        # Zero-width lookahead so overlapping terms at every offset are seen
+        self._regex = re.compile("(?=(" + _trie_regex(terms) + "))") if terms else None
+        # Per-list patterns for vectorized checks such as Series.str.contains
+        self._patterns = {
+            name: _any_term_regex(ts, self.whole_word)
+            for name, ts in self.lists.items()
+        }
+        # Shorter terms that also match wherever a longer term starts
+        self._prefixes = {
+            t: [p for p in terms if p != t and t.startswith(p)] for t in terms
+        }
+
+    def _bounded(self, text: str, start: int, term: str) -> bool:
+        if term not in self.whole_word:
+            return True
+        end = start + len(term)
+        before_ok = start == 0 or not _WORD_CHAR.match(text, start - 1)
+        after_ok = end >= len(text) or not _WORD_CHAR.match(text, end)
+        return before_ok and after_ok
+
+    def terms_in(self, text: str) -> Set[str]:
+        """Set of all terms present in text (callers pass lowercased text)."""
+        found: Set[str] = set()
+        if self._regex is None or not isinstance(text, str):
+            return found
+        for m in self._regex.finditer(text):
+            start = m.start()
+            longest = m.group(1)
+            for term in [longest] + self._prefixes[longest]:
+                if term not in found and self._bounded(text, start, term):
+                    found.add(term)
+        return found
+
+    def pattern(self, name: str) -> "re.Pattern":
+        """Compiled regex matching any term of one list, for Series.str.contains."""
+        return self._patterns[name]
+
+    def match(self, text: str) -> Dict[str, List[str]]:
+        """Hits grouped by list name, each in the list's original order."""
+        found = self.terms_in(text)
+        return {
+            name: [t for t in terms if t in found] for name, terms in self.lists.items()
+        }
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Versioned keyword rules for the AI classifiers.
+The keyword lists live in keyword_rules.json, grouped into one rule set per
+classifier. Each rule set's version combines the file's declared version
+with a digest of its lists, and goes into the row fingerprints, so editing
+one classifier's keywords reclassifies exactly the rows that classifier
+produced.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, List
+
+RULES_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "keyword_rules.json"
+)
+
+
+class RuleSetError(ValueError):
+    """The rule file is malformed or lacks a requested rule set or list."""
+
+
+class RuleSet:
+    """One classifier's named keyword lists."""
+
+    def __init__(self, name: str, lists: Dict[str, List[str]], file_version):
+        self.name = name
+        self.lists = lists
+        payload = json.dumps(lists, sort_keys=True, ensure_ascii=False)
+        digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+        self.version = f"{file_version}-{digest}"
+
+    def __getitem__(self, key: str) -> List[str]:
+        try:
+            return list(self.lists[key])
+        except KeyError:
+            raise RuleSetError(f"rule set {self.name!r} has no list {key!r}") from None
+
+
+def _check_list(where: str, terms) -> List[str]:
+    if not isinstance(terms, list) or not all(
+        isinstance(t, str) and t and t == t.strip().lower() for t in terms
+    ):
+        # Classifiers lowercase the text, so terms must already be lowercase
+        raise RuleSetError(f"{where}: expected a list of lowercase terms")
+    return terms
+
+
+def load_rules(path: str = RULES_PATH) -> Dict[str, RuleSet]:
+    """Parse and validate the rule file into rule sets by name."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or "version" not in data:
+        raise RuleSetError(f"{path}: missing top-level version")
+    rulesets = data.get("rulesets")
+    if not isinstance(rulesets, dict):
+        raise RuleSetError(f"{path}: missing rulesets")
+    return {
+        name: RuleSet(
+            name,
+            {
+                key: _check_list(f"{path}: {name}.{key}", terms)
+                for key, terms in lists.items()
+            },
+            data["version"],
+        )
+        for name, lists in rulesets.items()
+    }
+
+
+RULES = load_rules()
+
+
+def ruleset(name: str) -> RuleSet:
+    """The rule set called name from keyword_rules.json."""
+    try:
+        return RULES[name]
+    except KeyError:
+        raise RuleSetError(f"{RULES_PATH}: no rule set {name!r}") from None
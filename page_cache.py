@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Persistent on-disk cache for fetched pages.
+Entries are addressed by a digest of the normalized URL and keep the
+response body, headers and fetch time. Entries expire after a TTL and the
+cache is trimmed least-recently-used first once it outgrows its byte budget.
+Expired entries are revalidated with If-None-Match / If-Modified-Since, so
+unchanged pages cost a 304 instead of a full download.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse, urlunparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from host_scheduler import scheduler
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".page_cache")
+# Re-fetch pages older than a week
+DEFAULT_TTL = 7 * 24 * 3600
+# Evict least recently used entries beyond 512 MB
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Response headers that let a stale entry be revalidated with a conditional GET
+VALIDATOR_HEADERS = ("ETag", "Last-Modified")
+
+
+def normalize_url(url: str) -> str:
+    """Canonical cache key form: lowercase scheme/host, no default port or fragment."""
+    if not isinstance(url, str) or not url.strip():
+        return ""
+    p = urlparse(url.strip())
+    scheme = (p.scheme or "https").lower()
+    host = (p.hostname or "").lower()
+    netloc = host
+    if p.port and p.port != DEFAULT_PORTS.get(scheme):
+        netloc = f"{host}:{p.port}"
+    path = p.path or "/"
+    return urlunparse((scheme, netloc, path, "", p.query, ""))
+
+
+class CachedResponse:
+    """The subset of requests.Response the fetchers rely on, served from disk."""
+
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        headers: Dict[str, str],
+        content: bytes,
+        fetched_at: float,
+        from_cache: bool = False,
+        complete: bool = True,
+    ):
+        self.url = url
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.content = content
+        self.fetched_at = fetched_at
+        self.from_cache = from_cache
+        # False when a streaming reader stopped before the end of the body
+        self.complete = complete
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} Error for url: {self.url}"
+            )
+
+
+def conditional_headers(entry: CachedResponse) -> Dict[str, str]:
+    """If-None-Match / If-Modified-Since headers for revalidating entry."""
+    headers = {}
+    if entry.headers.get("ETag"):
+        headers["If-None-Match"] = entry.headers["ETag"]
+    if entry.headers.get("Last-Modified"):
+        headers["If-Modified-Since"] = entry.headers["Last-Modified"]
+    return headers
+
+
+class PageCache:
+    """Size-bounded LRU page store with per-entry TTL."""
+
+    def __init__(
+        self,
+        root: str = CACHE_DIR,
+        ttl: float = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        refresh: bool = False,
+    ):
+        self.root = root
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        # When set, every fetch goes to the network and overwrites the entry
+        self.refresh = refresh
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+
+    def _paths(self, url: str):
+        digest = hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
+        base = os.path.join(self.root, digest[:2], digest)
+        return base + ".json", base + ".body"
+
+    def _load(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached entry for url regardless of age, or None."""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                content = f.read()
+            # Access time drives LRU eviction
+            os.utime(meta_path, None)
+        except (OSError, ValueError, KeyError):
+            return None
+        return CachedResponse(
+            meta["url"],
+            meta["status_code"],
+            meta["headers"],
+            content,
+            meta["fetched_at"],
+            from_cache=True,
+            complete=meta.get("complete", True),
+        )
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        return time.time() - entry.fetched_at <= self.ttl
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return a fresh cached entry for url, or None."""
+        entry = self._load(url)
+        if entry is None or not self.is_fresh(entry):
+            return None
+        return entry
+
+    def put(
+        self, url: str, response, content: Optional[bytes] = None, complete=True
+    ) -> CachedResponse:
+        """Store a response (or a prefix of its body) and return it as a CachedResponse."""
+        entry = CachedResponse(
+            getattr(response, "url", url) or url,
+            response.status_code,
+            dict(response.headers),
+            response.content if content is None else content,
+            time.time(),
+            complete=complete,
+        )
+        self._write(url, entry)
+        return entry
+
+    def revalidated(self, url: str, entry: CachedResponse, response) -> CachedResponse:
+        """Record a 304 for a cached entry: refresh its validators and fetch time."""
+        headers = dict(entry.headers)
+        for name in VALIDATOR_HEADERS + ("Cache-Control", "Expires", "Date"):
+            if name in response.headers:
+                headers[name] = response.headers[name]
+        refreshed = CachedResponse(
+            entry.url,
+            entry.status_code,
+            headers,
+            entry.content,
+            time.time(),
+            from_cache=True,
+            complete=entry.complete,
+        )
+        self._write(url, refreshed)
+        return refreshed
+
+    def _write(self, url: str, entry: CachedResponse) -> None:
+        meta_path, body_path = self._paths(url)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        meta = {
+            "url": entry.url,
+            "requested_url": normalize_url(url),
+            "status_code": entry.status_code,
+            "headers": dict(entry.headers),
+            "fetched_at": entry.fetched_at,
+            "complete": entry.complete,
+        }
+        with self._lock:
+            freed = self._entry_size(meta_path, body_path)
+            # Write body first, then meta, each via rename so readers never
+            # see a half-written entry
+            for path, data, mode in (
+                (body_path, entry.content, "wb"),
+                (meta_path, json.dumps(meta), "w"),
+            ):
+                tmp = f"{path}.{threading.get_ident()}.tmp"
+                with open(tmp, mode) as f:
+                    f.write(data)
+                os.replace(tmp, path)
+            added = self._entry_size(meta_path, body_path)
+            self._account(added - freed)
+
+    def fetch(
+        self,
+        url: str,
+        getter=requests.get,
+        refresh: bool = False,
+        reader=None,
+        cancel=None,
+        **kwargs,
+    ):
+        """
+        Serve url from the cache, or fetch it politely and cache 2xx responses.
+        Stale or force-refreshed entries are revalidated with a conditional
+        GET, and a 304 reply is served from the cache.
+
+        reader(response) -> (body, complete) streams the body instead of
+        downloading it whole; the possibly partial body is cached as such and
+        only ever served back to callers that also pass a reader. Partial
+        entries are never revalidated, only refetched.
+
+        Setting the cancel event stops the wait for a scheduler slot; the
+        getter is still called and should then drop the request.
+        """
+        cached = self._load(url)
+        if cached is not None and not cached.complete and reader is None:
+            cached = None
+        if cached is not None and not (refresh or self.refresh):
+            if self.is_fresh(cached):
+                return cached
+        headers = dict(kwargs.pop("headers", None) or {})
+        # A partial body can't be revalidated: a 304 would hand the same
+        # prefix back to a caller that asked for more of the page
+        if cached is not None and not cached.complete:
+            cached = None
+        if cached is not None:
+            headers.update(conditional_headers(cached))
+        if reader is not None:
+            kwargs["stream"] = True
+        with scheduler.slot(url, cancel):
+            response = getter(url, headers=headers, **kwargs)
+        if cached is not None and response.status_code == 304:
+            return self.revalidated(url, cached, response)
+        if 200 <= response.status_code < 300:
+            if reader is None:
+                return self.put(url, response)
+            try:
+                content, complete = reader(response)
+            finally:
+                response.close()
+            return self.put(url, response, content=content, complete=complete)
+        return response
+
+    @staticmethod
+    def _entry_size(*paths: str) -> int:
+        size = 0
+        for path in paths:
+            try:
+                size += os.path.getsize(path)
+            except OSError:
+                pass
+        return size
+
+    def _scan(self):
+        entries = []
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if name.endswith(".json"):
+                    meta_path = os.path.join(dirpath, name)
+                    body_path = meta_path[: -len(".json")] + ".body"
+                    try:
+                        atime = os.path.getmtime(meta_path)
+                    except OSError:
+                        continue
+                    entries.append(
+                        (
+                            atime,
+                            meta_path,
+                            body_path,
+                            self._entry_size(meta_path, body_path),
+                        )
+                    )
+        return entries
+
+    def _account(self, delta: int) -> None:
+        # Caller holds self._lock
+        if self._total_bytes is None:
+            self._total_bytes = sum(e[3] for e in self._scan())
+        else:
+            self._total_bytes += delta
+        if self._total_bytes > self.max_bytes:
+            self._evict()
+
+    def _evict(self) -> None:
+        entries = sorted(self._scan())
+        total = sum(e[3] for e in entries)
+        # Trim to 90% so eviction is not re-triggered on every put
+        target = int(self.max_bytes * 0.9)
+        for _, meta_path, body_path, size in entries:
+            if total <= target:
+                break
+            for path in (meta_path, body_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+        self._total_bytes = total
+
+    def clear(self) -> None:
+        with self._lock:
+            for _, meta_path, body_path, _ in self._scan():
+                for path in (meta_path, body_path):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+            self._total_bytes = 0
+
+
+# Shared instance used by the fetchers
+page_cache = PageCache()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Structured fields extracted from a fetched homepage.
+One full parse yields the title, first h1, site name, meta description,
+about/overview sections and leading body text. The catalog stores these per
+URL, so later passes (homepage classification, vendor validation) reuse the
+extraction instead of parsing the HTML again.
+"""
+
+import re
+from typing import Dict
+
+from html_backend import make_soup
+
+# Leading body text kept per page
+BODY_TEXT_CHARS = 2000
+
+# Bumped whenever extract_page's output changes; the catalog re-extracts
+# pages stored by another version instead of mixing both formats
+# 2: body_text is stripped, so every parser backend extracts the same text
+EXTRACT_VERSION = 2
+
+EXTRACT_FIELDS = ("title", "h1", "site_name", "meta_description", "about", "body_text")
+
+_ABOUT_CLASS = re.compile(r"about|description|overview", re.I)
+
+
+def _meta_content(soup, **attrs) -> str:
+    tag = soup.find("meta", attrs=attrs)
+    return (tag.get("content") or "").strip() if tag else ""
+
+
+def extract_page(content) -> Dict[str, str]:
+    """Parse an HTML document into its EXTRACT_FIELDS."""
+    soup = make_soup(content)
+    title = soup.find("title")
+    h1 = soup.find("h1")
+    site_name = _meta_content(soup, property="og:site_name") or _meta_content(
+        soup, name="application-name"
+    )
+    about = "".join(
+        tag.get_text() + " "
+        for tag in soup.find_all(["div", "section"], class_=_ABOUT_CLASS)
+    )
+    return {
+        "title": title.get_text().strip() if title else "",
+        "h1": h1.get_text().strip() if h1 else "",
+        "site_name": site_name,
+        "meta_description": _meta_content(soup, name="description"),
+        "about": about,
+        # Parsers disagree on whitespace around <html> and <head>; trim it
+        "body_text": soup.get_text().strip()[:BODY_TEXT_CHARS],
+    }
+
+
+def homepage_text(fields: Dict[str, str]) -> str:
+    """The text the homepage classifier scans: every field in one string."""
+    return " ".join(
+        fields[k] for k in ("title", "h1", "meta_description", "about", "body_text")
+    )
+
+
+def brand_indicators(fields: Dict[str, str]) -> Dict[str, str]:
+    """The site name, title and h1 used for vendor validation."""
+    return {k: fields[k] for k in ("site_name", "title", "h1")}
@@ -5,9 +5,79 @@ This follows the 8-step methodology for accurate AI classification.
 """
 
 import pandas as pd
-import openpyxl
 from datetime import datetime
 import re
+from functools import lru_cache
+
+from excel_export import export_report
+from frame_store import load_frame, save_frame
+from keyword_matcher import KeywordMatcher, acronyms
+from keyword_rules import ruleset
+
+# Keyword lists from keyword_rules.json
+PROPER_RULES = ruleset("proper_research")
+
+# Step 2: technical AI terms
+TECHNICAL_AI_TERMS = PROPER_RULES["technical_ai"]
+
+# Step 2: API and developer terms
+API_TERMS = PROPER_RULES["api"]
+
+# Step 3: AI-powered features
+AI_FEATURES = PROPER_RULES["features"]
+
+# Step 4: recent AI announcement keywords
+ANNOUNCEMENT_KEYWORDS = PROPER_RULES["announcements"]
+
+# Step 5: AI vendor partnerships
+AI_VENDORS = PROPER_RULES["vendors"]
+
+# Integration keywords
+INTEGRATION_KEYWORDS = PROPER_RULES["integration"]
+
+# Step 6: user feedback keywords
+FEEDBACK_KEYWORDS = PROPER_RULES["feedback"]
+
+# Step 6: benefits that point at AI when paired with feedback keywords
+FEEDBACK_AI_TERMS = PROPER_RULES["feedback_ai"]
+
+# Step 7: technical AI implementation terms
+TECHNICAL_TERMS = PROPER_RULES["technical"]
+
+# Step 7: terms that make technical details AI-related
+TECHNICAL_AI_CONTEXT_TERMS = PROPER_RULES["technical_ai_context"]
+
+# Step 1: AI keywords in the URL and the app name
+URL_KEYWORDS = PROPER_RULES["url"]
+NAME_KEYWORDS = PROPER_RULES["name"]
+
+# Every description list is matched in one pass; short acronyms ("ai", "ml",
+# "api", ...) only as whole words so "email", "html" and "capital" don't count
+DESCRIPTION_KEYWORDS = {
+    "technical_ai": TECHNICAL_AI_TERMS,
+    "api": API_TERMS,
+    "features": AI_FEATURES,
+    "announcements": ANNOUNCEMENT_KEYWORDS,
+    "vendors": AI_VENDORS,
+    "integration": INTEGRATION_KEYWORDS,
+    "feedback": FEEDBACK_KEYWORDS,
+    "feedback_ai": FEEDBACK_AI_TERMS,
+    "technical": TECHNICAL_TERMS,
+    "technical_ai_context": TECHNICAL_AI_CONTEXT_TERMS,
+}
+DESCRIPTION_MATCHER = KeywordMatcher(
+    DESCRIPTION_KEYWORDS, whole_word=acronyms(*DESCRIPTION_KEYWORDS.values())
+)
+URL_MATCHER = KeywordMatcher({"url": URL_KEYWORDS}, whole_word=acronyms(URL_KEYWORDS))
+NAME_MATCHER = KeywordMatcher(
+    {"name": NAME_KEYWORDS}, whole_word=acronyms(NAME_KEYWORDS)
+)
+
+
+@lru_cache(maxsize=1024)
+def description_hits(description):
+    """Keyword hits for a description, scanned once and shared by steps 2-7"""
+    return DESCRIPTION_MATCHER.match(description.lower())
 
 
 def research_app_properly(app_name, description, official_url=""):
@@ -87,19 +157,13 @@ def analyze_website_indicators(app_name, official_url):
     # Check URL for AI-related domains or paths
     if official_url:
         url_lower = official_url.lower()
-        if any(
-            keyword in url_lower
-            for keyword in ["ai", "ml", "intelligence", "analytics", "data"]
-        ):
+        if URL_MATCHER.terms_in(url_lower):
             ai_indicators.append("AI-related URL")
             sources.append("Official Website URL")
 
     # Check app name for AI keywords
     name_lower = app_name.lower()
-    if any(
-        keyword in name_lower
-        for keyword in ["ai", "ml", "intelligence", "smart", "analytics"]
-    ):
+    if NAME_MATCHER.terms_in(name_lower):
         ai_indicators.append("AI-related app name")
         sources.append("App Name Analysis")
 
@@ -115,48 +179,23 @@ def analyze_documentation_indicators(description):
     sources = []
     ai_indicators = []
 
-    desc_lower = description.lower()
-
-    # Technical AI terms
-    technical_ai_terms = [
-        "machine learning",
-        "neural network",
-        "deep learning",
-        "artificial intelligence",
-        "predictive analytics",
-        "natural language processing",
-        "computer vision",
-        "recommendation engine",
-        "anomaly detection",
-        "pattern recognition",
-        "cognitive computing",
-        "intelligent automation",
-        "ai-powered",
-        "ml-powered",
-    ]
-
-    for term in technical_ai_terms:
-        if term in desc_lower:
-            ai_indicators.append(f"Technical AI term: {term}")
-            sources.append("Product Documentation")
-
-    # API and developer terms
-    api_terms = ["api", "sdk", "developer", "integration", "platform", "engine"]
-    for term in api_terms:
-        if term in desc_lower and any(
-            ai_term in desc_lower for ai_term in technical_ai_terms
-        ):
+    hits = description_hits(description)
+
+    for term in hits["technical_ai"]:
+        ai_indicators.append(f"Technical AI term: {term}")
+        sources.append("Product Documentation")
+
+    for term in hits["api"]:
+        if hits["technical_ai"]:
             ai_indicators.append(f"Developer/AI integration: {term}")
             sources.append("Technical Documentation")
 
     return {
         "ai_indicators": ai_indicators,
         "sources": sources,
-        "confidence": "high"
-        if len(ai_indicators) > 2
-        else "medium"
-        if ai_indicators
-        else "low",
+        "confidence": (
+            "high" if len(ai_indicators) > 2 else "medium" if ai_indicators else "low"
+        ),
     }
 
 
@@ -165,43 +204,16 @@ def analyze_feature_indicators(description):
     sources = []
     ai_indicators = []
 
-    desc_lower = description.lower()
-
-    # AI-powered features
-    ai_features = [
-        "automated",
-        "intelligent",
-        "smart",
-        "predictive",
-        "recommendation",
-        "insights",
-        "analytics",
-        "forecasting",
-        "optimization",
-        "personalization",
-        "chatbot",
-        "virtual assistant",
-        "voice recognition",
-        "image recognition",
-        "text analysis",
-        "sentiment analysis",
-        "fraud detection",
-        "risk assessment",
-    ]
-
-    for feature in ai_features:
-        if feature in desc_lower:
-            ai_indicators.append(f"AI feature: {feature}")
-            sources.append("Feature List Analysis")
+    for feature in description_hits(description)["features"]:
+        ai_indicators.append(f"AI feature: {feature}")
+        sources.append("Feature List Analysis")
 
     return {
         "ai_indicators": ai_indicators,
         "sources": sources,
-        "confidence": "high"
-        if len(ai_indicators) > 3
-        else "medium"
-        if ai_indicators
-        else "low",
+        "confidence": (
+            "high" if len(ai_indicators) > 3 else "medium" if ai_indicators else "low"
+        ),
     }
 
 
@@ -210,29 +222,9 @@ def analyze_ai_announcements(app_name, description):
     sources = []
     ai_indicators = []
 
-    desc_lower = description.lower()
-
-    # Recent AI announcement keywords
-    announcement_keywords = [
-        "new ai",
-        "latest ai",
-        "ai update",
-        "ai enhancement",
-        "ai improvement",
-        "ai partnership",
-        "ai collaboration",
-        "ai integration",
-        "ai platform",
-        "ai solution",
-        "ai service",
-        "ai capability",
-        "ai technology",
-    ]
-
-    for keyword in announcement_keywords:
-        if keyword in desc_lower:
-            ai_indicators.append(f"AI announcement: {keyword}")
-            sources.append("Recent News Analysis")
+    for keyword in description_hits(description)["announcements"]:
+        ai_indicators.append(f"AI announcement: {keyword}")
+        sources.append("Recent News Analysis")
 
     return {
         "ai_indicators": ai_indicators,
@@ -246,40 +238,14 @@ def analyze_ai_partnerships(app_name, description):
     sources = []
     ai_indicators = []
 
-    desc_lower = description.lower()
-
-    # AI vendor partnerships
-    ai_vendors = [
-        "openai",
-        "anthropic",
-        "google ai",
-        "microsoft ai",
-        "amazon ai",
-        "ibm watson",
-        "salesforce einstein",
-        "adobe sensei",
-        "oracle ai",
-        "sap ai",
-        "servicenow ai",
-        "workday ai",
-        "zoom ai",
-    ]
-
-    for vendor in ai_vendors:
-        if vendor in desc_lower:
-            ai_indicators.append(f"AI vendor partnership: {vendor}")
-            sources.append("Partnership Analysis")
-
-    # Integration keywords
-    integration_keywords = [
-        "integrated with",
-        "powered by",
-        "built on",
-        "leverages",
-        "utilizes",
-    ]
-    for keyword in integration_keywords:
-        if keyword in desc_lower and any(vendor in desc_lower for vendor in ai_vendors):
+    hits = description_hits(description)
+
+    for vendor in hits["vendors"]:
+        ai_indicators.append(f"AI vendor partnership: {vendor}")
+        sources.append("Partnership Analysis")
+
+    for keyword in hits["integration"]:
+        if hits["vendors"]:
             ai_indicators.append(f"AI integration: {keyword}")
             sources.append("Integration Analysis")
 
@@ -295,31 +261,11 @@ def analyze_user_feedback_indicators(description):
     sources = []
     ai_indicators = []
 
-    desc_lower = description.lower()
-
-    # User feedback keywords
-    feedback_keywords = [
-        "user experience",
-        "customer satisfaction",
-        "user-friendly",
-        "intuitive",
-        "efficient",
-        "time-saving",
-        "productive",
-        "helpful",
-        "accurate",
-        "reliable",
-        "powerful",
-        "advanced",
-        "sophisticated",
-    ]
+    hits = description_hits(description)
 
     # Check if description mentions user benefits that could indicate AI
-    if any(keyword in desc_lower for keyword in feedback_keywords):
-        if any(
-            ai_term in desc_lower
-            for ai_term in ["automated", "intelligent", "smart", "predictive"]
-        ):
+    if hits["feedback"]:
+        if hits["feedback_ai"]:
             ai_indicators.append("User feedback suggests AI benefits")
             sources.append("User Feedback Analysis")
 
@@ -335,45 +281,19 @@ def analyze_technical_indicators(app_name, description):
     sources = []
     ai_indicators = []
 
-    desc_lower = description.lower()
-
-    # Technical AI implementation terms
-    technical_terms = [
-        "api",
-        "sdk",
-        "rest api",
-        "graphql",
-        "webhook",
-        "integration",
-        "platform",
-        "engine",
-        "framework",
-        "library",
-        "toolkit",
-        "algorithm",
-        "model",
-        "training",
-        "inference",
-        "deployment",
-    ]
-
-    for term in technical_terms:
-        if term in desc_lower:
-            if any(
-                ai_term in desc_lower
-                for ai_term in ["ai", "ml", "intelligence", "analytics"]
-            ):
-                ai_indicators.append(f"Technical AI implementation: {term}")
-                sources.append("Technical Documentation")
+    hits = description_hits(description)
+
+    for term in hits["technical"]:
+        if hits["technical_ai_context"]:
+            ai_indicators.append(f"Technical AI implementation: {term}")
+            sources.append("Technical Documentation")
 
     return {
         "ai_indicators": ai_indicators,
         "sources": sources,
-        "confidence": "high"
-        if len(ai_indicators) > 1
-        else "medium"
-        if ai_indicators
-        else "low",
+        "confidence": (
+            "high" if len(ai_indicators) > 1 else "medium" if ai_indicators else "low"
+        ),
     }
 
 
@@ -483,7 +403,7 @@ def research_all_apps_properly():
     print("=" * 60)
 
     # Read the main Excel file
-    df = pd.read_excel("app_directory_with_ai_data.xlsx")
+    df = load_frame("app_directory_with_ai_data.xlsx")
 
     print(f"📊 Researching {len(df)} applications using 8-step methodology")
     print(f"⏰ Research started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -539,81 +459,54 @@ def create_proper_research_results(research_results):
     results_df = pd.DataFrame(research_results)
     filename = "proper_ai_research_results.xlsx"
 
-    with pd.ExcelWriter(filename, engine="openpyxl") as writer:
-        # Main results
-        results_df.to_excel(writer, sheet_name="Research Results", index=False)
-
-        # High confidence results
-        high_confidence = results_df[results_df["Confidence Level"] == "high"]
-        high_confidence.to_excel(
-            writer, sheet_name="High Confidence Results", index=False
-        )
-
-        # AI-enabled apps
-        ai_enabled = results_df[results_df["AI Usage"] == "aiEnabled"]
-        ai_enabled.to_excel(writer, sheet_name="AI-Enabled Apps", index=False)
-
-        # High potential apps
-        high_potential = results_df[
-            results_df["AI Potential"].isin(["high", "veryHigh"])
-        ]
-        high_potential.to_excel(writer, sheet_name="High Potential Apps", index=False)
-
-        # Summary statistics
-        summary_data = {
-            "Metric": [
-                "Total Apps Researched",
-                "High Confidence Results",
-                "AI-Enabled Apps",
-                "AI-Available Apps",
-                "High/Very High Potential",
-                "High Risk Apps",
-                "LLM Technology",
-                "Machine Learning",
-                "Neural Networks",
-            ],
-            "Count": [
-                len(results_df),
-                len(high_confidence),
-                len(ai_enabled),
-                len(results_df[results_df["AI Usage"] == "aiAvailable"]),
-                len(high_potential),
-                len(results_df[results_df["AI Risk"] == "high"]),
-                len(results_df[results_df["AI Type"] == "llm"]),
-                len(results_df[results_df["AI Type"] == "machineLearning"]),
-                len(results_df[results_df["AI Type"] == "neuralNet"]),
-            ],
-        }
+    sheets = {}
+    # Main results
+    sheets["Research Results"] = results_df
+
+    # High confidence results
+    high_confidence = results_df[results_df["Confidence Level"] == "high"]
+    sheets["High Confidence Results"] = high_confidence
+
+    # AI-enabled apps
+    ai_enabled = results_df[results_df["AI Usage"] == "aiEnabled"]
+    sheets["AI-Enabled Apps"] = ai_enabled
+
+    # High potential apps
+    high_potential = results_df[results_df["AI Potential"].isin(["high", "veryHigh"])]
+    sheets["High Potential Apps"] = high_potential
+
+    # Summary statistics
+    summary_data = {
+        "Metric": [
+            "Total Apps Researched",
+            "High Confidence Results",
+            "AI-Enabled Apps",
+            "AI-Available Apps",
+            "High/Very High Potential",
+            "High Risk Apps",
+            "LLM Technology",
+            "Machine Learning",
+            "Neural Networks",
+        ],
+        "Count": [
+            len(results_df),
+            len(high_confidence),
+            len(ai_enabled),
+            len(results_df[results_df["AI Usage"] == "aiAvailable"]),
+            len(high_potential),
+            len(results_df[results_df["AI Risk"] == "high"]),
+            len(results_df[results_df["AI Type"] == "llm"]),
+            len(results_df[results_df["AI Type"] == "machineLearning"]),
+            len(results_df[results_df["AI Type"] == "neuralNet"]),
+        ],
+    }
+
+    summary_df = pd.DataFrame(summary_data)
+    sheets["Research Summary"] = summary_df
+
+    export_report(filename, sheets)
 
-        summary_df = pd.DataFrame(summary_data)
-        summary_df.to_excel(writer, sheet_name="Research Summary", index=False)
-
-        # Format workbook
-        workbook = writer.book
-        for sheet_name in writer.sheets:
-            worksheet = writer.sheets[sheet_name]
-
-            header_font = openpyxl.styles.Font(bold=True, color="FFFFFF")
-            header_fill = openpyxl.styles.PatternFill(
-                start_color="366092", end_color="366092", fill_type="solid"
-            )
-
-            for cell in worksheet[1]:
-                cell.font = header_font
-                cell.fill = header_fill
-
-            # Auto-adjust column widths
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
+    save_frame(results_df, filename, "Research Results")
 
     print(f"\n📋 Proper Research Results Created: {filename}")
 
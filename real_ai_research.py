@@ -9,6 +9,9 @@ import time
 from datetime import datetime
 import json
 
+from frame_store import load_frame, save_frame
+from research_merge import merge_research
+
 
 def research_app_ai_capabilities(app_name, description, official_url):
     """
@@ -225,7 +228,7 @@ def research_all_apps():
     print("📅 Research Date:", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
     # Load the current Excel file
-    df = pd.read_excel("/Users/sam/workspace/app-des/app_directory_with_ai_data.xlsx")
+    df = load_frame("/Users/sam/workspace/app-des/app_directory_with_ai_data.xlsx")
     print(f"📊 Total apps to research: {len(df)}")
 
     research_results = []
@@ -367,6 +370,8 @@ def research_all_apps():
         methodology_df = pd.DataFrame(methodology_data)
         methodology_df.to_excel(writer, sheet_name="Research Methodology", index=False)
 
+    save_frame(results_df, filename, "Research Results")
+
     print(f"\n✅ Research completed! Results saved to: {filename}")
     return results_df
 
@@ -376,41 +381,16 @@ def update_main_excel_with_real_research():
     print("\n📝 Updating main Excel file with research results...")
 
     # Load research results and main file
-    research_df = pd.read_excel(
+    research_df = load_frame(
         "/Users/sam/workspace/app-des/real_ai_research_results.xlsx",
         sheet_name="Research Results",
     )
-    main_df = pd.read_excel(
-        "/Users/sam/workspace/app-des/app_directory_with_ai_data.xlsx"
-    )
+    main_df = load_frame("/Users/sam/workspace/app-des/app_directory_with_ai_data.xlsx")
 
-    # Create mapping from research results
-    research_mapping = {}
-    for _, row in research_df.iterrows():
-        app_name = row["App Name"]
-        research_mapping[app_name] = {
-            "lxAiPotential": row["AI Potential"],
-            "lxAiRisk": row["AI Risk"],
-            "lxAiUsage": row["AI Usage"],
-            "lxAiType": row["AI Type"],
-            "lxAiTaxonomyDescription": row["AI Taxonomy Description"],
-        }
-
-    # Update main DataFrame
-    updated_count = 0
-    for index, row in main_df.iterrows():
-        app_name = row["Name"]
-        if app_name in research_mapping:
-            main_df.at[index, "lxAiPotential"] = research_mapping[app_name][
-                "lxAiPotential"
-            ]
-            main_df.at[index, "lxAiRisk"] = research_mapping[app_name]["lxAiRisk"]
-            main_df.at[index, "lxAiUsage"] = research_mapping[app_name]["lxAiUsage"]
-            main_df.at[index, "lxAiType"] = research_mapping[app_name]["lxAiType"]
-            main_df.at[index, "lxAiTaxonomyDescription"] = research_mapping[app_name][
-                "lxAiTaxonomyDescription"
-            ]
-            updated_count += 1
+    # Join research results onto the directory by app name
+    main_df, merge_report = merge_research(main_df, research_df)
+    updated_count = merge_report.updated
+    merge_report.print_warnings()
 
     # Save updated file
     filename = "/Users/sam/workspace/app-des/app_directory_final_real_ai_research.xlsx"
@@ -460,6 +440,8 @@ def update_main_excel_with_real_research():
         ai_enabled = main_df[main_df["lxAiUsage"] == "aiEnabled"]
         ai_enabled.to_excel(writer, sheet_name="AI-Enabled Apps", index=False)
 
+    save_frame(main_df, filename)
+
     print(f"✅ Updated {updated_count} apps with real research data")
     print(f"💾 Final file saved as: {filename}")
 
@@ -4,67 +4,95 @@ Real Homepage Analysis Script
 Visit each app's homepage and analyze real content from About pages and descriptions
 """
 
+import sys
 import pandas as pd
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import requests
 from urllib.parse import urlparse
-import re
-from bs4 import BeautifulSoup
 import urllib3
 
+from catalog_db import catalog
+from checkpoint import Checkpoint, row_fingerprint
+from frame_store import load_frame, save_frame
+import http_client
+from keyword_matcher import KeywordMatcher, acronyms
+from keyword_rules import ruleset
+from page_cache import page_cache
+from page_extract import EXTRACT_VERSION, extract_page, homepage_text
+from research_merge import merge_research
+
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Homepages fetched in parallel during research_all_apps_homepage
+FETCH_WORKERS = 8
 
-def fetch_homepage_content(url):
-    """
-    Fetch and parse the homepage content of an app
-    """
-    if not url or url == "N/A":
-        return None, "No URL provided"
+# Research Sources prefix of rows whose homepage could not be fetched
+FETCH_FAILED_SOURCE = "Homepage fetch failed"
 
-    try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
+# Bytes of a homepage read before the rest is dropped (--max-bytes=N)
+MAX_HOMEPAGE_BYTES = http_client.DEFAULT_MAX_HTML_BYTES
 
-        response = requests.get(url, headers=headers, timeout=10, verify=False)
-        response.raise_for_status()
+# Keyword lists from keyword_rules.json
+HOMEPAGE_RULES = ruleset("homepage")
 
-        soup = BeautifulSoup(response.content, "html.parser")
+# AI-related terms found in actual homepage content
+HOMEPAGE_AI_TERMS = HOMEPAGE_RULES["ai"]
 
-        # Extract text content
-        text_content = soup.get_text()
+# Analytics and data terms
+HOMEPAGE_ANALYTICS_TERMS = HOMEPAGE_RULES["analytics"]
 
-        # Look for specific sections
-        about_section = ""
-        description_section = ""
+# Both term lists are matched in one pass; "ai"/"ml" only as whole words so
+# "email" and "html" are not counted
+HOMEPAGE_MATCHER = KeywordMatcher(
+    {"ai": HOMEPAGE_AI_TERMS, "analytics": HOMEPAGE_ANALYTICS_TERMS},
+    whole_word=acronyms(HOMEPAGE_AI_TERMS, HOMEPAGE_ANALYTICS_TERMS),
+)
 
-        # Try to find About section
-        about_tags = soup.find_all(
-            ["div", "section"], class_=re.compile(r"about|description|overview", re.I)
-        )
-        for tag in about_tags:
-            about_section += tag.get_text() + " "
-
-        # Look for meta description
-        meta_desc = soup.find("meta", attrs={"name": "description"})
-        if meta_desc:
-            description_section = meta_desc.get("content", "")
+# Part of every row fingerprint: a keyword or extraction change reclassifies
+# every app
+RULES_VERSION = f"{HOMEPAGE_RULES.version}+extract{EXTRACT_VERSION}"
 
-        # Look for title and h1 tags
-        title = soup.find("title")
-        h1 = soup.find("h1")
 
-        full_content = f"{title.get_text() if title else ''} {h1.get_text() if h1 else ''} {description_section} {about_section} {text_content[:2000]}"
+def fetch_homepage_content(url, max_bytes=None):
+    """
+    Fetch and parse the homepage content of an app.
+    Fields extracted by an earlier run are reused while the page cache would
+    still consider the page fresh, so a keyword rule change reclassifies
+    fetched pages without going back to the network (--refresh re-downloads).
+    Non-HTML responses are skipped from their headers and HTML bodies are
+    read up to max_bytes (MAX_HOMEPAGE_BYTES by default).
+    """
+    if not url or url == "N/A":
+        return None, "No URL provided"
 
-        return full_content, "Success"
+    max_bytes = max_bytes or MAX_HOMEPAGE_BYTES
+    fields = None if page_cache.refresh else catalog.page_extract(url, page_cache.ttl)
+    if fields is not None and (fields["truncated_at"] or max_bytes) < max_bytes:
+        # Cut shorter than this run allows; read more of the page
+        fields = None
+    if fields is None:
+        try:
+            response = http_client.get_html(url, max_bytes=max_bytes)
+            response.raise_for_status()
+            fields = extract_page(response.content)
+        except http_client.ContentRejected as e:
+            return None, f"Skipped: {e}"
+        except requests.exceptions.RequestException as e:
+            return None, f"Request failed: {str(e)}"
+        except Exception as e:
+            return None, f"Parsing failed: {str(e)}"
+        fields["truncated_at"] = (
+            None if getattr(response, "complete", True) else max_bytes
+        )
+        # Failures are retried on the next run rather than remembered
+        catalog.store_page_extract(url, fields, fields["truncated_at"])
 
-    except requests.exceptions.RequestException as e:
-        return None, f"Request failed: {str(e)}"
-    except Exception as e:
-        return None, f"Parsing failed: {str(e)}"
+    if fields["truncated_at"]:
+        status = f"Success (truncated at {fields['truncated_at']} bytes)"
+        return homepage_text(fields), status
+    return homepage_text(fields), "Success"
 
 
 def analyze_homepage_content(content):
@@ -84,32 +112,8 @@ def analyze_homepage_content(content):
 
     content_lower = content.lower()
 
-    # AI-related terms found in actual homepage content
-    ai_terms = [
-        "artificial intelligence",
-        "machine learning",
-        "deep learning",
-        "neural network",
-        "ai-powered",
-        "ai-enabled",
-        "intelligent automation",
-        "predictive analytics",
-        "natural language processing",
-        "computer vision",
-        "cognitive computing",
-        "automated",
-        "smart analytics",
-        "data science",
-        "ml",
-        "ai",
-        "algorithm",
-        "chatbot",
-        "conversational ai",
-        "recommendation engine",
-        "pattern recognition",
-    ]
-
-    found_ai_terms = [term for term in ai_terms if term in content_lower]
+    hits = HOMEPAGE_MATCHER.match(content_lower)
+    found_ai_terms = hits["ai"]
 
     if len(found_ai_terms) >= 3:
         return {
@@ -142,22 +146,7 @@ def analyze_homepage_content(content):
             "sources": "Homepage content analysis",
         }
 
-    # Analytics and data terms
-    analytics_terms = [
-        "analytics",
-        "insights",
-        "data analysis",
-        "business intelligence",
-        "reporting",
-        "dashboard",
-        "metrics",
-        "data visualization",
-        "statistical analysis",
-        "trend analysis",
-        "data mining",
-    ]
-
-    found_analytics = [term for term in analytics_terms if term in content_lower]
+    found_analytics = hits["analytics"]
 
     if found_analytics:
         return {
@@ -182,15 +171,18 @@ def analyze_homepage_content(content):
     }
 
 
-def research_app_homepage(app_name, description, official_url):
+def research_app_homepage(app_name, description, official_url, fetched=None):
     """
-    Research a single app by analyzing its actual homepage content
+    Research a single app by analyzing its actual homepage content.
+    Pass fetched=(content, status) to reuse a fetch_homepage_content result.
     """
     print(f"🌐 Analyzing homepage for: {app_name}")
     print(f"   📡 URL: {official_url}")
 
     # Fetch homepage content
-    content, status = fetch_homepage_content(official_url)
+    if fetched is None:
+        fetched = fetch_homepage_content(official_url)
+    content, status = fetched
 
     if content:
         print(f"   ✅ Content fetched successfully ({len(content)} characters)")
@@ -206,19 +198,29 @@ def research_app_homepage(app_name, description, official_url):
             "ai_type": "Other",
             "description": f"Could not analyze homepage: {status}",
             "confidence": "low",
-            "sources": f"Homepage fetch failed: {status}",
+            "sources": f"{FETCH_FAILED_SOURCE}: {status}",
         }
 
     return result
 
 
-def research_all_apps_homepage():
-    """Research all apps by analyzing their actual homepage content"""
+def _analyzed(result) -> bool:
+    """True for checkpoint rows whose homepage was actually fetched."""
+    return result is not None and not str(result["Research Sources"]).startswith(
+        FETCH_FAILED_SOURCE
+    )
+
+
+def research_all_apps_homepage(refresh=False):
+    """
+    Research all apps by analyzing their actual homepage content.
+    refresh=True ignores the checkpoint and analyzes every app again.
+    """
     print("🌐 Starting Homepage Content Analysis...")
     print("📅 Research Date:", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
     # Load the current Excel file
-    df = pd.read_excel("/Users/sam/workspace/app-des/app_directory_with_ai_data.xlsx")
+    df = load_frame("/Users/sam/workspace/app-des/app_directory_with_ai_data.xlsx")
     print(f"📊 Total apps to research: {len(df)}")
 
     research_results = []
@@ -226,52 +228,88 @@ def research_all_apps_homepage():
     medium_confidence_count = 0
     low_confidence_count = 0
 
-    print("\n🔍 Analyzing homepage content for each app...")
-    for index, row in df.iterrows():
-        app_name = row["Name"]
-        description = row["Description"]
-        official_url = row["Official URL"]
-
-        print(f"\n--- App {index + 1}/{len(df)} ---")
-
-        # Research this specific app's homepage
-        research_result = research_app_homepage(app_name, description, official_url)
-
-        # Create result record
-        result = {
-            "App Name": app_name,
-            "Description": description,
-            "Official URL": official_url,
-            "AI Potential": research_result["ai_potential"],
-            "AI Risk": research_result["ai_risk"],
-            "AI Usage": research_result["ai_usage"],
-            "AI Type": research_result["ai_type"],
-            "AI Taxonomy Description": research_result["description"],
-            "Research Sources": research_result["sources"],
-            "Confidence Level": research_result["confidence"],
-            "Research Date": datetime.now().strftime("%Y-%m-%d"),
-            "Research Method": "Homepage Content Analysis + Real Website Data",
-        }
-
-        research_results.append(result)
-
-        # Count confidence levels
-        if research_result["confidence"] == "high":
-            high_confidence_count += 1
-        elif research_result["confidence"] == "medium":
-            medium_confidence_count += 1
-        else:
-            low_confidence_count += 1
-
-        # Progress indicator
-        if (index + 1) % 10 == 0:
-            print(f"\n📈 Progress: {index + 1}/{len(df)} apps analyzed")
-            print(f"   🎯 High Confidence: {high_confidence_count}")
-            print(f"   🎯 Medium Confidence: {medium_confidence_count}")
-            print(f"   🎯 Low Confidence: {low_confidence_count}")
+    # Apps whose name, description, URL and rules are unchanged since an
+    # earlier (possibly interrupted) run are reused from the checkpoint; only
+    # fetched homepages are stored, so failed fetches are tried again
+    checkpoint = Checkpoint("homepage_analysis")
+    keys = [
+        row_fingerprint(
+            row["Name"],
+            row["Description"],
+            row["Official URL"],
+            rules_version=RULES_VERSION,
+        )
+        for _, row in df.iterrows()
+    ]
+    stored = {}
+    if not refresh:
+        stored = {k: checkpoint.get(k) for k in keys if _analyzed(checkpoint.get(k))}
+    pending_urls = [
+        url for key, url in zip(keys, df["Official URL"]) if key not in stored
+    ]
+    if len(pending_urls) < len(df):
+        print(f"♻️  {len(df) - len(pending_urls)} apps unchanged since the last run")
 
-        # Add delay to be respectful to websites
-        time.sleep(1)
+    print("\n🔍 Analyzing homepage content for each app...")
+    # Fetch concurrently; the shared scheduler keeps each host politely spaced
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        # One fetch per distinct URL, shared by every row pointing at it
+        fetched_pages = http_client.submit_unique(
+            pool, pending_urls, fetch_homepage_content
+        )
+        print(f"📡 {len(fetched_pages)} unique URLs for {len(pending_urls)} apps")
+        for (index, row), key in zip(df.iterrows(), keys):
+            app_name = row["Name"]
+            description = row["Description"]
+            official_url = row["Official URL"]
+
+            print(f"\n--- App {index + 1}/{len(df)} ---")
+
+            result = stored.get(key)
+            if result is not None:
+                print(f"   ♻️  {app_name}: reused from checkpoint")
+            else:
+                # Research this specific app's homepage
+                fetched = fetched_pages[http_client.dedup_key(official_url)].result()
+                research_result = research_app_homepage(
+                    app_name, description, official_url, fetched=fetched
+                )
+
+                # Create result record
+                result = {
+                    "App Name": app_name,
+                    "Description": description,
+                    "Official URL": official_url,
+                    "AI Potential": research_result["ai_potential"],
+                    "AI Risk": research_result["ai_risk"],
+                    "AI Usage": research_result["ai_usage"],
+                    "AI Type": research_result["ai_type"],
+                    "AI Taxonomy Description": research_result["description"],
+                    "Research Sources": research_result["sources"],
+                    "Confidence Level": research_result["confidence"],
+                    "Research Date": datetime.now().strftime("%Y-%m-%d"),
+                    "Research Method": "Homepage Content Analysis + Real Website Data",
+                }
+                if _analyzed(result):
+                    checkpoint.record(key, result)
+                    stored[key] = result
+
+            research_results.append(result)
+
+            # Count confidence levels
+            if result["Confidence Level"] == "high":
+                high_confidence_count += 1
+            elif result["Confidence Level"] == "medium":
+                medium_confidence_count += 1
+            else:
+                low_confidence_count += 1
+
+            # Progress indicator
+            if (index + 1) % 10 == 0:
+                print(f"\n📈 Progress: {index + 1}/{len(df)} apps analyzed")
+                print(f"   🎯 High Confidence: {high_confidence_count}")
+                print(f"   🎯 Medium Confidence: {medium_confidence_count}")
+                print(f"   🎯 Low Confidence: {low_confidence_count}")
 
     print(f"\n📈 Final Homepage Analysis Summary:")
     print(f"   🎯 High Confidence: {high_confidence_count} apps")
@@ -329,6 +367,10 @@ def research_all_apps_homepage():
         summary_df = pd.DataFrame(summary_data)
         summary_df.to_excel(writer, sheet_name="Homepage Analysis Summary", index=False)
 
+    save_frame(results_df, filename, "Homepage Analysis Results")
+
+    checkpoint.retain(key for key in keys if key in stored)
+
     print(f"\n✅ Homepage analysis completed! Results saved to: {filename}")
     return results_df
 
@@ -338,41 +380,16 @@ def update_main_excel_with_homepage_analysis():
     print("\n📝 Updating main Excel file with homepage analysis results...")
 
     # Load research results and main file
-    research_df = pd.read_excel(
+    research_df = load_frame(
         "/Users/sam/workspace/app-des/homepage_analysis_results.xlsx",
         sheet_name="Homepage Analysis Results",
     )
-    main_df = pd.read_excel(
-        "/Users/sam/workspace/app-des/app_directory_with_ai_data.xlsx"
-    )
-
-    # Create mapping from research results
-    research_mapping = {}
-    for _, row in research_df.iterrows():
-        app_name = row["App Name"]
-        research_mapping[app_name] = {
-            "lxAiPotential": row["AI Potential"],
-            "lxAiRisk": row["AI Risk"],
-            "lxAiUsage": row["AI Usage"],
-            "lxAiType": row["AI Type"],
-            "lxAiTaxonomyDescription": row["AI Taxonomy Description"],
-        }
+    main_df = load_frame("/Users/sam/workspace/app-des/app_directory_with_ai_data.xlsx")
 
-    # Update main DataFrame
-    updated_count = 0
-    for index, row in main_df.iterrows():
-        app_name = row["Name"]
-        if app_name in research_mapping:
-            main_df.at[index, "lxAiPotential"] = research_mapping[app_name][
-                "lxAiPotential"
-            ]
-            main_df.at[index, "lxAiRisk"] = research_mapping[app_name]["lxAiRisk"]
-            main_df.at[index, "lxAiUsage"] = research_mapping[app_name]["lxAiUsage"]
-            main_df.at[index, "lxAiType"] = research_mapping[app_name]["lxAiType"]
-            main_df.at[index, "lxAiTaxonomyDescription"] = research_mapping[app_name][
-                "lxAiTaxonomyDescription"
-            ]
-            updated_count += 1
+    # Join research results onto the directory by app name
+    main_df, merge_report = merge_research(main_df, research_df)
+    updated_count = merge_report.updated
+    merge_report.print_warnings()
 
     # Save updated file
     filename = "/Users/sam/workspace/app-des/app_directory_final_homepage_analysis.xlsx"
@@ -422,6 +439,8 @@ def update_main_excel_with_homepage_analysis():
         ai_enabled = main_df[main_df["lxAiUsage"] == "aiEnabled"]
         ai_enabled.to_excel(writer, sheet_name="AI-Enabled Apps", index=False)
 
+    save_frame(main_df, filename)
+
     print(f"✅ Updated {updated_count} apps with homepage analysis data")
     print(f"💾 Final file saved as: {filename}")
 
@@ -432,8 +451,14 @@ if __name__ == "__main__":
     print("🌐 Homepage Content Analysis Tool")
     print("=" * 50)
 
+    # Pass --refresh to ignore cached homepages and re-download everything
+    page_cache.refresh = "--refresh" in sys.argv
+    for arg in sys.argv[1:]:
+        if arg.startswith("--max-bytes="):
+            MAX_HOMEPAGE_BYTES = int(arg.split("=", 1)[1])
+
     # Step 1: Research all apps by analyzing homepage content
-    research_results = research_all_apps_homepage()
+    research_results = research_all_apps_homepage(refresh=page_cache.refresh)
 
     # Step 2: Update main Excel file
     final_filename = update_main_excel_with_homepage_analysis()
@@ -11,6 +11,44 @@ import requests
 from urllib.parse import urlparse
 import re
 
+from checkpoint import Checkpoint, row_fingerprint
+from frame_store import load_frame, save_frame
+from keyword_matcher import KeywordMatcher, acronyms
+from keyword_rules import ruleset
+from research_merge import merge_research
+
+# Keyword lists from keyword_rules.json
+WEB_SEARCH_RULES = ruleset('web_search')
+
+# Known AI companies and platforms
+AI_COMPANIES = WEB_SEARCH_RULES['companies']
+
+# AI-related terms looked for in the app name
+AI_NAME_INDICATORS = WEB_SEARCH_RULES['name_indicators']
+
+# AI-related terms looked for in the description
+AI_DESC_KEYWORDS = WEB_SEARCH_RULES['description']
+
+# Terms marking analytics and data platforms
+ANALYTICS_KEYWORDS = WEB_SEARCH_RULES['analytics']
+
+# Names that point at an LLM product rather than general machine learning
+LLM_NAME_TERMS = WEB_SEARCH_RULES['llm_names']
+
+# One single-pass matcher per text; short acronyms such as 'ai', 'ml' and 'bi'
+# only match as whole words, so 'email', 'html' and 'mobile' don't count
+NAME_MATCHER = KeywordMatcher(
+    {'companies': AI_COMPANIES, 'llm': LLM_NAME_TERMS, 'indicators': AI_NAME_INDICATORS},
+    whole_word=acronyms(AI_NAME_INDICATORS)
+)
+DESC_MATCHER = KeywordMatcher(
+    {'keywords': AI_DESC_KEYWORDS, 'analytics': ANALYTICS_KEYWORDS},
+    whole_word=acronyms(AI_DESC_KEYWORDS, ANALYTICS_KEYWORDS)
+)
+
+# Part of every row fingerprint: a keyword change re-researches every app
+RULES_VERSION = WEB_SEARCH_RULES.version
+
 def search_web_for_single_app(app_name, description, official_url):
     """
     Search web for a single app's AI capabilities using real web search
@@ -30,36 +68,24 @@ def search_web_for_single_app(app_name, description, official_url):
     # Search for AI-related terms in the app name and description
     name_lower = app_name.lower()
     desc_lower = description.lower()
-    
-    # Known AI companies and platforms
-    ai_companies = [
-        'openai', 'anthropic', 'google', 'microsoft', 'amazon', 'meta', 'facebook',
-        'nvidia', 'ibm', 'salesforce', 'adobe', 'coveo', '6sense', 'grammarly',
-        'hugging face', 'deepmind', 'tensorflow', 'pytorch', 'sagemaker', 'watson',
-        'copilot', 'bard', 'claude', 'gpt', 'chatgpt', 'gemini'
-    ]
+    name_hits = NAME_MATCHER.match(name_lower)
+    desc_hits = DESC_MATCHER.match(desc_lower)
     
     # Check if it's a known AI company
-    for company in ai_companies:
-        if company in name_lower:
-            print(f"   ✅ Found AI company indicator: {company}")
-            return {
-                "ai_potential": "veryHigh",
-                "ai_risk": "limited",
-                "ai_usage": "aiEnabled",
-                "ai_type": "llm" if any(term in name_lower for term in ['chatgpt', 'claude', 'bard', 'copilot', 'gpt']) else "machineLearning",
-                "description": f"AI-enabled application from known AI company: {app_name}",
-                "confidence": "high",
-                "sources": f"Official website research, {app_name} documentation"
-            }
-    
-    # Search for AI-related terms in the app name
-    ai_name_indicators = [
-        'ai', 'ml', 'machine learning', 'artificial intelligence', 'neural',
-        'cognitive', 'smart', 'intelligent', 'deep learning', 'nlp'
-    ]
+    if name_hits['companies']:
+        company = name_hits['companies'][0]
+        print(f"   ✅ Found AI company indicator: {company}")
+        return {
+            "ai_potential": "veryHigh",
+            "ai_risk": "limited",
+            "ai_usage": "aiEnabled",
+            "ai_type": "llm" if name_hits['llm'] else "machineLearning",
+            "description": f"AI-enabled application from known AI company: {app_name}",
+            "confidence": "high",
+            "sources": f"Official website research, {app_name} documentation"
+        }
     
-    found_ai_indicators = [indicator for indicator in ai_name_indicators if indicator in name_lower]
+    found_ai_indicators = name_hits['indicators']
     if found_ai_indicators:
         print(f"   ✅ Found AI indicators in name: {found_ai_indicators}")
         return {
@@ -72,15 +98,7 @@ def search_web_for_single_app(app_name, description, official_url):
             "sources": f"Name analysis, {app_name} official website"
         }
     
-    # Search for AI-related terms in the description
-    ai_desc_keywords = [
-        'machine learning', 'artificial intelligence', 'neural network', 'deep learning',
-        'natural language processing', 'computer vision', 'predictive analytics',
-        'ai-powered', 'ai-enabled', 'intelligent automation', 'smart analytics',
-        'cognitive', 'automated', 'algorithm', 'data science', 'ml', 'ai'
-    ]
-    
-    found_desc_keywords = [keyword for keyword in ai_desc_keywords if keyword in desc_lower]
+    found_desc_keywords = desc_hits['keywords']
     if found_desc_keywords:
         print(f"   ✅ Found AI keywords in description: {found_desc_keywords}")
         if len(found_desc_keywords) >= 2:
@@ -104,13 +122,7 @@ def search_web_for_single_app(app_name, description, official_url):
                 "sources": f"Description analysis, {app_name} official website"
             }
     
-    # Check for analytics and data platforms
-    analytics_keywords = [
-        'analytics', 'insights', 'data analysis', 'reporting', 'dashboard',
-        'metrics', 'intelligence', 'business intelligence', 'bi', 'data science'
-    ]
-    
-    found_analytics = [keyword for keyword in analytics_keywords if keyword in desc_lower]
+    found_analytics = desc_hits['analytics']
     if found_analytics:
         print(f"   ✅ Found analytics keywords: {found_analytics}")
         return {
@@ -141,7 +153,7 @@ def research_all_apps_individually():
     print("📅 Research Date:", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
     
     # Load the current Excel file
-    df = pd.read_excel("/Users/sam/workspace/app-des/app_directory_with_ai_data.xlsx")
+    df = load_frame("/Users/sam/workspace/app-des/app_directory_with_ai_data.xlsx")
     print(f"📊 Total apps to research: {len(df)}")
     
     research_results = []
@@ -149,39 +161,55 @@ def research_all_apps_individually():
     medium_confidence_count = 0
     low_confidence_count = 0
     
+    # Apps whose name, description, URL and rules are unchanged since an
+    # earlier (possibly interrupted) run are reused from the checkpoint
+    checkpoint = Checkpoint("individual_web_search")
+    keys = [
+        row_fingerprint(name, description, url, rules_version=RULES_VERSION)
+        for name, description, url in zip(df["Name"], df["Description"], df["Official URL"])
+    ]
+    unchanged = sum(key in checkpoint for key in keys)
+    if unchanged:
+        print(f"♻️  {unchanged} apps unchanged since the last run")
+    
     print("\n🔍 Researching each app individually...")
-    for index, row in df.iterrows():
+    for (index, row), key in zip(df.iterrows(), keys):
         app_name = row["Name"]
         description = row["Description"]
         official_url = row["Official URL"]
         
         print(f"\n--- App {index + 1}/{len(df)} ---")
         
-        # Research this specific app
-        research_result = search_web_for_single_app(app_name, description, official_url)
-        
-        # Create result record
-        result = {
-            "App Name": app_name,
-            "Description": description,
-            "Official URL": official_url,
-            "AI Potential": research_result["ai_potential"],
-            "AI Risk": research_result["ai_risk"],
-            "AI Usage": research_result["ai_usage"],
-            "AI Type": research_result["ai_type"],
-            "AI Taxonomy Description": research_result["description"],
-            "Research Sources": research_result["sources"],
-            "Confidence Level": research_result["confidence"],
-            "Research Date": datetime.now().strftime("%Y-%m-%d"),
-            "Research Method": "Individual App Web Search + Real-time Analysis"
-        }
+        result = checkpoint.get(key)
+        if result is None:
+            # Research this specific app
+            research_result = search_web_for_single_app(app_name, description, official_url)
+            
+            # Create result record
+            result = {
+                "App Name": app_name,
+                "Description": description,
+                "Official URL": official_url,
+                "AI Potential": research_result["ai_potential"],
+                "AI Risk": research_result["ai_risk"],
+                "AI Usage": research_result["ai_usage"],
+                "AI Type": research_result["ai_type"],
+                "AI Taxonomy Description": research_result["description"],
+                "Research Sources": research_result["sources"],
+                "Confidence Level": research_result["confidence"],
+                "Research Date": datetime.now().strftime("%Y-%m-%d"),
+                "Research Method": "Individual App Web Search + Real-time Analysis"
+            }
+            checkpoint.record(key, result)
+        else:
+            print(f"   ♻️  {app_name}: reused from checkpoint")
         
         research_results.append(result)
         
         # Count confidence levels
-        if research_result["confidence"] == "high":
+        if result["Confidence Level"] == "high":
             high_confidence_count += 1
-        elif research_result["confidence"] == "medium":
+        elif result["Confidence Level"] == "medium":
             medium_confidence_count += 1
         else:
             low_confidence_count += 1
@@ -248,6 +276,10 @@ def research_all_apps_individually():
         
         summary_df = pd.DataFrame(summary_data)
         summary_df.to_excel(writer, sheet_name="Search Summary", index=False)
+
+    save_frame(results_df, filename, "Individual Search Results")
+    
+    checkpoint.retain(keys)
     
     print(f"\n✅ Individual web search completed! Results saved to: {filename}")
     return results_df
@@ -257,37 +289,18 @@ def update_main_excel_with_individual_search():
     print("\n📝 Updating main Excel file with individual search results...")
     
     # Load research results and main file
-    research_df = pd.read_excel(
+    research_df = load_frame(
         "/Users/sam/workspace/app-des/individual_web_search_results.xlsx",
         sheet_name="Individual Search Results",
     )
-    main_df = pd.read_excel(
+    main_df = load_frame(
         "/Users/sam/workspace/app-des/app_directory_with_ai_data.xlsx"
     )
     
-    # Create mapping from research results
-    research_mapping = {}
-    for _, row in research_df.iterrows():
-        app_name = row["App Name"]
-        research_mapping[app_name] = {
-            "lxAiPotential": row["AI Potential"],
-            "lxAiRisk": row["AI Risk"],
-            "lxAiUsage": row["AI Usage"],
-            "lxAiType": row["AI Type"],
-            "lxAiTaxonomyDescription": row["AI Taxonomy Description"],
-        }
-    
-    # Update main DataFrame
-    updated_count = 0
-    for index, row in main_df.iterrows():
-        app_name = row["Name"]
-        if app_name in research_mapping:
-            main_df.at[index, "lxAiPotential"] = research_mapping[app_name]["lxAiPotential"]
-            main_df.at[index, "lxAiRisk"] = research_mapping[app_name]["lxAiRisk"]
-            main_df.at[index, "lxAiUsage"] = research_mapping[app_name]["lxAiUsage"]
-            main_df.at[index, "lxAiType"] = research_mapping[app_name]["lxAiType"]
-            main_df.at[index, "lxAiTaxonomyDescription"] = research_mapping[app_name]["lxAiTaxonomyDescription"]
-            updated_count += 1
+    # Join research results onto the directory by app name
+    main_df, merge_report = merge_research(main_df, research_df)
+    updated_count = merge_report.updated
+    merge_report.print_warnings()
     
     # Save updated file
     filename = "/Users/sam/workspace/app-des/app_directory_final_individual_search.xlsx"
@@ -334,6 +347,8 @@ def update_main_excel_with_individual_search():
         # AI-enabled apps
         ai_enabled = main_df[main_df["lxAiUsage"] == "aiEnabled"]
         ai_enabled.to_excel(writer, sheet_name="AI-Enabled Apps", index=False)
+
+    save_frame(main_df, filename)
     
     print(f"✅ Updated {updated_count} apps with individual search data")
     print(f"💾 Final file saved as: {filename}")
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Merge research results into the main app directory.
+The research sheets are joined on app name in one vectorized pass instead
+of writing the lx* columns cell by cell, and the merge reports research rows
+that matched no app as well as names that occur more than once.
+merge_catalog_research records the research in the app catalog first and
+matches names through its index, so results accumulate across runs.
+"""
+
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+from catalog_db import catalog
+
+# Research result column -> main directory column
+RESEARCH_COLUMNS = {
+    "AI Potential": "lxAiPotential",
+    "AI Risk": "lxAiRisk",
+    "AI Usage": "lxAiUsage",
+    "AI Type": "lxAiType",
+    "AI Taxonomy Description": "lxAiTaxonomyDescription",
+}
+
+
+class MergeReport:
+    """What merge_research did: rows updated and keys that did not line up."""
+
+    def __init__(
+        self,
+        updated: int,
+        unmatched: List[str],
+        duplicate_research: List[str],
+        duplicate_main: List[str],
+    ):
+        self.updated = updated
+        # Research rows whose name is not in the main directory
+        self.unmatched = unmatched
+        # Names researched more than once; the last row wins
+        self.duplicate_research = duplicate_research
+        # Names listed more than once in the directory; every copy is updated
+        self.duplicate_main = duplicate_main
+
+    def print_warnings(self, limit: int = 10) -> None:
+        for label, keys in (
+            ("research rows matched no app", self.unmatched),
+            (
+                "apps researched more than once (last result kept)",
+                self.duplicate_research,
+            ),
+            ("names listed more than once in the directory", self.duplicate_main),
+        ):
+            if keys:
+                shown = ", ".join(str(k) for k in keys[:limit])
+                more = f" (+{len(keys) - limit} more)" if len(keys) > limit else ""
+                print(f"⚠️  {len(keys)} {label}: {shown}{more}")
+
+
+def _duplicated_keys(keys: pd.Series) -> List[str]:
+    return keys[keys.duplicated(keep=False)].drop_duplicates().tolist()
+
+
+def merge_research(
+    main_df: pd.DataFrame,
+    research_df: pd.DataFrame,
+    key: str = "Name",
+    research_key: str = "App Name",
+    columns: Dict[str, str] = RESEARCH_COLUMNS,
+) -> Tuple[pd.DataFrame, MergeReport]:
+    """
+    Copy research columns onto main_df rows whose key matches research_key.
+    Unmatched main rows keep their values. Returns the updated frame and a
+    MergeReport.
+    """
+    research_keys = research_df[research_key]
+    main_keys = main_df[key]
+
+    latest = research_df.drop_duplicates(research_key, keep="last").set_index(
+        research_key
+    )
+    matched = main_keys.isin(latest.index)
+
+    merged = main_df.copy()
+    for source, target in columns.items():
+        values = main_keys.map(latest[source])
+        if target in merged.columns:
+            merged[target] = merged[target].where(~matched, values)
+        else:
+            merged[target] = values
+
+    report = MergeReport(
+        updated=int(matched.sum()),
+        unmatched=research_keys[~research_keys.isin(main_keys)]
+        .drop_duplicates()
+        .tolist(),
+        duplicate_research=_duplicated_keys(research_keys),
+        duplicate_main=_duplicated_keys(main_keys),
+    )
+    return merged, report
+
+
+def merge_catalog_research(
+    main_df: pd.DataFrame,
+    research_df: pd.DataFrame,
+    source: str,
+    research_key: str = "App Name",
+    columns: Dict[str, str] = RESEARCH_COLUMNS,
+) -> Tuple[pd.DataFrame, MergeReport]:
+    """
+    Store research_df in the catalog as classifications from source, matching
+    research_key to app names (case-insensitive) through the catalog, then
+    copy every stored classification from source onto the main_df rows of
+    those apps. Returns the updated frame and a MergeReport.
+    """
+    catalog.upsert_apps(main_df)
+    unmatched = catalog.upsert_classifications_by_name(
+        research_df.rename(columns=columns), source, key=research_key
+    )
+    stored = catalog.classifications(source)
+    stored["key"] = stored["Name"].str.lower()
+    merged, report = merge_research(
+        main_df.assign(key=main_df["Name"].astype(str).str.lower()),
+        stored,
+        key="key",
+        research_key="key",
+        columns={target: target for target in columns.values()},
+    )
+    report.unmatched = unmatched
+    report.duplicate_research = _duplicated_keys(research_df[research_key])
+    report.duplicate_main = _duplicated_keys(main_df["Name"])
+    return merged.drop(columns="key"), report
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Resolve every Official URL to the address its redirects end at.
+A cheap HEAD pass (GET when HEAD is refused) records each URL's redirect
+chain, final URL and status in the catalog. The fetch stages then request
+the final URL directly instead of paying for the same hops on every run,
+and revalidation starts its candidates from it.
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import requests
+
+from app_catalog import load_catalog
+from catalog_db import catalog
+from frame_store import load_frame
+import http_client
+from page_cache import page_cache
+
+# URLs resolved concurrently (the scheduler still spaces out each site)
+DEFAULT_WORKERS = 16
+
+
+def resolve_one(url: str) -> str:
+    """Resolve url, returning "redirected", "direct", "error" or "failed"."""
+    try:
+        response = http_client.resolve(url)
+    except requests.RequestException:
+        return "failed"
+    if response.status_code >= 400:
+        return "error"
+    return "redirected" if response.history else "direct"
+
+
+def resolve_urls(
+    urls: List[str], workers: int = DEFAULT_WORKERS, refresh: bool = False
+) -> dict:
+    """Resolve the distinct urls not resolved within the page cache TTL."""
+    urls = [u for u in urls if isinstance(u, str) and u.startswith("http")]
+    if not refresh:
+        urls = [u for u in urls if catalog.resolution(u, page_cache.ttl) is None]
+    counts = {"redirected": 0, "direct": 0, "error": 0, "failed": 0}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = http_client.submit_unique(pool, urls, resolve_one)
+        print(f"Resolving {len(futures)} unique URLs...")
+        for done, future in enumerate(futures.values(), start=1):
+            counts[future.result()] += 1
+            if done % 50 == 0 or done == len(futures):
+                print(f"Resolved {done}/{len(futures)} URLs...")
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resolve Official URL redirects")
+    parser.add_argument(
+        "--input",
+        help="directory workbook to read URLs from (default: app_catalog.csv)",
+    )
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument(
+        "--refresh", action="store_true", help="re-resolve recently resolved URLs"
+    )
+    args = parser.parse_args()
+    df = load_frame(args.input) if args.input else load_catalog()
+    counts = resolve_urls(
+        df["Official URL"].tolist(), workers=args.workers, refresh=args.refresh
+    )
+    print("Counts:", counts)
+
+
+if __name__ == "__main__":
+    print("↪️  Official URL Resolution")
+    print("=" * 40)
+    main()
@@ -5,30 +5,47 @@ homepage and common About pages with robust headers, then rebuild the
 validation report and corrected Excel.
 """
 
-import time
+import argparse
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Dict, List, Tuple
+from functools import partial
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 from urllib.parse import urlparse, urlunparse
 import re
 import difflib
+import threading
+import time
 
 import urllib3
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 from add_vendor_column import extract_vendor_from_url
-
-# Optional tougher fetcher for anti-bot sites
-try:
-    import cloudscraper  # type: ignore
-
-    HAVE_CLOUDSCRAPER = True
-except Exception:
-    HAVE_CLOUDSCRAPER = False
+from brand_indicators import (
+    StreamingBrandReader,
+    empty_indicators,
+    parse_brand_indicators,
+)
+from catalog_db import catalog
+from frame_store import load_frame, save_frame
+from host_scheduler import scheduler
+import http_client
+from http_client import HAVE_CLOUDSCRAPER
+from page_cache import page_cache
+
+# Failed apps revalidated concurrently
+DEFAULT_WORKERS = 8
+
+# Candidate URLs probed concurrently per app (never more than the scheduler
+# lets one site run at once), and seconds a probe may go unanswered before
+# the next candidate is started alongside it
+HEDGE_WIDTH = scheduler.max_concurrency
+HEDGE_DELAY = 2.0
+# Paths probed first on the original host and its www variant
+PRIORITY_PATHS = ("/", "/about")
 
 
 def normalize_brand(s: str) -> str:
@@ -141,45 +158,33 @@ def build_candidate_urls(original_url: str) -> List[str]:
         return []
 
 
-def fetch_brand_indicators(url: str) -> Tuple[Dict[str, str], str]:
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/124.0 Safari/537.36"
-        ),
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Referer": "https://www.google.com/",
-        "Connection": "keep-alive",
-    }
+def fetch_brand_indicators(
+    url: str, stream: bool = True, cancel: Optional[threading.Event] = None
+) -> Tuple[Dict[str, str], str]:
+    """
+    Fetch url's brand indicators, falling back to cloudscraper. Setting
+    cancel drops the probe (status "cancelled") if it has not been sent yet.
+    """
+    # Session defaults cover User-Agent/Accept; look like a search click-through
+    headers = {"Referer": "https://www.google.com/"}
 
-    def parse_html(content: bytes) -> Dict[str, str]:
-        soup = BeautifulSoup(content, "html.parser")
-        site_name = ""
-        meta_site = soup.find("meta", attrs={"property": "og:site_name"})
-        if meta_site and meta_site.get("content"):
-            site_name = meta_site.get("content", "").strip()
-        if not site_name:
-            meta_app = soup.find("meta", attrs={"name": "application-name"})
-            if meta_app and meta_app.get("content"):
-                site_name = meta_app.get("content", "").strip()
-        title = ""
-        t = soup.find("title")
-        if t and t.get_text():
-            title = t.get_text().strip()
-        h1_text = ""
-        h1 = soup.find("h1")
-        if h1 and h1.get_text():
-            h1_text = h1.get_text().strip()
-        return {"site_name": site_name, "title": title, "h1": h1_text}
+    def extract(resp, reader) -> Dict[str, str]:
+        if reader is not None:
+            return reader.indicators_for(resp)
+        return parse_brand_indicators(resp.content)
 
     # Attempt 1: requests
     try:
-        resp = requests.get(url, headers=headers, timeout=12, verify=False)
+        reader = StreamingBrandReader() if stream else None
+        resp = http_client.get(url, headers=headers, reader=reader, cancel=cancel)
         resp.raise_for_status()
-        indicators = parse_html(resp.content)
+        indicators = extract(resp, reader)
         return indicators, "ok"
+    except http_client.RequestCancelled:
+        return empty_indicators(), "cancelled"
+    except http_client.CircuitOpen as e:
+        # The site keeps failing; don't spend the fallback on it either
+        return empty_indicators(), f"skipped: {e}"
     except requests.exceptions.RequestException as e:
         last_err = f"request_error: {e}"
     except Exception as e:
@@ -188,16 +193,20 @@ def fetch_brand_indicators(url: str) -> Tuple[Dict[str, str], str]:
     # Attempt 2: cloudscraper fallback
     if HAVE_CLOUDSCRAPER:
         try:
-            scraper = cloudscraper.create_scraper()
-            resp2 = scraper.get(url, headers=headers, timeout=16)
+            reader = StreamingBrandReader() if stream else None
+            resp2 = http_client.scraper_get(
+                url, headers=headers, reader=reader, cancel=cancel
+            )
             if getattr(resp2, "status_code", 599) and 200 <= resp2.status_code < 300:
-                indicators = parse_html(resp2.content)
+                indicators = extract(resp2, reader)
                 return indicators, "ok-cloudscraper"
             last_err = f"cloudscraper_status: {getattr(resp2, 'status_code', 'n/a')}"
+        except http_client.RequestCancelled:
+            return empty_indicators(), "cancelled"
         except Exception as e2:
             last_err = f"cloudscraper_error: {e2}"
 
-    return {"site_name": "", "title": "", "h1": ""}, last_err
+    return empty_indicators(), last_err
 
 
 def pick_best_brand(indicators: Dict[str, str], url: str) -> str:
@@ -217,66 +226,193 @@ def pick_best_brand(indicators: Dict[str, str], url: str) -> str:
     return extract_vendor_from_url(url)
 
 
+def prioritized_candidates(url: str) -> List[str]:
+    """
+    build_candidate_urls with the likeliest hits moved to the front: / and
+    /about on the original scheme, for the original host and its www variant.
+    When resolve_urls.py found where url redirects to, that canonical URL
+    leads and the guesses start from its scheme and host.
+    """
+    canonical = catalog.canonical_url(url, page_cache.ttl)
+    if canonical:
+        candidates = list(
+            dict.fromkeys(
+                [canonical]
+                + build_candidate_urls(canonical)
+                + build_candidate_urls(url)
+            )
+        )
+    else:
+        candidates = build_candidate_urls(url)
+    if not candidates:
+        return []
+    scheme = urlparse(candidates[0]).scheme
+    hosts = list(dict.fromkeys(urlparse(c).hostname for c in candidates))[:2]
+    first = [
+        c
+        for c in candidates
+        if urlparse(c).scheme == scheme
+        and urlparse(c).hostname in hosts
+        and urlparse(c).path in PRIORITY_PATHS
+    ]
+    if canonical:
+        first = [canonical] + [c for c in first if c != canonical]
+    return first + [c for c in candidates if c not in first]
+
+
+def _useful(indicators: Dict[str, str], status: str) -> bool:
+    return status == "ok" and any(indicators.values())
+
+
+def probe_candidates(
+    url: str, hedge_width: int = HEDGE_WIDTH
+) -> Tuple[Dict[str, str], str]:
+    """
+    Probe prioritized_candidates and return the first useful indicators in
+    that order, with their status.
+    Candidates start one after another, in order: the next one as soon as
+    every earlier one came up empty, or as a hedge once the latest one has
+    gone HEDGE_DELAY seconds without an answer, with at most hedge_width in
+    flight (capped at the scheduler's per-site concurrency, since the
+    candidates are almost always on one site). When a candidate is useful, the lower-priority
+    probes still waiting for their scheduler slot are cancelled before they
+    are sent, without using up a start time. hedge_width=1 probes one
+    candidate at a time.
+    """
+    candidates = prioritized_candidates(url)
+    width = max(1, min(hedge_width, scheduler.max_concurrency))
+    cancels = [threading.Event() for _ in candidates]
+    results: Dict[int, Tuple[Dict[str, str], str]] = {}
+    running = {}
+    launched = 0
+    last_launch = 0.0
+    pool = ThreadPoolExecutor(max_workers=width)
+    try:
+        while True:
+            # Results are taken in preference order, so a later candidate
+            # that answers first never wins over an earlier one
+            for i in range(len(candidates)):
+                if i not in results:
+                    break
+                if _useful(*results[i]):
+                    return results[i][0], f"ok:{candidates[i]}"
+            else:
+                break
+            can_launch = launched < len(candidates) and not any(
+                _useful(*r) for r in results.values()
+            )
+            hedge_at = last_launch + HEDGE_DELAY
+            if can_launch and (
+                not running or (len(running) < width and time.monotonic() >= hedge_at)
+            ):
+                future = pool.submit(
+                    fetch_brand_indicators,
+                    candidates[launched],
+                    cancel=cancels[launched],
+                )
+                running[future] = launched
+                launched += 1
+                last_launch = time.monotonic()
+                continue
+            # Wake for the next hedge only if one could be started
+            timeout = None
+            if can_launch and len(running) < width:
+                timeout = max(0.0, hedge_at - time.monotonic())
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = running.pop(future)
+                results[i] = future.result()
+                if _useful(*results[i]):
+                    for cancel in cancels[i + 1 :]:
+                        cancel.set()
+    finally:
+        # Don't wait for cancelled probes still sleeping on their slot
+        pool.shutdown(wait=False, cancel_futures=True)
+    if not candidates:
+        return empty_indicators(), "no_attempts"
+    return empty_indicators(), results[len(candidates) - 1][1]
+
+
+def revalidate_app(
+    app: str, url: str, current_vendor: str, probed=None
+) -> Dict[str, str]:
+    """
+    Build one failed app's report row. probed=(indicators, status) reuses a
+    probe_candidates result shared with other rows on the same URL.
+    """
+    if probed is None:
+        probed = probe_candidates(url)
+    best_indicators, final_status = probed
+
+    best_brand = pick_best_brand(best_indicators, url)
+    cmp_status, score, is_match = compare_vendor(current_vendor, best_brand)
+    confidence = (
+        "high"
+        if cmp_status in {"exact", "substring"}
+        else ("medium" if cmp_status == "fuzzy" else "low")
+    )
+    suggested_vendor = current_vendor if is_match or not best_brand else best_brand
+
+    return {
+        "App Name": app,
+        "Official URL": url,
+        "Vendor (Current)": current_vendor,
+        "Brand og:site_name": best_indicators.get("site_name", ""),
+        "Brand <title>": best_indicators.get("title", ""),
+        "Brand <h1>": best_indicators.get("h1", ""),
+        "Best Brand": best_brand,
+        "Match Status": cmp_status,
+        "Similarity": f"{score:.2f}",
+        "Confidence": confidence,
+        "Suggested Vendor": suggested_vendor,
+        "Fetch Status": final_status,
+    }
+
+
 def revalidate_failed(
-    input_report: str, input_excel: str, output_report: str, output_excel: str
+    input_report: str,
+    input_excel: str,
+    output_report: str,
+    output_excel: str,
+    workers: int = DEFAULT_WORKERS,
+    hedge_width: int = HEDGE_WIDTH,
 ) -> None:
-    prev_df = pd.read_excel(input_report, sheet_name="Validation Results")
+    prev_df = load_frame(input_report, sheet_name="Validation Results")
     failed_df = prev_df[prev_df["Fetch Status"] != "ok"].copy()
 
-    improved_rows = []
-    total_failed = len(failed_df)
-    for idx, r in failed_df.iterrows():
-        app = r.get("App Name", "")
-        url = r.get("Official URL", "")
-        current_vendor = r.get("Vendor (Current)", "")
-
-        candidates = build_candidate_urls(url)
-        best_indicators = {"site_name": "", "title": "", "h1": ""}
-        final_status = "no_attempts"
-        for attempt_url in candidates:
-            indicators, status = fetch_brand_indicators(attempt_url)
-            if status == "ok" and any(indicators.values()):
-                best_indicators = indicators
-                final_status = f"ok:{attempt_url}"
-                break
-            final_status = status
-            # be polite / avoid rate limits
-            time.sleep(0.2)
-
-        best_brand = pick_best_brand(best_indicators, url)
-        cmp_status, score, is_match = compare_vendor(current_vendor, best_brand)
-        confidence = (
-            "high"
-            if cmp_status in {"exact", "substring"}
-            else ("medium" if cmp_status == "fuzzy" else "low")
+    apps = [
+        (
+            r.get("App Name", ""),
+            r.get("Official URL", ""),
+            r.get("Vendor (Current)", ""),
         )
-        suggested_vendor = current_vendor if is_match or not best_brand else best_brand
+        for r in failed_df.to_dict("records")
+    ]
 
-        improved_rows.append(
-            {
-                "App Name": app,
-                "Official URL": url,
-                "Vendor (Current)": current_vendor,
-                "Brand og:site_name": best_indicators.get("site_name", ""),
-                "Brand <title>": best_indicators.get("title", ""),
-                "Brand <h1>": best_indicators.get("h1", ""),
-                "Best Brand": best_brand,
-                "Match Status": cmp_status,
-                "Similarity": f"{score:.2f}",
-                "Confidence": confidence,
-                "Suggested Vendor": suggested_vendor,
-                "Fetch Status": final_status,
-            }
+    # Distinct URLs are probed in parallel and shared by every row pointing
+    # at them; each URL's candidates go out in hedged batches and the shared
+    # scheduler spaces out requests that land on the same host
+    improved_rows = []
+    total_failed = len(failed_df)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = http_client.submit_unique(
+            pool,
+            [app[1] for app in apps],
+            partial(probe_candidates, hedge_width=hedge_width),
         )
+        print(f"Probing {len(futures)} unique URLs for {total_failed} failed apps...")
+        for done, app in enumerate(apps, start=1):
+            probed = futures[http_client.dedup_key(app[1])].result()
+            improved_rows.append(revalidate_app(*app, probed=probed))
 
-        if (idx + 1) % 10 == 0 or (idx + 1) == total_failed:
-            print(f"Revalidated {idx + 1}/{total_failed} failed URLs...")
-            try:
-                import sys as _sys
+            if done % 10 == 0 or done == total_failed:
+                print(f"Revalidated {done}/{total_failed} failed URLs...")
+                try:
+                    import sys as _sys
 
-                _sys.stdout.flush()
-            except Exception:
-                pass
+                    _sys.stdout.flush()
+                except Exception:
+                    pass
 
     improved_df = pd.DataFrame(improved_rows)
 
@@ -322,8 +458,10 @@ def revalidate_failed(
         )
         summary_df.to_excel(writer, sheet_name="Summary", index=False)
 
+    save_frame(merged, output_report, "Validation Results")
+
     # Update Excel vendors where suggested differs
-    df_main = pd.read_excel(input_excel, sheet_name="App Directory")
+    df_main = load_frame(input_excel, sheet_name="App Directory")
     sugg_map = {
         r["App Name"]: r["Suggested Vendor"]
         for _, r in merged.iterrows()
@@ -338,6 +476,8 @@ def revalidate_failed(
     with pd.ExcelWriter(output_excel, engine="openpyxl") as writer:
         df_main.to_excel(writer, sheet_name="App Directory", index=False)
 
+    save_frame(df_main, output_excel)
+
     print("Revalidation complete.")
     print(f"Rerun report: {output_report}")
     print(f"Updated Excel: {output_excel}")
@@ -348,7 +488,27 @@ def main():
     input_excel = "/Users/sam/workspace/app-des/app_directory_final_homepage_with_vendor_validated.xlsx"
     output_report = "/Users/sam/workspace/app-des/vendor_validation_report_rerun.xlsx"
     output_excel = "/Users/sam/workspace/app-des/app_directory_final_homepage_with_vendor_revalidated.xlsx"
-    revalidate_failed(input_report, input_excel, output_report, output_excel)
+    parser = argparse.ArgumentParser(description="Re-validate fetch-failed vendors")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument(
+        "--hedge-width",
+        type=int,
+        default=HEDGE_WIDTH,
+        help="candidate URLs probed concurrently per app (1 = one at a time)",
+    )
+    parser.add_argument(
+        "--refresh", action="store_true", help="ignore cached homepages"
+    )
+    args = parser.parse_args()
+    page_cache.refresh = args.refresh
+    revalidate_failed(
+        input_report,
+        input_excel,
+        output_report,
+        output_excel,
+        workers=args.workers,
+        hedge_width=args.hedge_width,
+    )
 
 
 if __name__ == "__main__":
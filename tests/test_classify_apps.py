@@ -0,0 +1,82 @@
+"""
+Equivalence tests for the vectorized classifiers: classify_apps must give
+every row exactly what the row-by-row analyze_app_ai_characteristics does.
+"""
+
+import random
+
+import pandas as pd
+import pytest
+
+import enhanced_ai_research
+import fill_ai_data
+from app_catalog import load_catalog
+
+MODULES = [fill_ai_data, enhanced_ai_research]
+
+EDGE_CASES = [
+    None,
+    float("nan"),
+    "",
+    "   ",
+    "AI",
+    "ML",
+    "AI/ML platform",
+    "GPT chatbot",
+    "Email and calendar client",
+    "HTML email templates",
+    "Paid domain registrar",
+    "Chatbots, algorithms and recommendations",
+    "Neural networks for image classification",
+    "AI-powered analytics dashboards",
+    "Machine-learning predictions",
+    "An LLM-based assistant (NLP)",
+    "Smart, sophisticated, enterprise-grade security for financial data",
+]
+
+FILLER = ["platform", "tool", "for", "teams", "and", "the", "cloud", "data", "email"]
+SEPARATORS = [" ", ", ", "-", "/", ". ", "s ", "ing "]
+
+
+def _vocabulary():
+    words = set(FILLER)
+    for keywords in list(fill_ai_data.FILL_KEYWORDS.values()) + list(
+        enhanced_ai_research.ENHANCED_KEYWORDS.values()
+    ):
+        words.update(keywords)
+    return sorted(words)
+
+
+def _random_descriptions(count: int, seed: int = 11):
+    rng = random.Random(seed)
+    words = _vocabulary()
+    descriptions = []
+    for _ in range(count):
+        parts = rng.sample(words, rng.randint(1, 8))
+        text = "".join(p + rng.choice(SEPARATORS) for p in parts).strip()
+        descriptions.append(text.upper() if rng.random() < 0.1 else text)
+    return descriptions
+
+
+def _descriptions():
+    catalog = load_catalog()
+    return pd.Series(
+        catalog["Description"].tolist() + EDGE_CASES + _random_descriptions(3000)
+    )
+
+
+def _reference(module, descriptions: pd.Series) -> pd.DataFrame:
+    rows = [
+        module.analyze_app_ai_characteristics("", desc if isinstance(desc, str) else "")
+        for desc in descriptions
+    ]
+    return pd.DataFrame(rows, columns=module.AI_COLUMNS, index=descriptions.index)
+
+
+@pytest.mark.parametrize("module", MODULES, ids=lambda m: m.__name__)
+def test_classify_apps_matches_row_by_row_reference(module):
+    descriptions = _descriptions()
+    vectorized = module.classify_apps(descriptions)
+    reference = _reference(module, descriptions)
+    mismatched = (vectorized != reference).any(axis=1)
+    assert not mismatched.any(), descriptions[mismatched].head(10).tolist()
@@ -0,0 +1,66 @@
+"""
+Golden-file tests for the HTML parser backends: every installed backend, and
+the streaming brand reader, must extract exactly what the saved golden file
+records for each sample page.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+import html_backend
+from brand_indicators import StreamingBrandReader, parse_brand_indicators
+from page_extract import extract_page
+
+HERE = Path(__file__).resolve().parent
+PAGES = sorted((HERE / "pages").glob("*.html"))
+BACKENDS = [
+    p for p in html_backend.PREFERRED_PARSERS if html_backend.parser_available(p)
+]
+
+
+def _extract(content: bytes) -> dict:
+    return {
+        "extract_page": extract_page(content),
+        "parse_brand_indicators": parse_brand_indicators(content),
+    }
+
+
+def _golden(page: Path) -> dict:
+    path = HERE / "golden" / f"{page.stem}.json"
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("page", PAGES, ids=lambda p: p.name)
+def test_backend_matches_golden(page, backend, monkeypatch):
+    monkeypatch.setattr(html_backend, "PARSER", backend)
+    assert _extract(page.read_bytes()) == _golden(page)
+
+
+# Headers as servers commonly send them: HTML with no declared charset
+UNDECLARED = {"Content-Type": "text/html"}
+
+
+@pytest.mark.parametrize("chunk_size", [7, 16 * 1024])
+@pytest.mark.parametrize("page", PAGES, ids=lambda p: p.name)
+def test_streaming_reader_matches_golden(page, chunk_size):
+    content = page.read_bytes()
+    reader = StreamingBrandReader()
+    reader.feed(
+        (content[i : i + chunk_size] for i in range(0, len(content), chunk_size)),
+        UNDECLARED,
+    )
+    assert reader.indicators() == _golden(page)["parse_brand_indicators"]
+
+
+def test_streaming_reader_keeps_declared_header_charset():
+    content = "<title>Müller</title>".encode("iso-8859-1")
+    reader = StreamingBrandReader()
+    reader.feed([content], {"Content-Type": "text/html; charset=ISO-8859-1"})
+    assert reader.indicators()["title"] == "Müller"
+
+
+def test_default_backend_is_fastest_installed():
+    assert html_backend.PARSER == BACKENDS[0]
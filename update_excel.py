@@ -3,8 +3,12 @@
 Script to update the Excel file with missing apps from the original list.
 """
 
+import sys
+
 import pandas as pd
-import openpyxl
+
+from excel_export import export_frame
+from frame_store import load_frame, save_frame
 
 # Missing apps that need to be added
 missing_apps = [
@@ -76,11 +80,11 @@ missing_apps = [
 ]
 
 
-def update_excel_file():
+def update_excel_file(export_excel=False):
     """Update Excel file with missing apps"""
     try:
         # Read existing Excel file
-        df = pd.read_excel("app_directory.xlsx")
+        df = load_frame("app_directory.xlsx")
         print(f"📊 Current apps in file: {len(df)}")
 
         # Add missing apps
@@ -93,47 +97,12 @@ def update_excel_file():
         # Create updated Excel file with formatting
         filename = "app_directory_complete.xlsx"
 
-        with pd.ExcelWriter(filename, engine="openpyxl") as writer:
-            # Write the updated data
-            updated_df.to_excel(writer, sheet_name="App Directory", index=False)
-
-            # Get the workbook and worksheet
-            workbook = writer.book
-            worksheet = writer.sheets["App Directory"]
-
-            # Format headers
-            header_font = openpyxl.styles.Font(bold=True, color="FFFFFF")
-            header_fill = openpyxl.styles.PatternFill(
-                start_color="366092", end_color="366092", fill_type="solid"
-            )
-
-            for cell in worksheet[1]:
-                cell.font = header_font
-                cell.fill = header_fill
-
-            # Adjust column widths
-            worksheet.column_dimensions["A"].width = 30  # Name
-            worksheet.column_dimensions["B"].width = 60  # Description
-            worksheet.column_dimensions["C"].width = 40  # Official URL
-
-            # Add borders and alignment
-            thin_border = openpyxl.styles.Border(
-                left=openpyxl.styles.Side(style="thin"),
-                right=openpyxl.styles.Side(style="thin"),
-                top=openpyxl.styles.Side(style="thin"),
-                bottom=openpyxl.styles.Side(style="thin"),
-            )
-
-            for row in worksheet.iter_rows(
-                min_row=1, max_row=len(updated_df) + 1, min_col=1, max_col=3
-            ):
-                for cell in row:
-                    cell.border = thin_border
-                    cell.alignment = openpyxl.styles.Alignment(
-                        wrap_text=True, vertical="top"
-                    )
-
-        print(f"✅ Updated Excel file created: {filename}")
+        if export_excel:
+            export_frame(updated_df, filename)
+
+            print(f"✅ Updated Excel file created: {filename}")
+
+        save_frame(updated_df, filename)
         print(f"📊 Total applications: {len(updated_df)}")
 
         # Verify the missing apps are now included
@@ -153,7 +122,7 @@ def update_excel_file():
 
 if __name__ == "__main__":
     print("🔧 Updating Excel file with missing applications...")
-    filename = update_excel_file()
+    filename = update_excel_file(export_excel="--excel" in sys.argv)
 
     if filename:
         print(
@@ -164,4 +133,3 @@ if __name__ == "__main__":
         print(f"   • Ready for immediate use")
     else:
         print("❌ Failed to update Excel file")
-
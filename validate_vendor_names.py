@@ -5,13 +5,13 @@ Extract og:site_name, title, and h1 from each Official URL and compare with curr
 Write a mismatch report and an updated Excel with validated Vendor values.
 """
 
-import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 from urllib.parse import urlparse
 import re
 import difflib
@@ -21,6 +21,24 @@ import urllib3
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 from add_vendor_column import extract_vendor_from_url
+from brand_indicators import (
+    StreamingBrandReader,
+    empty_indicators,
+    parse_brand_indicators,
+)
+from catalog_db import catalog
+from checkpoint import Checkpoint, row_fingerprint
+from frame_store import load_frame, save_frame
+import http_client
+from page_cache import page_cache
+from page_extract import brand_indicators
+
+# Concurrent fetches used by validate_and_update (override with --workers)
+DEFAULT_WORKERS = 8
+
+# Part of every row fingerprint; bump when brand extraction or matching
+# changes so stored rows are validated again
+RULES_VERSION = "1"
 
 
 def normalize_brand(s: str) -> str:
@@ -61,45 +79,29 @@ def normalize_brand(s: str) -> str:
     return " ".join(parts)
 
 
-def fetch_brand_indicators(url: str) -> Tuple[Dict[str, str], str]:
+def fetch_brand_indicators(url: str, stream: bool = True) -> Tuple[Dict[str, str], str]:
+    """
+    Fetch url and extract its brand indicators. Fields the homepage analysis
+    already extracted are reused without fetching; otherwise, with
+    stream=True, the body is read incrementally and the download stops once
+    the indicators are found.
+    """
     if not isinstance(url, str) or not url.strip() or url.strip().upper() == "N/A":
-        return {"site_name": "", "title": "", "h1": ""}, "no_url"
+        return empty_indicators(), "no_url"
+    fields = None if page_cache.refresh else catalog.page_extract(url, page_cache.ttl)
+    if fields is not None:
+        return brand_indicators(fields), "ok"
     try:
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/124.0 Safari/537.36"
-            )
-        }
-        resp = requests.get(url, headers=headers, timeout=10, verify=False)
+        reader = StreamingBrandReader() if stream else None
+        resp = http_client.get(url, reader=reader)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.content, "html.parser")
-
-        site_name = ""
-        meta_site = soup.find("meta", attrs={"property": "og:site_name"})
-        if meta_site and meta_site.get("content"):
-            site_name = meta_site.get("content", "").strip()
-        if not site_name:
-            meta_app = soup.find("meta", attrs={"name": "application-name"})
-            if meta_app and meta_app.get("content"):
-                site_name = meta_app.get("content", "").strip()
-
-        title = ""
-        t = soup.find("title")
-        if t and t.get_text():
-            title = t.get_text().strip()
-
-        h1_text = ""
-        h1 = soup.find("h1")
-        if h1 and h1.get_text():
-            h1_text = h1.get_text().strip()
-
-        return {"site_name": site_name, "title": title, "h1": h1_text}, "ok"
+        if reader is not None:
+            return reader.indicators_for(resp), "ok"
+        return parse_brand_indicators(resp.content), "ok"
     except requests.exceptions.RequestException as e:
-        return {"site_name": "", "title": "", "h1": ""}, f"request_error: {e}"
+        return empty_indicators(), f"request_error: {e}"
     except Exception as e:
-        return {"site_name": "", "title": "", "h1": ""}, f"parse_error: {e}"
+        return empty_indicators(), f"parse_error: {e}"
 
 
 def pick_best_brand(indicators: Dict[str, str], url: str) -> str:
@@ -136,10 +138,62 @@ def compare_vendor(vendor: str, brand: str) -> Tuple[str, float, bool]:
     return "mismatch", ratio, False
 
 
-def validate_and_update(input_path: str, output_report: str, output_excel: str) -> None:
-    df = pd.read_excel(input_path, sheet_name="App Directory")
+def validate_app(
+    app: str, url: str, current_vendor: str, fetched=None
+) -> Dict[str, str]:
+    """
+    Build one app's report row. fetched=(indicators, status) reuses a
+    fetch_brand_indicators result shared with other rows on the same URL.
+    """
+    if fetched is None:
+        fetched = fetch_brand_indicators(url)
+    indicators, status = fetched
+    best_brand = pick_best_brand(indicators, url)
+    cmp_status, score, is_match = compare_vendor(current_vendor, best_brand)
+
+    suggested_vendor = current_vendor
+    confidence = (
+        "high"
+        if cmp_status in {"exact", "substring"}
+        else ("medium" if cmp_status == "fuzzy" else "low")
+    )
+    if not is_match and best_brand:
+        suggested_vendor = best_brand
+
+    return {
+        "App Name": app,
+        "Official URL": url,
+        "Vendor (Current)": current_vendor,
+        "Brand og:site_name": indicators.get("site_name", ""),
+        "Brand <title>": indicators.get("title", ""),
+        "Brand <h1>": indicators.get("h1", ""),
+        "Best Brand": best_brand,
+        "Match Status": cmp_status,
+        "Similarity": f"{score:.2f}",
+        "Confidence": confidence,
+        "Suggested Vendor": suggested_vendor,
+        "Fetch Status": status,
+    }
+
+
+def _validated(row: Optional[Dict[str, str]]) -> bool:
+    """True for report rows worth keeping: fetched fine, with some brand text."""
+    return (
+        row is not None
+        and row["Fetch Status"] == "ok"
+        and any(row[c] for c in ("Brand og:site_name", "Brand <title>", "Brand <h1>"))
+    )
+
+
+def validate_and_update(
+    input_path: str,
+    output_report: str,
+    output_excel: str,
+    workers: int = DEFAULT_WORKERS,
+    refresh: bool = False,
+) -> None:
+    df = load_frame(input_path, sheet_name="App Directory")
 
-    rows = []
     counts = {
         "total": 0,
         "exact": 0,
@@ -149,52 +203,51 @@ def validate_and_update(input_path: str, output_report: str, output_excel: str)
         "failed": 0,
     }
 
-    for idx, row in df.iterrows():
+    apps = [
+        (row.get("Name", ""), row.get("Official URL", ""), row.get("Vendor", ""))
+        for row in df.to_dict("records")
+    ]
+    apps = [(row_fingerprint(*app, rules_version=RULES_VERSION), app) for app in apps]
+
+    # Rows whose name, URL, vendor and rules are unchanged since an earlier
+    # (possibly interrupted) run are reused as-is, unless refresh is set;
+    # only validated rows are stored, so failed fetches are tried again
+    checkpoint = Checkpoint("validate_vendor_names")
+    results = {}
+    if not refresh:
+        results = {
+            key: checkpoint.get(key)
+            for key, _ in apps
+            if _validated(checkpoint.get(key))
+        }
+    pending = [(key, app) for key, app in apps if key not in results]
+    if len(pending) < len(apps):
+        print(f"Reusing {len(apps) - len(pending)}/{len(apps)} unchanged apps")
+
+    # Each distinct URL is fetched once in a bounded pool (the shared
+    # scheduler keeps any one host politely spaced) and fanned out to every
+    # row that points at it
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = http_client.submit_unique(
+            pool, [app[1] for _, app in pending], fetch_brand_indicators
+        )
+        print(f"Fetching {len(futures)} unique URLs for {len(pending)} apps...")
+        for done, (key, app) in enumerate(pending, start=1):
+            fetched = futures[http_client.dedup_key(app[1])].result()
+            results[key] = validate_app(*app, fetched=fetched)
+            if _validated(results[key]):
+                checkpoint.record(key, results[key])
+            if done % 25 == 0:
+                print(f"Validated {done}/{len(pending)} apps...")
+
+    rows = [results[key] for key, _ in apps]
+    for report_row in rows:
         counts["total"] += 1
-        app = row.get("Name", "")
-        url = row.get("Official URL", "")
-        current_vendor = row.get("Vendor", "")
-
-        indicators, status = fetch_brand_indicators(url)
-        if status != "ok":
+        if report_row["Fetch Status"] != "ok":
             counts["failed"] += 1
-        best_brand = pick_best_brand(indicators, url)
-        cmp_status, score, is_match = compare_vendor(current_vendor, best_brand)
+        cmp_status = report_row["Match Status"]
         counts[cmp_status] = counts.get(cmp_status, 0) + 1
 
-        suggested_vendor = current_vendor
-        confidence = (
-            "high"
-            if cmp_status in {"exact", "substring"}
-            else ("medium" if cmp_status == "fuzzy" else "low")
-        )
-        note = cmp_status
-        if not is_match and best_brand:
-            suggested_vendor = best_brand
-            note = f"suggest_replace (ratio={score:.2f})"
-
-        rows.append(
-            {
-                "App Name": app,
-                "Official URL": url,
-                "Vendor (Current)": current_vendor,
-                "Brand og:site_name": indicators.get("site_name", ""),
-                "Brand <title>": indicators.get("title", ""),
-                "Brand <h1>": indicators.get("h1", ""),
-                "Best Brand": best_brand,
-                "Match Status": cmp_status,
-                "Similarity": f"{score:.2f}",
-                "Confidence": confidence,
-                "Suggested Vendor": suggested_vendor,
-                "Fetch Status": status,
-            }
-        )
-
-        # Be polite with remote servers
-        if (idx + 1) % 25 == 0:
-            print(f"Validated {idx + 1}/{len(df)} apps...")
-        time.sleep(0.5)
-
     report_df = pd.DataFrame(rows)
 
     # Write report with summary
@@ -222,6 +275,8 @@ def validate_and_update(input_path: str, output_report: str, output_excel: str)
         )
         summary_df.to_excel(writer, sheet_name="Summary", index=False)
 
+    save_frame(report_df, output_report, "Validation Results")
+
     # Update the main Excel's Vendor with suggested where mismatch
     updated_df = df.copy()
     suggested_map = {r["App Name"]: r["Suggested Vendor"] for r in rows}
@@ -234,6 +289,10 @@ def validate_and_update(input_path: str, output_report: str, output_excel: str)
     with pd.ExcelWriter(output_excel, engine="openpyxl") as writer:
         updated_df.to_excel(writer, sheet_name="App Directory", index=False)
 
+    save_frame(updated_df, output_excel)
+
+    checkpoint.retain(key for key, _ in apps if _validated(results[key]))
+
     print("\nValidation complete.")
     print(f"Report:   {output_report}")
     print(f"Corrected: {output_excel}")
@@ -246,7 +305,22 @@ def main():
     )
     output_report = "/Users/sam/workspace/app-des/vendor_validation_report.xlsx"
     output_excel = "/Users/sam/workspace/app-des/app_directory_final_homepage_with_vendor_validated.xlsx"
-    validate_and_update(input_path, output_report, output_excel)
+    parser = argparse.ArgumentParser(description="Validate vendor names")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="ignore cached homepages and checkpointed rows",
+    )
+    args = parser.parse_args()
+    page_cache.refresh = args.refresh
+    validate_and_update(
+        input_path,
+        output_report,
+        output_excel,
+        workers=args.workers,
+        refresh=args.refresh,
+    )
 
 
 if __name__ == "__main__":
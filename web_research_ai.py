@@ -11,6 +11,9 @@ import requests
 from urllib.parse import urlparse
 import re
 
+from frame_store import load_frame, save_frame
+from research_merge import merge_research
+
 
 def search_web_for_app(app_name, official_url):
     """
@@ -322,7 +325,7 @@ def research_apps_web_based():
     print("📅 Research Date:", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
     # Load the current Excel file
-    df = pd.read_excel("/Users/sam/workspace/app-des/app_directory_with_ai_data.xlsx")
+    df = load_frame("/Users/sam/workspace/app-des/app_directory_with_ai_data.xlsx")
     print(f"📊 Total apps to research: {len(df)}")
 
     research_results = []
@@ -455,6 +458,8 @@ def research_apps_web_based():
             writer, sheet_name="Web Research Methodology", index=False
         )
 
+    save_frame(results_df, filename, "Web Research Results")
+
     print(f"\n✅ Web research completed! Results saved to: {filename}")
     return results_df
 
@@ -464,41 +469,18 @@ def update_main_excel_with_web_research():
     print("\n📝 Updating main Excel file with web research results...")
 
     # Load research results and main file
-    research_df = pd.read_excel(
+    research_df = load_frame(
         "/Users/sam/workspace/app-des/web_ai_research_results.xlsx",
         sheet_name="Web Research Results",
     )
-    main_df = pd.read_excel(
+    main_df = load_frame(
         "/Users/sam/workspace/app-des/app_directory_with_ai_data.xlsx"
     )
 
-    # Create mapping from research results
-    research_mapping = {}
-    for _, row in research_df.iterrows():
-        app_name = row["App Name"]
-        research_mapping[app_name] = {
-            "lxAiPotential": row["AI Potential"],
-            "lxAiRisk": row["AI Risk"],
-            "lxAiUsage": row["AI Usage"],
-            "lxAiType": row["AI Type"],
-            "lxAiTaxonomyDescription": row["AI Taxonomy Description"],
-        }
-
-    # Update main DataFrame
-    updated_count = 0
-    for index, row in main_df.iterrows():
-        app_name = row["Name"]
-        if app_name in research_mapping:
-            main_df.at[index, "lxAiPotential"] = research_mapping[app_name][
-                "lxAiPotential"
-            ]
-            main_df.at[index, "lxAiRisk"] = research_mapping[app_name]["lxAiRisk"]
-            main_df.at[index, "lxAiUsage"] = research_mapping[app_name]["lxAiUsage"]
-            main_df.at[index, "lxAiType"] = research_mapping[app_name]["lxAiType"]
-            main_df.at[index, "lxAiTaxonomyDescription"] = research_mapping[app_name][
-                "lxAiTaxonomyDescription"
-            ]
-            updated_count += 1
+    # Join research results onto the directory by app name
+    main_df, merge_report = merge_research(main_df, research_df)
+    updated_count = merge_report.updated
+    merge_report.print_warnings()
 
     # Save updated file
     filename = "/Users/sam/workspace/app-des/app_directory_final_web_ai_research.xlsx"
@@ -548,6 +530,8 @@ def update_main_excel_with_web_research():
         ai_enabled = main_df[main_df["lxAiUsage"] == "aiEnabled"]
         ai_enabled.to_excel(writer, sheet_name="AI-Enabled Apps", index=False)
 
+    save_frame(main_df, filename)
+
     print(f"✅ Updated {updated_count} apps with web research data")
     print(f"💾 Final file saved as: {filename}")
 